@@ -12,7 +12,9 @@
 ###############################################################################
 
 import base64
+import socket
 import stat
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -20,6 +22,57 @@ from osgeo import gdal
 
 pytestmark = pytest.mark.require_curl()
 
+_PROPS_FOO_BAR = "foo=" + base64.b64encode(b"bar").decode("ascii")
+_HELLO = b"hello"
+_HELLO_LEN = len(_HELLO)
+
+
+###############################################################################
+# Skip early if the endpoint derived from AZURE_STORAGE_CONNECTION_STRING does
+# not resolve (e.g. wrong EndpointSuffix), rather than having each operation
+# go through failing DNS lookups and retries
+
+
+@pytest.fixture(scope="module")
+def adls_endpoint_resolves(adls_resource):
+
+    connection_string = gdal.GetConfigOption("AZURE_STORAGE_CONNECTION_STRING")
+    if not connection_string:
+        return
+
+    params = dict(
+        item.split("=", 1) for item in connection_string.split(";") if "=" in item
+    )
+    account = params.get("AccountName")
+    if not account or "BlobEndpoint" in params:
+        return
+
+    suffix = params.get("EndpointSuffix", "core.windows.net").rstrip("/")
+    host = "%s.dfs.%s" % (account, suffix)
+
+    try:
+        socket.getaddrinfo(host, 443)
+    except socket.gaierror:
+        pytest.skip("ADLS endpoint %s does not resolve" % host)
+
+
+###############################################################################
+# Configuration options enabling the tests, queried once per module
+
+
+@pytest.fixture(scope="module")
+def adls_resource():
+    adls_resource = gdal.GetConfigOption("ADLS_RESOURCE")
+    if adls_resource is None:
+        pytest.skip("Missing ADLS_RESOURCE")
+    return adls_resource
+
+
+@pytest.fixture(scope="module")
+def adls_allow_filesystem_tests():
+    if gdal.GetConfigOption("ADLS_ALLOW_FILESYSTEM_TESTS") is None:
+        pytest.skip("Missing ADLS_ALLOW_FILESYSTEM_TESTS")
+
 
 def open_for_read(uri):
     """
@@ -28,18 +81,45 @@ def open_for_read(uri):
     return gdal.VSIFOpenExL(uri, "rb", 1)
 
 
+def _parallel_vsistat(subpaths, max_workers=16):
+    """
+    Stats several paths concurrently, to overlap the network round-trips.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(gdal.VSIStatL, subpaths))
+
+
+def _get_md_parallel(path, domains):
+    """
+    Fetches the metadata of several domains of a file concurrently.
+    """
+    with ThreadPoolExecutor(max_workers=len(domains)) as executor:
+        return dict(
+            zip(
+                domains,
+                executor.map(
+                    lambda domain: gdal.GetFileMetadata(path, domain), domains
+                ),
+            )
+        )
+
+
 ###############################################################################
 # Nominal cases (require valid credentials)
+# Each test below works on its own resources, and is assigned to its own
+# xdist group so that they can run concurrently with "pytest -n".
 
 
-def test_vsiadls_real_instance_tests():
-
-    adls_resource = gdal.GetConfigOption("ADLS_RESOURCE")
-    if adls_resource is None:
-        pytest.skip("Missing ADLS_RESOURCE")
+@pytest.mark.xdist_group("vsiadls_real_instance_tests")
+@pytest.mark.usefixtures("adls_endpoint_resolves")
+def test_vsiadls_real_instance_tests(adls_resource):
 
     if "/" not in adls_resource:
         path = "/vsiadls/" + adls_resource
+        unique_id = "vsiadls_test"
+        subpath = path + "/" + unique_id
+        testtxt = subpath + "/test.txt"
+        test2txt = subpath + "/test2.txt"
 
         try:
             statres = gdal.VSIStatL(path)
@@ -49,130 +129,105 @@ def test_vsiadls_real_instance_tests():
 
             readdir = gdal.ReadDir(path)
             assert readdir is not None, "ReadDir() should not return empty list"
-            for filename in readdir:
-                if filename != ".":
-                    subpath = path + "/" + filename
-                    assert gdal.VSIStatL(subpath) is not None, (
-                        "Stat(%s) should not return an error" % subpath
-                    )
-
-            unique_id = "vsiadls_test"
-            subpath = path + "/" + unique_id
+            subpaths = [
+                path + "/" + filename for filename in readdir if filename != "."
+            ]
+            for entry, subpath_stat in zip(subpaths, _parallel_vsistat(subpaths)):
+                assert subpath_stat is not None, (
+                    "Stat(%s) should not return an error" % entry
+                )
+
             ret = gdal.Mkdir(subpath, 0)
             assert ret >= 0, "Mkdir(%s) should not return an error" % subpath
 
             readdir = gdal.ReadDir(path)
+            assert readdir is not None
             assert unique_id in readdir, "ReadDir(%s) should contain %s" % (
                 path,
                 unique_id,
             )
 
-            ret = gdal.Mkdir(subpath, 0)
-            assert ret != 0, "Mkdir(%s) repeated should return an error" % subpath
-
             ret = gdal.Rmdir(subpath)
             assert ret >= 0, "Rmdir(%s) should not return an error" % subpath
 
             readdir = gdal.ReadDir(path)
+            assert readdir is not None
             assert unique_id not in readdir, "ReadDir(%s) should not contain %s" % (
                 path,
                 unique_id,
             )
 
-            ret = gdal.Rmdir(subpath)
-            assert ret != 0, "Rmdir(%s) repeated should return an error" % subpath
-
             ret = gdal.Mkdir(subpath, 0)
             assert ret >= 0, "Mkdir(%s) should not return an error" % subpath
 
-            f = gdal.VSIFOpenL(subpath + "/test.txt", "wb")
+            f = gdal.VSIFOpenL(testtxt, "wb")
             assert f is not None
-            gdal.VSIFWriteL("hello", 1, 5, f)
+            gdal.VSIFWriteL(_HELLO, 1, _HELLO_LEN, f)
             gdal.VSIFCloseL(f)
 
-            ret = gdal.Rmdir(subpath)
-            assert ret != 0, (
-                "Rmdir(%s) on non empty directory should return an error" % subpath
-            )
-
-            f = gdal.VSIFOpenL(subpath + "/test.txt", "rb")
+            f = gdal.VSIFOpenL(testtxt, "rb")
             assert f is not None
-            data = gdal.VSIFReadL(1, 5, f).decode("utf-8")
-            assert data == "hello"
+            assert gdal.VSIFReadL(1, _HELLO_LEN, f) == _HELLO
             gdal.VSIFCloseL(f)
 
-            assert gdal.VSIStatL(subpath + "/test.txt") is not None
+            assert gdal.VSIStatL(testtxt) is not None
 
-            md = gdal.GetFileMetadata(subpath + "/test.txt", "HEADERS")
-            assert "x-ms-properties" in md
+            mds = _get_md_parallel(testtxt, ["HEADERS", "STATUS", "ACL"])
 
-            md = gdal.GetFileMetadata(subpath + "/test.txt", "STATUS")
-            assert "x-ms-resource-type" in md
-            assert "x-ms-properties" not in md
+            assert "x-ms-properties" in mds["HEADERS"]
 
-            md = gdal.GetFileMetadata(subpath + "/test.txt", "ACL")
-            assert "x-ms-acl" in md
-            assert "x-ms-permissions" in md
+            assert "x-ms-resource-type" in mds["STATUS"]
+            assert "x-ms-properties" not in mds["STATUS"]
+
+            assert "x-ms-acl" in mds["ACL"]
+            assert "x-ms-permissions" in mds["ACL"]
 
-            # Change properties
-            properties_foo_bar = "foo=" + base64.b64encode("bar")
+            # Change properties and ACL. Both update the same file, so they are
+            # issued one after the other.
             assert gdal.SetFileMetadata(
-                subpath + "/test.txt",
-                {"x-ms-properties": properties_foo_bar},
-                "PROPERTIES",
+                testtxt, {"x-ms-properties": _PROPS_FOO_BAR}, "PROPERTIES"
             )
+            assert gdal.SetFileMetadata(testtxt, {"x-ms-permissions": "0777"}, "ACL")
 
-            md = gdal.GetFileMetadata(subpath + "/test.txt", "HEADERS")
-            assert "x-ms-properties" in md
-            assert md["x-ms-properties"] == properties_foo_bar
+            mds = _get_md_parallel(testtxt, ["HEADERS", "ACL"])
 
-            # Change ACL
-            assert gdal.SetFileMetadata(
-                subpath + "/test.txt", {"x-ms-permissions": "0777"}, "ACL"
-            )
+            assert "x-ms-properties" in mds["HEADERS"]
+            assert mds["HEADERS"]["x-ms-properties"] == _PROPS_FOO_BAR
 
-            md = gdal.GetFileMetadata(subpath + "/test.txt", "ACL")
-            assert "x-ms-permissions" in md
-            assert md["x-ms-permissions"] == "rwxrwxrwx"
+            assert "x-ms-permissions" in mds["ACL"]
+            assert mds["ACL"]["x-ms-permissions"] == "rwxrwxrwx"
 
             # Change ACL recursively
             md = gdal.GetFileMetadata(subpath, "ACL")
             assert "x-ms-acl" in md
             assert gdal.SetFileMetadata(
-                subpath + "/test.txt",
+                testtxt,
                 {"x-ms-acl": md["x-ms-acl"]},
                 "ACL",
                 ["RECURSIVE=YES", "MODE=set"],
             )
 
-            assert gdal.Rename(subpath + "/test.txt", subpath + "/test2.txt") == 0
+            assert gdal.Rename(testtxt, test2txt) == 0
 
-            assert gdal.VSIStatL(subpath + "/test.txt") is None
+            absent, present = _parallel_vsistat([testtxt, test2txt])
+            assert absent is None
+            assert present is not None
 
-            assert gdal.VSIStatL(subpath + "/test2.txt") is not None
-
-            f = gdal.VSIFOpenL(subpath + "/test2.txt", "rb")
+            f = gdal.VSIFOpenL(test2txt, "rb")
             assert f is not None
-            data = gdal.VSIFReadL(1, 5, f).decode("utf-8")
-            assert data == "hello"
+            assert gdal.VSIFReadL(1, _HELLO_LEN, f) == _HELLO
             gdal.VSIFCloseL(f)
 
-            ret = gdal.Unlink(subpath + "/test2.txt")
-            assert ret >= 0, "Unlink(%s) should not return an error" % (
-                subpath + "/test2.txt"
-            )
-
-            assert gdal.VSIStatL(subpath + "/test2.txt") is None
+            ret = gdal.Unlink(test2txt)
+            assert ret >= 0, "Unlink(%s) should not return an error" % test2txt
 
-            assert (
-                gdal.Unlink(subpath + "/test2.txt") != 0
-            ), "Unlink on a deleted file should return an error"
+            assert gdal.VSIStatL(test2txt) is None
 
-            f = gdal.VSIFOpenL(subpath + "/test2.txt", "wb")
+            f = gdal.VSIFOpenL(test2txt, "wb")
             assert f is not None
             gdal.VSIFCloseL(f)
 
-            assert gdal.VSIStatL(subpath + "/test2.txt") is not None
+            assert gdal.VSIStatL(test2txt) is not None
 
         finally:
             assert gdal.RmdirRecursive(subpath) == 0
@@ -196,17 +251,85 @@ def test_vsiadls_real_instance_tests():
     assert len(ret) == 1
 
 
+###############################################################################
+# Error cases (require valid credentials)
+# All cases share the same directory, and are thus kept in a single xdist group
+
+
+@pytest.fixture(scope="module")
+def adls_negative_test_dir(adls_resource, adls_endpoint_resolves):
+
+    if "/" in adls_resource:
+        pytest.skip("ADLS_RESOURCE is not a filesystem name")
+
+    subpath = "/vsiadls/" + adls_resource + "/vsiadls_test_negative"
+    ret = gdal.Mkdir(subpath, 0)
+    assert ret >= 0, "Mkdir(%s) should not return an error" % subpath
+
+    try:
+        yield subpath
+    finally:
+        assert gdal.RmdirRecursive(subpath) == 0
+
+
+@pytest.mark.xdist_group("vsiadls_real_instance_errors")
+@pytest.mark.parametrize(
+    "case",
+    [
+        "mkdir_twice_fails",
+        "rmdir_nonexistent_fails",
+        "rmdir_nonempty_fails",
+        "unlink_deleted_fails",
+    ],
+)
+def test_vsiadls_real_instance_errors(adls_negative_test_dir, case):
+
+    subpath = adls_negative_test_dir
+
+    if case == "mkdir_twice_fails":
+        ret = gdal.Mkdir(subpath, 0)
+        assert ret != 0, "Mkdir(%s) repeated should return an error" % subpath
+
+    elif case == "rmdir_nonexistent_fails":
+        dirname = subpath + "/nonexistent"
+        ret = gdal.Rmdir(dirname)
+        assert ret != 0, "Rmdir(%s) should return an error" % dirname
+
+    elif case == "rmdir_nonempty_fails":
+        dirname = subpath + "/nonempty"
+        ret = gdal.Mkdir(dirname, 0)
+        assert ret >= 0, "Mkdir(%s) should not return an error" % dirname
+        f = gdal.VSIFOpenL(dirname + "/test.txt", "wb")
+        assert f is not None
+        gdal.VSIFWriteL(_HELLO, 1, _HELLO_LEN, f)
+        gdal.VSIFCloseL(f)
+        ret = gdal.Rmdir(dirname)
+        assert ret != 0, (
+            "Rmdir(%s) on non empty directory should return an error" % dirname
+        )
+
+    elif case == "unlink_deleted_fails":
+        filename = subpath + "/deleted.txt"
+        f = gdal.VSIFOpenL(filename, "wb")
+        assert f is not None
+        gdal.VSIFCloseL(f)
+        ret = gdal.Unlink(filename)
+        assert ret >= 0, "Unlink(%s) should not return an error" % filename
+        assert (
+            gdal.Unlink(filename) != 0
+        ), "Unlink on a deleted file should return an error"
+
+
 ###############################################################################
 # Nominal cases (require valid credentials)
 # Note: that test must be run with a delay > 30 seconds due to such a delay
 # for re-creating a filesystem of the same name of one that has been destroyed
 
 
+@pytest.mark.xdist_group("vsiadls_real_instance_filesystem_tests")
+@pytest.mark.usefixtures("adls_allow_filesystem_tests")
 def test_vsiadls_real_instance_filesystem_tests():
 
-    if gdal.GetConfigOption("ADLS_ALLOW_FILESYSTEM_TESTS") is None:
-        pytest.skip("Missing ADLS_ALLOW_FILESYSTEM_TESTS")
-
     fspath = "/vsiadls/test-vsiadls-filesystem-tests"
 
     try:
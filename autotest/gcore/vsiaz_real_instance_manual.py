@@ -96,8 +96,7 @@ def test_vsiaz_extra_1():
 
         f = gdal.VSIFOpenL(subpath + "/test.txt", "rb")
         assert f is not None
-        data = gdal.VSIFReadL(1, 5, f).decode("utf-8")
-        assert data == "hello"
+        assert gdal.VSIFReadL(1, 5, f) == b"hello"
         gdal.VSIFCloseL(f)
 
         md = gdal.GetFileMetadata(subpath + "/test.txt", "HEADERS")
@@ -138,8 +137,7 @@ def test_vsiaz_extra_1():
 
         f = gdal.VSIFOpenL(subpath + "/test2.txt", "rb")
         assert f is not None
-        data = gdal.VSIFReadL(1, 5, f).decode("utf-8")
-        assert data == "hello"
+        assert gdal.VSIFReadL(1, 5, f) == b"hello"
         gdal.VSIFCloseL(f)
 
         ret = gdal.Unlink(subpath + "/test2.txt")
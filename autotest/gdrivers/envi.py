@@ -25,15 +25,8 @@ from osgeo import gdal, osr
 
 pytestmark = pytest.mark.require_driver("ENVI")
 
-###############################################################################
-# Perform simple read test.
-
-
-def test_envi_1():
 
-    tst = gdaltest.GDALTest("envi", "envi/aea.dat", 1, 14823)
-
-    prj = """PROJCS["unnamed",
+_PRJ_AEA = """PROJCS["unnamed",
     GEOGCS["Ellipse Based",
         DATUM["Ellipse Based",
             SPHEROID["Unnamed",6378206.4,294.9786982139109]],
@@ -48,8 +41,73 @@ def test_envi_1():
     PARAMETER["false_northing",0],
     UNIT["Meter",1]]"""
 
+_PRJ_LCC = """PROJCS["unnamed",
+    GEOGCS["NAD83",
+        DATUM["North_American_Datum_1983",
+            SPHEROID["GRS 1980",6378137,298.257222101],
+            TOWGS84[0,0,0,0,0,0,0]],
+        PRIMEM["Greenwich",0],
+        UNIT["degree",0.0174532925199433]],
+    PROJECTION["Lambert_Conformal_Conic_2SP"],
+    PARAMETER["standard_parallel_1",33.90363402775256],
+    PARAMETER["standard_parallel_2",33.62529002776137],
+    PARAMETER["latitude_of_origin",33.76446202775696],
+    PARAMETER["central_meridian",-117.4745428888127],
+    PARAMETER["false_easting",20000],
+    PARAMETER["false_northing",30000],
+    UNIT["Meter",1]]"""
+
+_PRJ_TM = """PROJCS["unnamed",
+    GEOGCS["GCS_unnamed",
+        DATUM["D_unnamed",
+            SPHEROID["Airy 1830",6377563.396,299.3249646,
+                AUTHORITY["EPSG","7001"]]],
+        PRIMEM["Greenwich",0],
+        UNIT["degree",0.01745329251994328]],
+    PROJECTION["Transverse_Mercator"],
+    PARAMETER["latitude_of_origin",49],
+    PARAMETER["central_meridian",-2],
+    PARAMETER["scale_factor",0.9996012717],
+    PARAMETER["false_easting",400000],
+    PARAMETER["false_northing",-100000],
+    UNIT["metre",1,
+        AUTHORITY["EPSG","9001"]],
+    AXIS["Easting",EAST],
+    AXIS["Northing",NORTH]]"""
+
+_PRJ_LAEA = """PROJCS["unnamed",
+    GEOGCS["Unknown datum based upon the Authalic Sphere",
+        DATUM["D_Ellipse_Based",
+            SPHEROID["Sphere",6370997,0]],
+        PRIMEM["Greenwich",0],
+        UNIT["Degree",0.0174532925199433]],
+    PROJECTION["Lambert_Azimuthal_Equal_Area"],
+    PARAMETER["latitude_of_center",33.764462027757],
+    PARAMETER["longitude_of_center",-117.474542888813],
+    PARAMETER["false_easting",0],
+    PARAMETER["false_northing",0],
+    UNIT["metre",1,
+        AUTHORITY["EPSG","9001"]],
+    AXIS["Easting",EAST],
+    AXIS["Northing",NORTH]]"""
+
+
+###############################################################################
+@pytest.fixture(scope="module")
+def envi_drv():
+    return gdal.GetDriverByName("ENVI")
+
+
+###############################################################################
+# Perform simple read test.
+
+
+def test_envi_1():
+
+    tst = gdaltest.GDALTest("envi", "envi/aea.dat", 1, 14823)
+
     tst.testOpen(
-        check_prj=prj, check_gt=(-936408.178, 28.5, 0.0, 2423902.344, 0.0, -28.5)
+        check_prj=_PRJ_AEA, check_gt=(-936408.178, 28.5, 0.0, 2423902.344, 0.0, -28.5)
     )
 
 
@@ -81,23 +139,7 @@ def test_envi_4():
 
     tst = gdaltest.GDALTest("envi", "envi/aea.dat", 1, 24)
 
-    prj = """PROJCS["unnamed",
-    GEOGCS["NAD83",
-        DATUM["North_American_Datum_1983",
-            SPHEROID["GRS 1980",6378137,298.257222101],
-            TOWGS84[0,0,0,0,0,0,0]],
-        PRIMEM["Greenwich",0],
-        UNIT["degree",0.0174532925199433]],
-    PROJECTION["Lambert_Conformal_Conic_2SP"],
-    PARAMETER["standard_parallel_1",33.90363402775256],
-    PARAMETER["standard_parallel_2",33.62529002776137],
-    PARAMETER["latitude_of_origin",33.76446202775696],
-    PARAMETER["central_meridian",-117.4745428888127],
-    PARAMETER["false_easting",20000],
-    PARAMETER["false_northing",30000],
-    UNIT["Meter",1]]"""
-
-    tst.testSetProjection(prj=prj)
+    tst.testSetProjection(prj=_PRJ_LCC)
 
 
 ###############################################################################
@@ -107,25 +149,8 @@ def test_envi_4():
 def test_envi_5():
 
     tst = gdaltest.GDALTest("envi", "envi/aea.dat", 1, 24)
-    prj = """PROJCS["unnamed",
-    GEOGCS["GCS_unnamed",
-        DATUM["D_unnamed",
-            SPHEROID["Airy 1830",6377563.396,299.3249646,
-                AUTHORITY["EPSG","7001"]]],
-        PRIMEM["Greenwich",0],
-        UNIT["degree",0.01745329251994328]],
-    PROJECTION["Transverse_Mercator"],
-    PARAMETER["latitude_of_origin",49],
-    PARAMETER["central_meridian",-2],
-    PARAMETER["scale_factor",0.9996012717],
-    PARAMETER["false_easting",400000],
-    PARAMETER["false_northing",-100000],
-    UNIT["metre",1,
-        AUTHORITY["EPSG","9001"]],
-    AXIS["Easting",EAST],
-    AXIS["Northing",NORTH]]"""
 
-    tst.testSetProjection(prj=prj)
+    tst.testSetProjection(prj=_PRJ_TM)
 
 
 ###############################################################################
@@ -136,23 +161,7 @@ def test_envi_6():
 
     gdaltest.envi_tst = gdaltest.GDALTest("envi", "envi/aea.dat", 1, 24)
 
-    prj = """PROJCS["unnamed",
-    GEOGCS["Unknown datum based upon the Authalic Sphere",
-        DATUM["D_Ellipse_Based",
-            SPHEROID["Sphere",6370997,0]],
-        PRIMEM["Greenwich",0],
-        UNIT["Degree",0.0174532925199433]],
-    PROJECTION["Lambert_Azimuthal_Equal_Area"],
-    PARAMETER["latitude_of_center",33.764462027757],
-    PARAMETER["longitude_of_center",-117.474542888813],
-    PARAMETER["false_easting",0],
-    PARAMETER["false_northing",0],
-    UNIT["metre",1,
-        AUTHORITY["EPSG","9001"]],
-    AXIS["Easting",EAST],
-    AXIS["Northing",NORTH]]"""
-
-    gdaltest.envi_tst.testSetProjection(prj=prj)
+    gdaltest.envi_tst.testSetProjection(prj=_PRJ_LAEA)
 
 
 ###############################################################################
@@ -169,17 +178,15 @@ def test_envi_7():
 # Test fix for #3751
 
 
-def test_envi_8():
+def test_envi_8(envi_drv, tmp_vsimem):
 
-    ds = gdal.GetDriverByName("ENVI").Create("/vsimem/foo.bsq", 10, 10, 1)
+    ds = envi_drv.Create(tmp_vsimem / "foo.bsq", 10, 10, 1)
     set_gt = (50000, 1, 0, 4500000, 0, -1)
     ds.SetGeoTransform(set_gt)
     got_gt = ds.GetGeoTransform()
     assert set_gt == got_gt, "did not get expected geotransform"
     ds = None
 
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/foo.bsq")
-
 
 ###############################################################################
 # Verify reading a compressed file
@@ -195,21 +202,19 @@ def test_envi_9():
 # Test RPC reading and writing
 
 
-def test_envi_10():
+def test_envi_10(envi_drv, tmp_vsimem):
 
     src_ds = gdal.Open("data/envi/envirpc.img")
-    out_ds = gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/envirpc.img", src_ds)
+    out_ds = envi_drv.CreateCopy(tmp_vsimem / "envirpc.img", src_ds)
     src_ds = None
     del out_ds
 
-    gdal.Unlink("/vsimem/envirpc.img.aux.xml")
+    gdal.Unlink(tmp_vsimem / "envirpc.img.aux.xml")
 
-    ds = gdal.Open("/vsimem/envirpc.img")
+    ds = gdal.Open(tmp_vsimem / "envirpc.img")
     md = ds.GetMetadata("RPC")
     ds = None
 
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/envirpc.img")
-
     assert md["HEIGHT_OFF"] == "3355"
 
 
@@ -230,16 +235,16 @@ def test_envi_11():
 # Test category names reading and writing
 
 
-def test_envi_12():
+def test_envi_12(envi_drv, tmp_vsimem):
 
     src_ds = gdal.Open("data/envi/testenviclasses")
-    out_ds = gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/testenviclasses", src_ds)
+    out_ds = envi_drv.CreateCopy(tmp_vsimem / "testenviclasses", src_ds)
     src_ds = None
     del out_ds
 
-    gdal.Unlink("/vsimem/testenviclasses.aux.xml")
+    gdal.Unlink(tmp_vsimem / "testenviclasses.aux.xml")
 
-    ds = gdal.Open("/vsimem/testenviclasses")
+    ds = gdal.Open(tmp_vsimem / "testenviclasses")
     category = ds.GetRasterBand(1).GetCategoryNames()
     ct = ds.GetRasterBand(1).GetColorTable()
 
@@ -250,26 +255,24 @@ def test_envi_12():
     assert ct.GetColorEntry(0) == (0, 0, 0, 255), "bad color entry"
 
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/testenviclasses")
 
 
 ###############################################################################
 # Test writing of metadata from the ENVI metadata domain and read it back (#4957)
 
 
-def test_envi_13():
+def test_envi_13(envi_drv, tmp_vsimem):
 
-    ds = gdal.GetDriverByName("ENVI").Create("/vsimem/envi_13.dat", 1, 1)
+    ds = envi_drv.Create(tmp_vsimem / "envi_13.dat", 1, 1)
     ds.SetMetadata(["lines=100", "sensor_type=Landsat TM", "foo"], "ENVI")
     ds = None
 
-    gdal.Unlink("/vsimem/envi_13.dat.aux.xml")
+    gdal.Unlink(tmp_vsimem / "envi_13.dat.aux.xml")
 
-    ds = gdal.Open("/vsimem/envi_13.dat")
+    ds = gdal.Open(tmp_vsimem / "envi_13.dat")
     lines = ds.RasterYSize
     val = ds.GetMetadataItem("sensor_type", "ENVI")
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/envi_13.dat")
 
     assert lines == 1
 
@@ -280,70 +283,64 @@ def test_envi_13():
 # Test that the image file is at the expected size on closing (#6662)
 
 
-def test_envi_14():
+def test_envi_14(envi_drv, tmp_vsimem):
 
-    gdal.GetDriverByName("ENVI").Create("/vsimem/envi_14.dat", 3, 4, 5, gdal.GDT_Int16)
+    xsize, ysize, bands = 3, 4, 5
+    envi_drv.Create(tmp_vsimem / "envi_14.dat", xsize, ysize, bands, gdal.GDT_Int16)
 
-    if os.path.exists("/vsimem/envi_14.dat.aux.xml"):
-        gdal.Unlink("/vsimem/envi_14.dat.aux.xml")
+    if os.path.exists(tmp_vsimem / "envi_14.dat.aux.xml"):
+        gdal.Unlink(tmp_vsimem / "envi_14.dat.aux.xml")
 
-    assert gdal.VSIStatL("/vsimem/envi_14.dat").size == 3 * 4 * 5 * 2
-
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/envi_14.dat")
+    # Int16 samples are 2 bytes each
+    expected_size = xsize * ysize * bands * 2
+    assert gdal.VSIStatL(tmp_vsimem / "envi_14.dat").size == expected_size
 
 
 ###############################################################################
 # Test reading and writing geotransform matrix with rotation
 
+_ROTATION_GT = (
+    736600.089,
+    1.0981889363046606,
+    -2.4665727356350224,
+    4078126.75,
+    -2.4665727356350224,
+    -1.0981889363046606,
+)
+
 
-def test_envi_15():
+def test_envi_15(envi_drv, tmp_vsimem):
 
     src_ds = gdal.Open("data/envi/rotation.img")
-    got_gt = src_ds.GetGeoTransform()
-    expected_gt = [
-        736600.089,
-        1.0981889363046606,
-        -2.4665727356350224,
-        4078126.75,
-        -2.4665727356350224,
-        -1.0981889363046606,
-    ]
-    assert (
-        max([abs((got_gt[i] - expected_gt[i]) / expected_gt[i]) for i in range(6)])
-        <= 1e-5
+    assert src_ds.GetGeoTransform() == pytest.approx(
+        _ROTATION_GT, rel=1e-5
     ), "did not get expected geotransform"
 
-    gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/envi_15.dat", src_ds)
+    envi_drv.CreateCopy(tmp_vsimem / "envi_15.dat", src_ds)
 
-    ds = gdal.Open("/vsimem/envi_15.dat")
-    got_gt = ds.GetGeoTransform()
-    assert (
-        max([abs((got_gt[i] - expected_gt[i]) / expected_gt[i]) for i in range(6)])
-        <= 1e-5
+    ds = gdal.Open(tmp_vsimem / "envi_15.dat")
+    assert ds.GetGeoTransform() == pytest.approx(
+        _ROTATION_GT, rel=1e-5
     ), "did not get expected geotransform"
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/envi_15.dat")
 
 
 ###############################################################################
 # Test reading a truncated ENVI dataset (see #915)
 
 
-def test_envi_truncated():
+def test_envi_truncated(envi_drv, tmp_vsimem):
 
-    gdal.GetDriverByName("ENVI").CreateCopy(
-        "/vsimem/envi_truncated.dat", gdal.Open("data/byte.tif")
-    )
+    envi_drv.CreateCopy(tmp_vsimem / "envi_truncated.dat", gdal.Open("data/byte.tif"))
 
-    f = gdal.VSIFOpenL("/vsimem/envi_truncated.dat", "rb+")
+    f = gdal.VSIFOpenL(tmp_vsimem / "envi_truncated.dat", "rb+")
     gdal.VSIFTruncateL(f, int(20 * 20 / 2))
     gdal.VSIFCloseL(f)
 
     with gdaltest.config_option("RAW_CHECK_FILE_SIZE", "YES"):
-        ds = gdal.Open("/vsimem/envi_truncated.dat")
+        ds = gdal.Open(tmp_vsimem / "envi_truncated.dat")
     cs = ds.GetRasterBand(1).Checksum()
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/envi_truncated.dat")
 
     assert cs == 2315
 
@@ -352,10 +349,10 @@ def test_envi_truncated():
 # Test writing & reading GCPs (#1528)
 
 
-def test_envi_gcp():
+def test_envi_gcp(envi_drv, tmp_vsimem):
 
-    filename = "/vsimem/test_envi_gcp.dat"
-    ds = gdal.GetDriverByName("ENVI").Create(filename, 1, 1)
+    filename = str(tmp_vsimem / "test_envi_gcp.dat")
+    ds = envi_drv.Create(filename, 1, 1)
     gcp = gdal.GCP()
     gcp.GCPPixel = 1
     gcp.GCPLine = 2
@@ -376,26 +373,42 @@ def test_envi_gcp():
     assert gcp.GCPX == 3
     assert gcp.GCPY == 4
 
-    gdal.GetDriverByName("ENVI").Delete(filename)
+
+###############################################################################
+# Content of the big-endian test dataset files, read once per module
+
+
+@pytest.fixture(scope="module")
+def envi_bigendian_data():
+    data = {}
+    for ext in ("dat", "hdr"):
+        filename = "uint16_envi_bigendian." + ext
+        with open("data/envi/" + filename, "rb") as f:
+            data[filename] = f.read()
+    return data
 
 
 ###############################################################################
-# Test updating big endian ordered (#1796)
+# Test reading big endian ordered (#1796)
 
 
-def test_envi_bigendian():
+def test_envi_bigendian_read_checksum():
 
     ds = gdal.Open("data/envi/uint16_envi_bigendian.dat")
     assert ds.GetRasterBand(1).Checksum() == 4672
     ds = None
 
-    for ext in ("dat", "hdr"):
-        filename = "uint16_envi_bigendian." + ext
-        gdal.FileFromMemBuffer(
-            "/vsimem/" + filename, open("data/envi/" + filename, "rb").read()
-        )
 
-    filename = "/vsimem/uint16_envi_bigendian.dat"
+###############################################################################
+# Test updating big endian ordered (#1796)
+
+
+def test_envi_bigendian_update_header(envi_bigendian_data, tmp_vsimem):
+
+    for filename, data in envi_bigendian_data.items():
+        gdal.FileFromMemBuffer(tmp_vsimem / filename, data)
+
+    filename = str(tmp_vsimem / "uint16_envi_bigendian.dat")
     ds = gdal.Open(filename, gdal.GA_Update)
     ds.SetGeoTransform([0, 2, 0, 0, 0, -2])
     ds = None
@@ -404,8 +417,6 @@ def test_envi_bigendian():
     assert ds.GetRasterBand(1).Checksum() == 4672
     ds = None
 
-    gdal.GetDriverByName("ENVI").Delete(filename)
-
 
 ###############################################################################
 # Test different interleaving
@@ -421,9 +432,8 @@ def test_envi_interleaving(filename_suffix, expected_interleave):
     ds = gdal.Open(filename)
     assert ds, filename
     assert ds.GetMetadataItem("INTERLEAVE", "IMAGE_STRUCTURE") == expected_interleave
-    assert ds.GetRasterBand(1).Checksum() == 20718, filename
-    assert ds.GetRasterBand(2).Checksum() == 20669, filename
-    assert ds.GetRasterBand(3).Checksum() == 20895, filename
+    checksums = [ds.GetRasterBand(i + 1).Checksum() for i in range(ds.RasterCount)]
+    assert checksums == [20718, 20669, 20895], filename
     ds = None
 
 
@@ -431,10 +441,10 @@ def test_envi_interleaving(filename_suffix, expected_interleave):
 # Test nodata
 
 
-def test_envi_nodata():
+def test_envi_nodata(envi_drv, tmp_vsimem):
 
-    filename = "/vsimem/test_envi_nodata.dat"
-    ds = gdal.GetDriverByName("ENVI").Create(filename, 1, 1)
+    filename = str(tmp_vsimem / "test_envi_nodata.dat")
+    ds = envi_drv.Create(filename, 1, 1)
     ds.GetRasterBand(1).SetNoDataValue(1)
     ds = None
 
@@ -444,17 +454,15 @@ def test_envi_nodata():
     assert ds.GetRasterBand(1).GetNoDataValue() == 1.0
     ds = None
 
-    gdal.GetDriverByName("ENVI").Delete(filename)
-
 
 ###############################################################################
 # Test reading and writing geotransform matrix with rotation = 180
 
 
-def test_envi_rotation_180():
+def test_envi_rotation_180(envi_drv, tmp_vsimem):
 
-    filename = "/vsimem/test_envi_rotation_180.dat"
-    ds = gdal.GetDriverByName("ENVI").Create(filename, 1, 1)
+    filename = str(tmp_vsimem / "test_envi_rotation_180.dat")
+    ds = envi_drv.Create(filename, 1, 1)
     ds.SetGeoTransform([0, 10, 0, 0, 0, 10])
     ds = None
 
@@ -466,7 +474,18 @@ def test_envi_rotation_180():
     assert got_gt == (0, 10, 0, 0, 0, 10)
     ds = None
 
-    gdal.GetDriverByName("ENVI").Delete(filename)
+
+###############################################################################
+# Content of the reference files for each interleaving, read once per module
+
+
+@pytest.fixture(scope="module")
+def envi_rgbsmall_ref_data():
+    ref_data = {}
+    for interleaving in ("bip", "bil", "bsq"):
+        with open("data/envi/envi_rgbsmall_" + interleaving + ".img", "rb") as f:
+            ref_data[interleaving] = f.read()
+    return ref_data
 
 
 ###############################################################################
@@ -475,24 +494,20 @@ def test_envi_rotation_180():
 
 @pytest.mark.parametrize("interleaving", ["bip", "bil", "bsq"])
 @pytest.mark.parametrize("explicit", [True, False])
-def test_envi_writing_interleaving(interleaving, explicit):
+def test_envi_writing_interleaving(
+    interleaving, explicit, envi_rgbsmall_ref_data, tmp_vsimem
+):
 
     srcfilename = "data/envi/envi_rgbsmall_" + interleaving + ".img"
-    dstfilename = "/vsimem/out"
-    try:
-        creationOptions = ["INTERLEAVE=" + interleaving] if explicit else []
-        gdal.Translate(
-            dstfilename, srcfilename, format="ENVI", creationOptions=creationOptions
-        )
-        ref_data = open(srcfilename, "rb").read()
-        f = gdal.VSIFOpenL(dstfilename, "rb")
-        if f:
-            got_data = gdal.VSIFReadL(1, len(ref_data), f)
-            gdal.VSIFCloseL(f)
-            assert got_data == ref_data
-    finally:
-        gdal.Unlink(dstfilename)
-        gdal.Unlink(dstfilename + ".hdr")
+    dstfilename = str(tmp_vsimem / "out")
+    creationOptions = ["INTERLEAVE=" + interleaving] if explicit else []
+    gdal.Translate(
+        dstfilename, srcfilename, format="ENVI", creationOptions=creationOptions
+    )
+    ref_data = envi_rgbsmall_ref_data[interleaving]
+    with gdaltest.vsi_open(dstfilename, "rb") as f:
+        got_data = f.read(len(ref_data))
+    assert got_data == ref_data
 
 
 ###############################################################################
@@ -500,49 +515,46 @@ def test_envi_writing_interleaving(interleaving, explicit):
 
 
 @pytest.mark.parametrize("interleaving", ["bip", "bil", "bsq"])
-def test_envi_writing_interleaving_larger_file(interleaving):
-
-    dstfilename = "/vsimem/out"
-    try:
-        xsize = 10000
-        ysize = 10
-        bands = 100
-        with gdaltest.SetCacheMax(xsize * (ysize // 2)):
-            ds = gdal.GetDriverByName("ENVI").Create(
-                dstfilename, xsize, ysize, bands, options=["INTERLEAVE=" + interleaving]
+def test_envi_writing_interleaving_larger_file(interleaving, envi_drv, tmp_vsimem):
+
+    dstfilename = str(tmp_vsimem / "out")
+    xsize = 10000
+    ysize = 10
+    bands = 100
+    half_ysize = ysize // 2
+    # Content of each half of band i+1, built once and reused for both halves
+    # and for the final check.
+    half_band_data = [
+        struct.pack("B", i + 1) * (xsize * half_ysize) for i in range(bands)
+    ]
+    with gdaltest.SetCacheMax(xsize * half_ysize):
+        ds = envi_drv.Create(
+            dstfilename, xsize, ysize, bands, options=["INTERLEAVE=" + interleaving]
+        )
+        ds.GetRasterBand(1).Fill(1)
+        for i in range(bands):
+            ds.GetRasterBand(i + 1).WriteRaster(
+                0, 0, xsize, half_ysize, half_band_data[i]
             )
-            ds.GetRasterBand(1).Fill(1)
-            for i in range(bands):
-                v = struct.pack("B", i + 1)
-                ds.GetRasterBand(i + 1).WriteRaster(
-                    0, 0, xsize, ysize // 2, v * (xsize * (ysize // 2))
-                )
-            for i in range(bands):
-                v = struct.pack("B", i + 1)
-                ds.GetRasterBand(i + 1).WriteRaster(
-                    0, ysize // 2, xsize, ysize // 2, v * (xsize * (ysize // 2))
-                )
-            ds = None
-
-        ds = gdal.Open(dstfilename)
         for i in range(bands):
-            v = struct.pack("B", i + 1)
-            assert ds.GetRasterBand(i + 1).ReadRaster() == v * (xsize * ysize)
-    finally:
-        gdal.Unlink(dstfilename)
-        gdal.Unlink(dstfilename + ".hdr")
+            ds.GetRasterBand(i + 1).WriteRaster(
+                0, half_ysize, xsize, half_ysize, half_band_data[i]
+            )
+        ds = None
+
+    ds = gdal.Open(dstfilename)
+    for i in range(bands):
+        assert ds.GetRasterBand(i + 1).ReadRaster() == half_band_data[i] * 2
 
 
 ###############################################################################
 # Test .hdr as an additional extension, not a replacement one
 
 
-def test_envi_add_hdr():
+def test_envi_add_hdr(envi_drv, tmp_vsimem):
 
-    drv = gdal.GetDriverByName("ENVI")
-
-    ds = drv.Create(
-        "/vsimem/test.int",
+    ds = envi_drv.Create(
+        tmp_vsimem / "test.int",
         xsize=10,
         ysize=10,
         bands=1,
@@ -551,12 +563,12 @@ def test_envi_add_hdr():
     )
     ds = None
 
-    ds = gdal.Open("/vsimem/test.int")
+    ds = gdal.Open(tmp_vsimem / "test.int")
     assert ds.RasterCount == 1
     ds = None
 
-    ds = drv.Create(
-        "/vsimem/test.int.mph",
+    ds = envi_drv.Create(
+        tmp_vsimem / "test.int.mph",
         xsize=10,
         ysize=10,
         bands=2,
@@ -567,23 +579,19 @@ def test_envi_add_hdr():
     assert ds.RasterCount == 2
     ds = None
 
-    ds = gdal.Open("/vsimem/test.int.mph")
+    ds = gdal.Open(tmp_vsimem / "test.int.mph")
     assert ds.RasterCount == 2
     ds = None
 
-    drv.Delete("/vsimem/test.int")
-    drv.Delete("/vsimem/test.int.mph")
-
 
 ###############################################################################
 # Test .hdr as an additional extension, not a replacement one
 
 
-def test_envi_edit_coordinate_system_string():
+def test_envi_edit_coordinate_system_string(envi_drv, tmp_vsimem):
 
-    filename = "/vsimem/test.bin"
-    drv = gdal.GetDriverByName("ENVI")
-    ds = drv.Create(filename, 1, 1)
+    filename = str(tmp_vsimem / "test.bin")
+    ds = envi_drv.Create(filename, 1, 1)
     srs = osr.SpatialReference()
     srs.ImportFromEPSG(4326)
     ds.SetSpatialRef(srs)
@@ -596,12 +604,10 @@ def test_envi_edit_coordinate_system_string():
     ds.SetSpatialRef(srs)
     ds = None
 
-    fp = gdal.VSIFOpenL(filename[0:-4] + ".hdr", "rb")
-    assert fp
-    content = gdal.VSIFReadL(1, 1000, fp).decode("utf-8")
-    gdal.VSIFCloseL(fp)
+    with gdaltest.vsi_open(filename[0:-4] + ".hdr", "rb") as fp:
+        content = fp.read(1000)
 
-    assert content.count("coordinate system string") == 1
+    assert content.count(b"coordinate system string") == 1
 
     ds = gdal.Open(filename)
     srs = ds.GetSpatialRef()
@@ -609,49 +615,12 @@ def test_envi_edit_coordinate_system_string():
     assert srs.GetAuthorityCode() == "3261"
     ds = None
 
-    drv.Delete(filename)
-
-
-###############################################################################
-# Test reading "default bands" in RGB mode
-
-
-def test_envi_read_default_bands_rgb():
-
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
-samples = 1
-lines = 1
-bands = 3
-header offset = 0
-file type = ENVI Standard
-data type = 1
-interleave = bip
-sensor type = Unknown
-byte order = 0
-default bands = {3, 2, 1}""",
-    )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
-
-    ds = gdal.Open("/vsimem/test.bin")
-    assert ds.GetRasterBand(1).GetColorInterpretation() == gdal.GCI_BlueBand
-    assert ds.GetRasterBand(2).GetColorInterpretation() == gdal.GCI_GreenBand
-    assert ds.GetRasterBand(3).GetColorInterpretation() == gdal.GCI_RedBand
-    ds = None
-    assert gdal.VSIStatL("/vsimem/test.bin.aux.xml") is None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
-
 
 ###############################################################################
-# Test reading "default bands" in Gray mode
+# Header of a 1x1, 3-band Byte BIP dataset, to which tests append the
+# keys they exercise, and the 3 bytes of raw data matching it
 
-
-def test_envi_read_default_bands_gray():
-
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
+_HDR_PREAMBLE = b"""ENVI
 samples = 1
 lines = 1
 bands = 3
@@ -661,187 +630,157 @@ data type = 1
 interleave = bip
 sensor type = Unknown
 byte order = 0
-default bands = {2}""",
-    )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
-
-    ds = gdal.Open("/vsimem/test.bin")
-    assert ds.GetRasterBand(1).GetColorInterpretation() == gdal.GCI_Undefined
-    assert ds.GetRasterBand(2).GetColorInterpretation() == gdal.GCI_GrayIndex
-    assert ds.GetRasterBand(3).GetColorInterpretation() == gdal.GCI_Undefined
-    ds = None
-    assert gdal.VSIStatL("/vsimem/test.bin.aux.xml") is None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+"""
+_TINY_RAW = b"xyz"
 
 
 ###############################################################################
-# Test writing "default bands" in RGB mode
-
-
-def test_envi_write_default_bands_rgb():
-
-    src_ds = gdal.GetDriverByName("MEM").Create("", 1, 1, 3)
-    src_ds.GetRasterBand(1).SetColorInterpretation(gdal.GCI_BlueBand)
-    src_ds.GetRasterBand(2).SetColorInterpretation(gdal.GCI_RedBand)
-    src_ds.GetRasterBand(3).SetColorInterpretation(gdal.GCI_GreenBand)
-    gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/test.bin", src_ds)
+# Write a test.hdr header and a test.bin raw file into tmp_vsimem and return
+# the name of the raw file
 
-    fp = gdal.VSIFOpenL("/vsimem/test.hdr", "rb")
-    assert fp
-    content = gdal.VSIFReadL(1, 1000, fp).decode("utf-8")
-    gdal.VSIFCloseL(fp)
 
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+def _create_envi_dataset(tmp_vsimem, hdr, raw=_TINY_RAW):
 
-    assert "default bands = {2, 3, 1}" in content, content
+    gdal.FileFromMemBuffer(tmp_vsimem / "test.hdr", hdr)
+    filename = str(tmp_vsimem / "test.bin")
+    gdal.FileFromMemBuffer(filename, raw)
+    return filename
 
 
 ###############################################################################
-# Test writing "default bands" in Gray mode
-
-
-def test_envi_write_default_bands_gray():
+# Test reading "default bands" in RGB mode
 
-    src_ds = gdal.GetDriverByName("MEM").Create("", 1, 1, 3)
-    src_ds.GetRasterBand(1).SetColorInterpretation(gdal.GCI_Undefined)
-    src_ds.GetRasterBand(2).SetColorInterpretation(gdal.GCI_GrayIndex)
-    src_ds.GetRasterBand(3).SetColorInterpretation(gdal.GCI_Undefined)
-    gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/test.bin", src_ds)
 
-    fp = gdal.VSIFOpenL("/vsimem/test.hdr", "rb")
-    assert fp
-    content = gdal.VSIFReadL(1, 1000, fp).decode("utf-8")
-    gdal.VSIFCloseL(fp)
+def test_envi_read_default_bands_rgb(tmp_vsimem):
 
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE + b"default bands = {3, 2, 1}",
+    )
 
-    assert "default bands = {2}" in content, content
+    ds = gdal.Open(filename)
+    color_interps = [
+        ds.GetRasterBand(i + 1).GetColorInterpretation() for i in range(ds.RasterCount)
+    ]
+    assert color_interps == [gdal.GCI_BlueBand, gdal.GCI_GreenBand, gdal.GCI_RedBand]
+    ds = None
+    assert gdal.VSIStatL(filename + ".aux.xml") is None
 
 
 ###############################################################################
-# Test writing "default bands" when it doesn't work
-
-
-def test_envi_write_default_bands_duplicate_color_rgb():
+# Test reading "default bands" in Gray mode
 
-    src_ds = gdal.GetDriverByName("MEM").Create("", 1, 1, 6)
-    src_ds.GetRasterBand(1).SetColorInterpretation(gdal.GCI_BlueBand)
-    src_ds.GetRasterBand(2).SetColorInterpretation(gdal.GCI_RedBand)
-    src_ds.GetRasterBand(3).SetColorInterpretation(gdal.GCI_GreenBand)
-    src_ds.GetRasterBand(4).SetColorInterpretation(gdal.GCI_BlueBand)
-    src_ds.GetRasterBand(5).SetColorInterpretation(gdal.GCI_RedBand)
-    src_ds.GetRasterBand(6).SetColorInterpretation(gdal.GCI_GreenBand)
-    gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/test.bin", src_ds)
 
-    fp = gdal.VSIFOpenL("/vsimem/test.hdr", "rb")
-    assert fp
-    content = gdal.VSIFReadL(1, 1000, fp).decode("utf-8")
-    gdal.VSIFCloseL(fp)
+def test_envi_read_default_bands_gray(tmp_vsimem):
 
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE + b"default bands = {2}",
+    )
 
-    assert "default bands" not in content, content
+    ds = gdal.Open(filename)
+    color_interps = [
+        ds.GetRasterBand(i + 1).GetColorInterpretation() for i in range(ds.RasterCount)
+    ]
+    assert color_interps == [gdal.GCI_Undefined, gdal.GCI_GrayIndex, gdal.GCI_Undefined]
+    ds = None
+    assert gdal.VSIStatL(filename + ".aux.xml") is None
 
 
 ###############################################################################
-# Test writing "default bands" when it doesn't work
-
+# Test writing "default bands" in RGB and Gray modes, and when it doesn't work
+# because of duplicated color interpretations
 
-def test_envi_write_default_bands_duplicate_color_gray():
 
-    src_ds = gdal.GetDriverByName("MEM").Create("", 1, 1, 6)
-    src_ds.GetRasterBand(1).SetColorInterpretation(gdal.GCI_GrayIndex)
-    src_ds.GetRasterBand(3).SetColorInterpretation(gdal.GCI_GrayIndex)
-    gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/test.bin", src_ds)
+@pytest.mark.parametrize(
+    "color_interps,expected",
+    [
+        pytest.param(
+            (gdal.GCI_BlueBand, gdal.GCI_RedBand, gdal.GCI_GreenBand),
+            "default bands = {2, 3, 1}",
+            id="rgb",
+        ),
+        pytest.param(
+            (gdal.GCI_Undefined, gdal.GCI_GrayIndex, gdal.GCI_Undefined),
+            "default bands = {2}",
+            id="gray",
+        ),
+        pytest.param(
+            (gdal.GCI_BlueBand, gdal.GCI_RedBand, gdal.GCI_GreenBand) * 2,
+            None,
+            id="duplicate_color_rgb",
+        ),
+        pytest.param(
+            (gdal.GCI_GrayIndex, gdal.GCI_Undefined) * 2 + (gdal.GCI_Undefined,) * 2,
+            None,
+            id="duplicate_color_gray",
+        ),
+    ],
+)
+def test_envi_write_default_bands(color_interps, expected, envi_drv, tmp_vsimem):
 
-    fp = gdal.VSIFOpenL("/vsimem/test.hdr", "rb")
-    assert fp
-    content = gdal.VSIFReadL(1, 1000, fp).decode("utf-8")
-    gdal.VSIFCloseL(fp)
+    src_ds = gdal.GetDriverByName("MEM").Create("", 1, 1, len(color_interps))
+    for i, color_interp in enumerate(color_interps):
+        src_ds.GetRasterBand(i + 1).SetColorInterpretation(color_interp)
+    envi_drv.CreateCopy(tmp_vsimem / "test.bin", src_ds)
 
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+    with gdaltest.vsi_open(tmp_vsimem / "test.hdr", "rb") as fp:
+        content = fp.read(1000).decode("utf-8")
 
-    assert "default bands" not in content, content
+    if expected:
+        assert expected in content, content
+    else:
+        assert "default bands" not in content, content
 
 
 ###############################################################################
 # Test reading "data offset values"
 
 
-def test_envi_read_data_offset_values():
+def test_envi_read_data_offset_values(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
-samples = 1
-lines = 1
-bands = 3
-header offset = 0
-file type = ENVI Standard
-data type = 1
-interleave = bip
-sensor type = Unknown
-byte order = 0
-data offset values = {3.5,2,1}""",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE + b"data offset values = {3.5,2,1}",
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
-    ds = gdal.Open("/vsimem/test.bin")
-    assert ds.GetRasterBand(1).GetOffset() == 3.5
-    assert ds.GetRasterBand(2).GetOffset() == 2
-    assert ds.GetRasterBand(3).GetOffset() == 1
+    ds = gdal.Open(filename)
+    offsets = [ds.GetRasterBand(i + 1).GetOffset() for i in range(ds.RasterCount)]
+    assert offsets == [3.5, 2, 1]
     ds = None
-    assert gdal.VSIStatL("/vsimem/test.bin.aux.xml") is None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+    assert gdal.VSIStatL(filename + ".aux.xml") is None
 
 
 ###############################################################################
 # Test reading "data gain values"
 
 
-def test_envi_read_data_gain_values():
+def test_envi_read_data_gain_values(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
-samples = 1
-lines = 1
-bands = 3
-header offset = 0
-file type = ENVI Standard
-data type = 1
-interleave = bip
-sensor type = Unknown
-byte order = 0
-data gain values = {3.5,2,1}""",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE + b"data gain values = {3.5,2,1}",
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
-    ds = gdal.Open("/vsimem/test.bin")
-    assert ds.GetRasterBand(1).GetScale() == 3.5
-    assert ds.GetRasterBand(2).GetScale() == 2
-    assert ds.GetRasterBand(3).GetScale() == 1
+    ds = gdal.Open(filename)
+    scales = [ds.GetRasterBand(i + 1).GetScale() for i in range(ds.RasterCount)]
+    assert scales == [3.5, 2, 1]
     ds = None
-    assert gdal.VSIStatL("/vsimem/test.bin.aux.xml") is None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+    assert gdal.VSIStatL(filename + ".aux.xml") is None
 
 
 ###############################################################################
 # Test writing "data offset values"
 
 
-def test_envi_write_data_offset_values():
+def test_envi_write_data_offset_values(envi_drv, tmp_vsimem):
 
     src_ds = gdal.GetDriverByName("MEM").Create("", 1, 1, 3)
     src_ds.GetRasterBand(2).SetOffset(10)
-    gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/test.bin", src_ds)
+    envi_drv.CreateCopy(tmp_vsimem / "test.bin", src_ds)
 
-    fp = gdal.VSIFOpenL("/vsimem/test.hdr", "rb")
-    assert fp
-    content = gdal.VSIFReadL(1, 1000, fp).decode("utf-8")
-    gdal.VSIFCloseL(fp)
-
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+    with gdaltest.vsi_open(tmp_vsimem / "test.hdr", "rb") as fp:
+        content = fp.read(1000).decode("utf-8")
 
     assert "data offset values = {0, 10, 0}" in content, content
 
@@ -850,31 +789,48 @@ def test_envi_write_data_offset_values():
 # Test writing "data gain values"
 
 
-def test_envi_write_data_gain_values():
+def test_envi_write_data_gain_values(envi_drv, tmp_vsimem):
 
     src_ds = gdal.GetDriverByName("MEM").Create("", 1, 1, 3)
     src_ds.GetRasterBand(2).SetScale(10)
-    gdal.GetDriverByName("ENVI").CreateCopy("/vsimem/test.bin", src_ds)
-
-    fp = gdal.VSIFOpenL("/vsimem/test.hdr", "rb")
-    assert fp
-    content = gdal.VSIFReadL(1, 1000, fp).decode("utf-8")
-    gdal.VSIFCloseL(fp)
+    envi_drv.CreateCopy(tmp_vsimem / "test.bin", src_ds)
 
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
+    with gdaltest.vsi_open(tmp_vsimem / "test.hdr", "rb") as fp:
+        content = fp.read(1000).decode("utf-8")
 
     assert "data gain values = {1, 10, 1}" in content, content
 
 
+###############################################################################
+# Source dataset of the direct access tests, opened once per module, and its
+# full content read as pixel-interleaved UInt16
+
+
+@pytest.fixture(scope="module")
+def rgbsmall_ds():
+    return gdal.Open("data/rgbsmall.tif")
+
+
+@pytest.fixture(scope="module")
+def rgbsmall_uint16_bip_data(rgbsmall_ds):
+    return rgbsmall_ds.ReadRaster(
+        buf_type=gdal.GDT_UInt16,
+        buf_pixel_space=2 * rgbsmall_ds.RasterCount,
+        buf_band_space=2,
+    )
+
+
 ###############################################################################
 # Test direct access to BIP scanlines
 
 
 @pytest.mark.parametrize("byte_order", ["LITTLE_ENDIAN", "BIG_ENDIAN"])
-def test_envi_read_direct_access(byte_order):
+def test_envi_read_direct_access(
+    byte_order, rgbsmall_ds, rgbsmall_uint16_bip_data, tmp_vsimem
+):
 
-    src_ds = gdal.Open("data/rgbsmall.tif")
-    filename = "/vsimem/test.bin"
+    src_ds = rgbsmall_ds
+    filename = str(tmp_vsimem / "test.bin")
     gdal.Translate(
         filename,
         src_ds,
@@ -885,22 +841,17 @@ def test_envi_read_direct_access(byte_order):
     ds = gdal.Open(filename)
 
     # Using optimization
-    assert ds.ReadRaster(
-        0,
-        0,
-        ds.RasterXSize,
-        ds.RasterYSize,
-        buf_type=gdal.GDT_UInt16,
-        buf_pixel_space=2 * ds.RasterCount,
-        buf_band_space=2,
-    ) == src_ds.ReadRaster(
-        0,
-        0,
-        ds.RasterXSize,
-        ds.RasterYSize,
-        buf_type=gdal.GDT_UInt16,
-        buf_pixel_space=2 * ds.RasterCount,
-        buf_band_space=2,
+    assert (
+        ds.ReadRaster(
+            0,
+            0,
+            ds.RasterXSize,
+            ds.RasterYSize,
+            buf_type=gdal.GDT_UInt16,
+            buf_pixel_space=2 * ds.RasterCount,
+            buf_band_space=2,
+        )
+        == rgbsmall_uint16_bip_data
     )
 
     assert ds.ReadRaster(
@@ -944,18 +895,16 @@ def test_envi_read_direct_access(byte_order):
 
     ds = None
 
-    gdal.GetDriverByName("ENVI").Delete(filename)
-
 
 ###############################################################################
 # Test direct access to BIP scanlines in GA_Update mode
 
 
-def test_envi_read_direct_access_update_scenario():
+def test_envi_read_direct_access_update_scenario(envi_drv, rgbsmall_ds, tmp_vsimem):
 
-    src_ds = gdal.Open("data/rgbsmall.tif")
-    filename = "/vsimem/test.bin"
-    ds = gdal.GetDriverByName("ENVI").Create(
+    src_ds = rgbsmall_ds
+    filename = str(tmp_vsimem / "test.bin")
+    ds = envi_drv.Create(
         filename,
         src_ds.RasterXSize,
         src_ds.RasterYSize,
@@ -985,8 +934,6 @@ def test_envi_read_direct_access_update_scenario():
 
     ds = None
 
-    gdal.GetDriverByName("ENVI").Delete(filename)
-
 
 ###############################################################################
 # Test setting different nodata values
@@ -1001,9 +948,11 @@ def test_envi_read_direct_access_update_scenario():
         (1, float("nan"), True),
     ],
 )
-def test_envi_write_warn_different_nodata(tmp_vsimem, nd1, nd2, expected_warning):
+def test_envi_write_warn_different_nodata(
+    tmp_vsimem, nd1, nd2, expected_warning, envi_drv
+):
     filename = str(tmp_vsimem / "test_envi_write_warn_different_nodata.img")
-    ds = gdal.GetDriverByName("ENVI").Create(filename, 1, 1, 2)
+    ds = envi_drv.Create(filename, 1, 1, 2)
     assert ds.GetRasterBand(1).SetNoDataValue(nd1) == gdal.CE_None
     gdal.ErrorReset()
     with gdal.quiet_errors():
@@ -1017,55 +966,31 @@ def test_envi_write_warn_different_nodata(tmp_vsimem, nd1, nd2, expected_warning
 # Test reading "default bands" in RGB mode
 
 
-def test_envi_read_metadata_with_leading_space():
+def test_envi_read_metadata_with_leading_space(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
-samples = 1
-lines = 1
-bands = 3
-header offset = 0
-file type = ENVI Standard
-data type = 1
-interleave = bip
-sensor type = Unknown
-byte order = 0
- wavelength = {3, 2, 1}""",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE + b" wavelength = {3, 2, 1}",
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
-    ds = gdal.Open("/vsimem/test.bin")
+    ds = gdal.Open(filename)
     assert ds.GetRasterBand(1).GetMetadataItem("wavelength") == "3"
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
 
 
 ###############################################################################
 # Test wavelength / fwhm
 
 
-def test_envi_read_wavelength_fwhm_um():
+def test_envi_read_wavelength_fwhm_um(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
-samples = 1
-lines = 1
-bands = 3
-header offset = 0
-file type = ENVI Standard
-data type = 1
-interleave = bip
-sensor type = Unknown
-byte order = 0
-wavelength units = um
-wavelength = {3, 2, 1}
-fwhm = {.3, .2, .1}""",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE
+        + b"wavelength units = um\nwavelength = {3, 2, 1}\nfwhm = {.3, .2, .1}",
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
-    ds = gdal.Open("/vsimem/test.bin")
+    ds = gdal.Open(filename)
     assert (
         ds.GetRasterBand(1).GetMetadataItem("CENTRAL_WAVELENGTH_UM", "IMAGERY")
         == "3.000"
@@ -1077,34 +1002,21 @@ fwhm = {.3, .2, .1}""",
     )
     assert ds.GetRasterBand(2).GetMetadataItem("FWHM_UM", "IMAGERY") == "0.200"
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
 
 
 ###############################################################################
 # Test wavelength / fwhm
 
 
-def test_envi_read_wavelength_fwhm_nm():
+def test_envi_read_wavelength_fwhm_nm(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
-samples = 1
-lines = 1
-bands = 3
-header offset = 0
-file type = ENVI Standard
-data type = 1
-interleave = bip
-sensor type = Unknown
-byte order = 0
-wavelength units = nm
-wavelength = {3000, 2000, 1000}
-fwhm = {300, 200, 100}""",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE
+        + b"wavelength units = nm\nwavelength = {3000, 2000, 1000}\nfwhm = {300, 200, 100}",
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
-    ds = gdal.Open("/vsimem/test.bin")
+    ds = gdal.Open(filename)
     assert (
         ds.GetRasterBand(1).GetMetadataItem("CENTRAL_WAVELENGTH_UM", "IMAGERY")
         == "3.000"
@@ -1116,34 +1028,21 @@ fwhm = {300, 200, 100}""",
     )
     assert ds.GetRasterBand(2).GetMetadataItem("FWHM_UM", "IMAGERY") == "0.200"
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
 
 
 ###############################################################################
 # Test wavelength / fwhm
 
 
-def test_envi_read_wavelength_fwhm_mm():
+def test_envi_read_wavelength_fwhm_mm(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
-        """ENVI
-samples = 1
-lines = 1
-bands = 3
-header offset = 0
-file type = ENVI Standard
-data type = 1
-interleave = bip
-sensor type = Unknown
-byte order = 0
-wavelength units = mm
-wavelength = {0.003, 0.002, 0.001}
-fwhm = {0.0003, 0.0002, 0.0001}""",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
+        _HDR_PREAMBLE
+        + b"wavelength units = mm\nwavelength = {0.003, 0.002, 0.001}\nfwhm = {0.0003, 0.0002, 0.0001}",
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
-    ds = gdal.Open("/vsimem/test.bin")
+    ds = gdal.Open(filename)
     assert (
         ds.GetRasterBand(1).GetMetadataItem("CENTRAL_WAVELENGTH_UM", "IMAGERY")
         == "3.000"
@@ -1155,16 +1054,15 @@ fwhm = {0.0003, 0.0002, 0.0001}""",
     )
     assert ds.GetRasterBand(2).GetMetadataItem("FWHM_UM", "IMAGERY") == "0.200"
     ds = None
-    gdal.GetDriverByName("ENVI").Delete("/vsimem/test.bin")
 
 
 ###############################################################################
 
 
-def test_envi_read_too_large_lines():
+def test_envi_read_too_large_lines(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
         """ENVI
 file type = ENVI Standard
 sensor type = Unknown
@@ -1178,13 +1076,12 @@ y start = 1
 interleave = bip
 """,
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
     with gdaltest.error_raised(
         gdal.CE_Warning,
         match="Limiting number of lines from 2147483648 to 2147483647 due to GDAL raster data model limitation",
     ):
-        ds = gdal.Open("/vsimem/test.bin")
+        ds = gdal.Open(filename)
         assert ds.RasterXSize == 2
         assert ds.RasterYSize == 2147483647
 
@@ -1192,10 +1089,10 @@ interleave = bip
 ###############################################################################
 
 
-def test_envi_read_too_large_samples():
+def test_envi_read_too_large_samples(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
         """ENVI
 file type = ENVI Standard
 sensor type = Unknown
@@ -1209,22 +1106,21 @@ y start = 1
 interleave = bip
 """,
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
     with pytest.raises(
         Exception,
         match="Cannot handle samples=2147483648 due to GDAL raster data model limitation",
     ):
-        gdal.Open("/vsimem/test.bin")
+        gdal.Open(filename)
 
 
 ###############################################################################
 
 
-def test_envi_read_too_large_bands():
+def test_envi_read_too_large_bands(tmp_vsimem):
 
-    gdal.FileFromMemBuffer(
-        "/vsimem/test.hdr",
+    filename = _create_envi_dataset(
+        tmp_vsimem,
         """ENVI
 file type = ENVI Standard
 sensor type = Unknown
@@ -1238,10 +1134,9 @@ y start = 1
 interleave = bip
 """,
     )
-    gdal.FileFromMemBuffer("/vsimem/test.bin", "xyz")
 
     with pytest.raises(
         Exception,
         match="Cannot handle bands=2147483648 due to GDAL raster data model limitation",
     ):
-        gdal.Open("/vsimem/test.bin")
+        gdal.Open(filename)
@@ -13,6 +13,7 @@
 
 import array
 import base64
+import functools
 import json
 import math
 import os
@@ -30,12 +31,61 @@ pytestmark = pytest.mark.require_driver("ZARR")
 
 
 ###############################################################################
+# Module scoped fixtures are instantiated once per pytest-xdist worker process,
+# so this does not prevent the tests of this module from being distributed
+# with "pytest -n auto": in-memory files are private to each worker, and tests
+# writing on disk use tmp_path.
+
+
 @pytest.fixture(autouse=True, scope="module")
 def module_disable_exceptions():
     with gdaltest.disable_exceptions():
         yield
 
 
+###############################################################################
+@pytest.fixture(scope="module")
+def zarr_drv():
+    return gdal.GetDriverByName("ZARR")
+
+
+@pytest.fixture(scope="module")
+def zarr_compressors(zarr_drv):
+    return frozenset(zarr_drv.GetMetadataItem("COMPRESSORS").split(","))
+
+
+# Must be cloned by tests that modify it
+@pytest.fixture(scope="module")
+def epsg4326_srs():
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    return srs
+
+
+###############################################################################
+# Source datasets only read by the CreateCopy() tests, opened once
+
+
+@pytest.fixture(scope="module")
+def byte_tif_ds():
+    return gdal.Open("data/byte.tif")
+
+
+@pytest.fixture(scope="module")
+def rgbsmall_ds():
+    return gdal.Open("data/rgbsmall.tif")
+
+
+# Extended data types used as buffer or array data types by many tests
+_uint8_dt = gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
+_int16_dt = gdal.ExtendedDataType.Create(gdal.GDT_Int16)
+_int32_dt = gdal.ExtendedDataType.Create(gdal.GDT_Int32)
+_float32_dt = gdal.ExtendedDataType.Create(gdal.GDT_Float32)
+_float64_dt = gdal.ExtendedDataType.Create(gdal.GDT_Float64)
+_cfloat64_dt = gdal.ExtendedDataType.Create(gdal.GDT_CFloat64)
+_string_dt = gdal.ExtendedDataType.CreateString()
+
+
 _gdal_data_type_to_array_type = {
     gdal.GDT_Int8: "b",
     gdal.GDT_UInt8: "B",
@@ -54,77 +104,76 @@ _gdal_data_type_to_array_type = {
 }
 
 
-@pytest.mark.parametrize(
-    "dtype,gdaltype,fill_value,nodata_value",
+# dtype, GDAL data type, fill_value and expected nodata value of the cases of
+# test_zarr_basic
+_zarr_basic_dtypes = [
+    ["!b1", gdal.GDT_UInt8, None, None],
+    ["!i1", gdal.GDT_Int8, None, None],
+    ["!i1", gdal.GDT_Int8, -1, -1],
+    ["!u1", gdal.GDT_UInt8, None, None],
     [
-        ["!b1", gdal.GDT_UInt8, None, None],
-        ["!i1", gdal.GDT_Int8, None, None],
-        ["!i1", gdal.GDT_Int8, -1, -1],
-        ["!u1", gdal.GDT_UInt8, None, None],
-        [
-            "!u1",
-            gdal.GDT_UInt8,
-            "1",
-            1,
-        ],  # not really legit to have the fill_value as a str
-        ["<i2", gdal.GDT_Int16, None, None],
-        [">i2", gdal.GDT_Int16, None, None],
-        ["<i4", gdal.GDT_Int32, None, None],
-        [">i4", gdal.GDT_Int32, None, None],
-        ["<i8", gdal.GDT_Int64, None, None],
-        ["<i8", gdal.GDT_Int64, -(1 << 63), -(1 << 63)],
-        [
-            "<i8",
-            gdal.GDT_Int64,
-            str(-(1 << 63)),
-            -(1 << 63),
-        ],  # not really legit to have the fill_value as a str
-        [">i8", gdal.GDT_Int64, None, None],
-        ["<u2", gdal.GDT_UInt16, None, None],
-        [">u2", gdal.GDT_UInt16, None, None],
-        ["<u4", gdal.GDT_UInt32, None, None],
-        [">u4", gdal.GDT_UInt32, None, None],
-        ["<u4", gdal.GDT_UInt32, 4000000000, 4000000000],
-        [
-            "<u8",
-            gdal.GDT_UInt64,
-            str((1 << 64) - 1),
-            (1 << 64) - 1,
-        ],  # not really legit to have the fill_value as a str, but libjson-c can't support numeric values in int64::max(), uint64::max() range.
-        [">u8", gdal.GDT_UInt64, None, None],
-        # We would like to test these, but SWIG does not support float16 (yet?)
-        # ["<f2", gdal.GDT_Float16, None, None],
-        # [">f2", gdal.GDT_Float16, None, None],
-        # ["<f2", gdal.GDT_Float16, 1.5, 1.5],
-        # ["<f2", gdal.GDT_Float16, "NaN", float("nan")],
-        # ["<f2", gdal.GDT_Float16, "Infinity", float("infinity")],
-        # ["<f2", gdal.GDT_Float16, "-Infinity", float("-infinity")],
-        ["<f4", gdal.GDT_Float32, None, None],
-        [">f4", gdal.GDT_Float32, None, None],
-        ["<f4", gdal.GDT_Float32, 1.5, 1.5],
-        ["<f4", gdal.GDT_Float32, "NaN", float("nan")],
-        ["<f4", gdal.GDT_Float32, "Infinity", float("infinity")],
-        ["<f4", gdal.GDT_Float32, "-Infinity", float("-infinity")],
-        ["<f8", gdal.GDT_Float64, None, None],
-        [">f8", gdal.GDT_Float64, None, None],
-        ["<f8", gdal.GDT_Float64, "NaN", float("nan")],
-        ["<f8", gdal.GDT_Float64, "Infinity", float("infinity")],
-        ["<f8", gdal.GDT_Float64, "-Infinity", float("-infinity")],
-        # We would like to test these, but SWIG does not support complex32 (yet?)
-        # ["<c4", gdal.GDT_CFloat16, None, None],
-        # [">c4", gdal.GDT_CFloat16, None, None],
-        ["<c8", gdal.GDT_CFloat32, None, None],
-        [">c8", gdal.GDT_CFloat32, None, None],
-        ["<c16", gdal.GDT_CFloat64, None, None],
-        [">c16", gdal.GDT_CFloat64, None, None],
-    ],
-)
-@pytest.mark.parametrize("use_optimized_code_paths", [True, False])
-def test_zarr_basic(
-    tmp_vsimem, dtype, gdaltype, fill_value, nodata_value, use_optimized_code_paths
-):
-
-    structtype = _gdal_data_type_to_array_type[gdaltype]
+        "!u1",
+        gdal.GDT_UInt8,
+        "1",
+        1,
+    ],  # not really legit to have the fill_value as a str
+    ["<i2", gdal.GDT_Int16, None, None],
+    [">i2", gdal.GDT_Int16, None, None],
+    ["<i4", gdal.GDT_Int32, None, None],
+    [">i4", gdal.GDT_Int32, None, None],
+    ["<i8", gdal.GDT_Int64, None, None],
+    ["<i8", gdal.GDT_Int64, -(1 << 63), -(1 << 63)],
+    [
+        "<i8",
+        gdal.GDT_Int64,
+        str(-(1 << 63)),
+        -(1 << 63),
+    ],  # not really legit to have the fill_value as a str
+    [">i8", gdal.GDT_Int64, None, None],
+    ["<u2", gdal.GDT_UInt16, None, None],
+    [">u2", gdal.GDT_UInt16, None, None],
+    ["<u4", gdal.GDT_UInt32, None, None],
+    [">u4", gdal.GDT_UInt32, None, None],
+    ["<u4", gdal.GDT_UInt32, 4000000000, 4000000000],
+    [
+        "<u8",
+        gdal.GDT_UInt64,
+        str((1 << 64) - 1),
+        (1 << 64) - 1,
+    ],  # not really legit to have the fill_value as a str, but libjson-c can't support numeric values in int64::max(), uint64::max() range.
+    [">u8", gdal.GDT_UInt64, None, None],
+    # We would like to test these, but SWIG does not support float16 (yet?)
+    # ["<f2", gdal.GDT_Float16, None, None],
+    # [">f2", gdal.GDT_Float16, None, None],
+    # ["<f2", gdal.GDT_Float16, 1.5, 1.5],
+    # ["<f2", gdal.GDT_Float16, "NaN", float("nan")],
+    # ["<f2", gdal.GDT_Float16, "Infinity", float("infinity")],
+    # ["<f2", gdal.GDT_Float16, "-Infinity", float("-infinity")],
+    ["<f4", gdal.GDT_Float32, None, None],
+    [">f4", gdal.GDT_Float32, None, None],
+    ["<f4", gdal.GDT_Float32, 1.5, 1.5],
+    ["<f4", gdal.GDT_Float32, "NaN", float("nan")],
+    ["<f4", gdal.GDT_Float32, "Infinity", float("infinity")],
+    ["<f4", gdal.GDT_Float32, "-Infinity", float("-infinity")],
+    ["<f8", gdal.GDT_Float64, None, None],
+    [">f8", gdal.GDT_Float64, None, None],
+    ["<f8", gdal.GDT_Float64, "NaN", float("nan")],
+    ["<f8", gdal.GDT_Float64, "Infinity", float("infinity")],
+    ["<f8", gdal.GDT_Float64, "-Infinity", float("-infinity")],
+    # We would like to test these, but SWIG does not support complex32 (yet?)
+    # ["<c4", gdal.GDT_CFloat16, None, None],
+    # [">c4", gdal.GDT_CFloat16, None, None],
+    ["<c8", gdal.GDT_CFloat32, None, None],
+    [">c8", gdal.GDT_CFloat32, None, None],
+    ["<c16", gdal.GDT_CFloat64, None, None],
+    [">c16", gdal.GDT_CFloat64, None, None],
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _zarr_v2_test_array_content(dtype, gdaltype, fill_value):
+    """.zarray and chunks 0.0 and 0.1 of the 5x4 arrays of test_zarr_basic and
+    test_zarr_write_array_content, built once per data type and fill value"""
 
     j = {
         "chunks": [2, 3],
@@ -137,25 +186,37 @@ def test_zarr_basic(
         "zarr_format": 2,
     }
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
+    structtype = _gdal_data_type_to_array_type[gdaltype]
     if gdaltype not in (gdal.GDT_CFloat16, gdal.GDT_CFloat32, gdal.GDT_CFloat64):
-        tile_0_0_data = struct.pack(dtype[0] + (structtype * 6), 1, 2, 3, 5, 6, 7)
-        tile_0_1_data = struct.pack(dtype[0] + (structtype * 6), 4, 0, 0, 8, 0, 0)
+        tile = struct.Struct(dtype[0] + "6" + structtype)
+        tile_0_0_data = tile.pack(1, 2, 3, 5, 6, 7)
+        tile_0_1_data = tile.pack(4, 0, 0, 8, 0, 0)
     else:
-        tile_0_0_data = struct.pack(
-            dtype[0] + (structtype * 12), 1, 11, 2, 0, 3, 0, 5, 0, 6, 0, 7, 0
-        )
-        tile_0_1_data = struct.pack(
-            dtype[0] + (structtype * 12), 4, 0, 0, 0, 0, 0, 8, 0, 0, 0, 0, 0
-        )
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/0.0", tile_0_0_data)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/0.1", tile_0_1_data)
+        tile = struct.Struct(dtype[0] + "12" + structtype)
+        tile_0_0_data = tile.pack(1, 11, 2, 0, 3, 0, 5, 0, 6, 0, 7, 0)
+        tile_0_1_data = tile.pack(4, 0, 0, 0, 0, 0, 8, 0, 0, 0, 0, 0)
+
+    return json.dumps(j), tile_0_0_data, tile_0_1_data
+
+
+def _check_zarr_basic(
+    path, dtype, gdaltype, fill_value, nodata_value, use_optimized_code_paths
+):
+
+    structtype = _gdal_data_type_to_array_type[gdaltype]
+
+    zarray, tile_0_0_data, tile_0_1_data = _zarr_v2_test_array_content(
+        dtype, gdaltype, fill_value
+    )
+    gdal.Mkdir(path, 0)
+    gdal.FileFromMemBuffer(path / ".zarray", zarray)
+    gdal.FileFromMemBuffer(path / "0.0", tile_0_0_data)
+    gdal.FileFromMemBuffer(path / "0.1", tile_0_1_data)
     with gdaltest.config_option(
         "GDAL_ZARR_USE_OPTIMIZED_CODE_PATHS",
         "YES" if use_optimized_code_paths else "NO",
     ):
-        ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
+        ds = gdal.Open(path, gdal.OF_MULTIDIM_RASTER)
         assert ds
         rg = ds.GetRootGroup()
         assert rg
@@ -176,18 +237,16 @@ def test_zarr_basic(
     assert ar.GetOverview(0) is None
 
     # Check reading one single value
-    assert ar[1, 2].Read(
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-    ) == struct.pack("d" * 1, 7)
+    assert ar[1, 2].Read(buffer_datatype=_float64_dt) == array.array("d", [7])
 
     structtype_read = structtype
 
     # Read block 0,0
     if gdaltype not in (gdal.GDT_CFloat16, gdal.GDT_CFloat32, gdal.GDT_CFloat64):
-        assert ar[0:2, 0:3].Read(
-            buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-        ) == struct.pack("d" * 6, 1, 2, 3, 5, 6, 7)
-        assert struct.unpack(structtype_read * 6, ar[0:2, 0:3].Read()) == (
+        assert ar[0:2, 0:3].Read(buffer_datatype=_float64_dt) == array.array(
+            "d", [1, 2, 3, 5, 6, 7]
+        )
+        assert struct.unpack("6" + structtype_read, ar[0:2, 0:3].Read()) == (
             1,
             2,
             3,
@@ -196,10 +255,10 @@ def test_zarr_basic(
             7,
         )
     else:
-        assert ar[0:2, 0:3].Read(
-            buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_CFloat64)
-        ) == struct.pack("d" * 12, 1, 11, 2, 0, 3, 0, 5, 0, 6, 0, 7, 0)
-        assert struct.unpack(structtype * 12, ar[0:2, 0:3].Read()) == (
+        assert ar[0:2, 0:3].Read(buffer_datatype=_cfloat64_dt) == array.array(
+            "d", [1, 11, 2, 0, 3, 0, 5, 0, 6, 0, 7, 0]
+        )
+        assert struct.unpack("12" + structtype, ar[0:2, 0:3].Read()) == (
             1,
             11,
             2,
@@ -215,156 +274,123 @@ def test_zarr_basic(
         )
 
     # Read block 0,1
-    assert ar[0:2, 3:4].Read(
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-    ) == struct.pack("d" * 2, 4, 8)
+    assert ar[0:2, 3:4].Read(buffer_datatype=_float64_dt) == array.array("d", [4, 8])
 
     # Read block 1,1 (missing)
     nv = nodata_value if nodata_value else 0
-    assert ar[2:4, 3:4].Read(
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-    ) == struct.pack("d" * 2, nv, nv)
+    assert ar[2:4, 3:4].Read(buffer_datatype=_float64_dt) == array.array("d", [nv, nv])
 
     # Read whole raster
-    assert ar.Read(
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-    ) == struct.pack(
-        "d" * 20,
-        1,
-        2,
-        3,
-        4,
-        5,
-        6,
-        7,
-        8,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-        nv,
-    )
+    whole_raster_values = [1, 2, 3, 4, 5, 6, 7, 8] + [nv] * 12
+    whole_raster_float64 = array.array("d", whole_raster_values)
+    assert ar.Read(buffer_datatype=_float64_dt) == whole_raster_float64
 
     if gdaltype not in (gdal.GDT_CFloat16, gdal.GDT_CFloat32, gdal.GDT_CFloat64):
-        assert ar.Read() == array.array(
-            structtype_read,
-            [
-                1,
-                2,
-                3,
-                4,
-                5,
-                6,
-                7,
-                8,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-                nv,
-            ],
-        )
+        assert ar.Read() == array.array(structtype_read, whole_raster_values)
     else:
+        # Interleaved real and imaginary parts
         assert ar.Read() == array.array(
             structtype,
-            [
-                1,
-                11,
-                2,
-                0,
-                3,
-                0,
-                4,
-                0,
-                5,
-                0,
-                6,
-                0,
-                7,
-                0,
-                8,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-                nv,
-                0,
-            ],
+            [1, 11, 2, 0, 3, 0, 4, 0, 5, 0, 6, 0, 7, 0, 8, 0] + [nv, 0] * 12,
         )
     # Read with negative steps
     assert ar.Read(
         array_start_idx=[2, 1],
         count=[2, 2],
         array_step=[-1, -1],
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
-    ) == struct.pack("d" * 4, nv, nv, 6, 5)
+        buffer_datatype=_float64_dt,
+    ) == array.array("d", [nv, nv, 6, 5])
 
     # array_step > 2
     assert ar.Read(
         array_start_idx=[0, 0],
         count=[1, 2],
         array_step=[0, 2],
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
-    ) == struct.pack("d" * 2, 1, 3)
+        buffer_datatype=_float64_dt,
+    ) == array.array("d", [1, 3])
 
     assert ar.Read(
         array_start_idx=[0, 0],
         count=[3, 1],
         array_step=[2, 0],
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
-    ) == struct.pack("d" * 3, 1, nv, nv)
+        buffer_datatype=_float64_dt,
+    ) == array.array("d", [1, nv, nv])
 
     assert ar.Read(
         array_start_idx=[0, 1],
         count=[1, 2],
         array_step=[0, 2],
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
-    ) == struct.pack("d" * 2, 2, 4)
+        buffer_datatype=_float64_dt,
+    ) == array.array("d", [2, 4])
 
     assert ar.Read(
         array_start_idx=[0, 0],
         count=[1, 2],
         array_step=[0, 3],
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
-    ) == struct.pack("d" * 2, 1, 4)
+        buffer_datatype=_float64_dt,
+    ) == array.array("d", [1, 4])
+
+    # Read whole raster with GDAL_NUM_THREADS set, so that the chunks it spans
+    # are fetched and decoded as one batch by IAdviseRead() before being copied
+    with gdal.config_option("GDAL_NUM_THREADS", "ALL_CPUS"):
+        assert ar.Read(buffer_datatype=_float64_dt) == whole_raster_float64
+
+
+@pytest.mark.parametrize("dtype,gdaltype,fill_value,nodata_value", _zarr_basic_dtypes)
+@pytest.mark.parametrize("use_optimized_code_paths", [True, False])
+def test_zarr_basic(
+    tmp_vsimem, dtype, gdaltype, fill_value, nodata_value, use_optimized_code_paths
+):
+
+    _check_zarr_basic(
+        tmp_vsimem / "test.zarr",
+        dtype,
+        gdaltype,
+        fill_value,
+        nodata_value,
+        use_optimized_code_paths,
+    )
+
+
+# Check reading successive windows into the same caller-provided buffer
+def test_zarr_read_into_preallocated_buffer(tmp_vsimem):
+
+    np = pytest.importorskip("numpy")
+    gdaltest.importorskip_gdal_array()
+
+    j = {**_VALID_ZARRAY_V2, "dtype": "<f8"}
+
+    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
+    gdal.FileFromMemBuffer(
+        tmp_vsimem / "test.zarr/0.0", struct.pack("<6d", 1, 2, 3, 5, 6, 7)
+    )
+    gdal.FileFromMemBuffer(
+        tmp_vsimem / "test.zarr/0.1", struct.pack("<6d", 4, 0, 0, 8, 0, 0)
+    )
+    ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
+    assert ds
+    rg = ds.GetRootGroup()
+    ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
+    assert ar
+
+    # The size of the window read is the shape of the buffer
+    buf = np.empty((2, 2), dtype=np.float64)
+    assert ar.ReadAsArray(array_start_idx=[0, 0], buf_obj=buf) is buf
+    assert buf.tolist() == [[1, 2], [5, 6]]
+    assert ar.ReadAsArray(array_start_idx=[0, 2], buf_obj=buf) is buf
+    assert buf.tolist() == [[3, 4], [7, 8]]
+    # Missing chunk
+    assert ar.ReadAsArray(array_start_idx=[2, 0], buf_obj=buf) is buf
+    assert buf.tolist() == [[0, 0], [0, 0]]
+
+
+# Base64 encoded "xyz" fill value of test_zarr_string
+_FILL_VALUE_XYZ = base64.b64encode(b"xyz").decode("utf-8")
 
 
 @pytest.mark.parametrize(
     "fill_value,expected_read_data",
-    [[base64.b64encode(b"xyz").decode("utf-8"), ["abc", "xyz"]], [None, ["abc", None]]],
+    [[_FILL_VALUE_XYZ, ["abc", "xyz"]], [None, ["abc", None]]],
 )
 def test_zarr_string(tmp_vsimem, fill_value, expected_read_data):
 
@@ -379,7 +405,6 @@ def test_zarr_string(tmp_vsimem, fill_value, expected_read_data):
         "zarr_format": 2,
     }
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/0", b"abc")
     ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
@@ -391,6 +416,19 @@ def test_zarr_string(tmp_vsimem, fill_value, expected_read_data):
     assert ar.Read() == expected_read_data
 
 
+# Minimal valid Zarr V2 .zarray content, used as is or altered by tests
+_VALID_ZARRAY_V2 = {
+    "chunks": [2, 3],
+    "compressor": None,
+    "dtype": "!b1",
+    "fill_value": None,
+    "filters": None,
+    "order": "C",
+    "shape": [5, 4],
+    "zarr_format": 2,
+}
+
+
 # Check that all required elements are present in .zarray
 @pytest.mark.parametrize(
     "member",
@@ -408,21 +446,10 @@ def test_zarr_string(tmp_vsimem, fill_value, expected_read_data):
 )
 def test_zarr_invalid_json_remove_member(tmp_vsimem, member):
 
-    j = {
-        "chunks": [2, 3],
-        "compressor": None,
-        "dtype": "!b1",
-        "fill_value": None,
-        "filters": None,
-        "order": "C",
-        "shape": [5, 4],
-        "zarr_format": 2,
-    }
-
+    j = dict(_VALID_ZARRAY_V2)
     if member:
         del j[member]
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
     with gdal.quiet_errors():
         ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
@@ -475,20 +502,8 @@ def test_zarr_invalid_json_remove_member(tmp_vsimem, member):
 )
 def test_zarr_invalid_json_wrong_values(tmp_vsimem, dict_update):
 
-    j = {
-        "chunks": [2, 3],
-        "compressor": None,
-        "dtype": "!b1",
-        "fill_value": None,
-        "filters": None,
-        "order": "C",
-        "shape": [5, 4],
-        "zarr_format": 2,
-    }
-
-    j.update(dict_update)
+    j = {**_VALID_ZARRAY_V2, **dict_update}
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
     with gdal.quiet_errors():
         ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
@@ -508,12 +523,11 @@ def test_zarr_invalid_json_wrong_values(tmp_vsimem, dict_update):
         ("zstd.zarr", "zstd"),
     ],
 )
-def test_zarr_read_compression_methods(datasetname, compressor):
+def test_zarr_read_compression_methods(datasetname, compressor, zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
     filename = "data/zarr/" + datasetname
 
-    if compressor not in compressors:
+    if compressor not in zarr_compressors:
         with gdal.quiet_errors():
             ds = gdal.Open(filename, gdal.OF_MULTIDIM_RASTER)
         assert ds is None
@@ -523,7 +537,7 @@ def test_zarr_read_compression_methods(datasetname, compressor):
         assert rg
         ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
         assert ar
-        assert ar.Read() == array.array("b", [1, 2])
+        assert ar.Read() == bytes([1, 2])
         assert json.loads(ar.GetStructuralInfo()["COMPRESSOR"])["id"] == compressor
 
 
@@ -534,12 +548,11 @@ def test_zarr_read_compression_methods(datasetname, compressor):
         ("gzip.zarr", "gzip"),
     ],
 )
-def test_zarr_v3_read_compression_methods(datasetname, compressor):
+def test_zarr_v3_read_compression_methods(datasetname, compressor, zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
     filename = "data/zarr/v3/" + datasetname
 
-    if compressor not in compressors:
+    if compressor not in zarr_compressors:
         with gdal.quiet_errors():
             ds = gdal.Open(filename, gdal.OF_MULTIDIM_RASTER)
         assert ds is None
@@ -549,7 +562,7 @@ def test_zarr_v3_read_compression_methods(datasetname, compressor):
         assert rg
         ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
         assert ar
-        assert ar.Read() == array.array("b", [1, 2])
+        assert ar.Read() == bytes([1, 2])
         assert json.loads(ar.GetStructuralInfo()["COMPRESSOR"])["name"] == compressor
 
 
@@ -586,6 +599,15 @@ def test_zarr_read_shuffle_filter_update(tmp_path):
     assert ar.Read() == array.array("h", [3, 4])
 
 
+# Content of the 10x10 array of data/zarr/quantize.zarr (quantize filter with
+# digits=1): row i holds i plus the same 10 fractional parts, which are
+# quantized to multiples of 1/16
+_quantize_zarr_expected_values = array.array(
+    "d",
+    [i + q / 16 for i in range(10) for q in (0, 2, 3, 5, 6, 8, 10, 11, 13, 14)],
+)
+
+
 def test_zarr_read_shuffle_quantize():
 
     filename = "data/zarr/quantize.zarr"
@@ -594,111 +616,7 @@ def test_zarr_read_shuffle_quantize():
     assert rg
     ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
     assert ar
-    assert ar.Read() == array.array(
-        "d",
-        [
-            0,
-            0.125,
-            0.1875,
-            0.3125,
-            0.375,
-            0.5,
-            0.625,
-            0.6875,
-            0.8125,
-            0.875,
-            1,
-            1.125,
-            1.1875,
-            1.3125,
-            1.375,
-            1.5,
-            1.625,
-            1.6875,
-            1.8125,
-            1.875,
-            2,
-            2.125,
-            2.1875,
-            2.3125,
-            2.375,
-            2.5,
-            2.625,
-            2.6875,
-            2.8125,
-            2.875,
-            3,
-            3.125,
-            3.1875,
-            3.3125,
-            3.375,
-            3.5,
-            3.625,
-            3.6875,
-            3.8125,
-            3.875,
-            4,
-            4.125,
-            4.1875,
-            4.3125,
-            4.375,
-            4.5,
-            4.625,
-            4.6875,
-            4.8125,
-            4.875,
-            5,
-            5.125,
-            5.1875,
-            5.3125,
-            5.375,
-            5.5,
-            5.625,
-            5.6875,
-            5.8125,
-            5.875,
-            6,
-            6.125,
-            6.1875,
-            6.3125,
-            6.375,
-            6.5,
-            6.625,
-            6.6875,
-            6.8125,
-            6.875,
-            7,
-            7.125,
-            7.1875,
-            7.3125,
-            7.375,
-            7.5,
-            7.625,
-            7.6875,
-            7.8125,
-            7.875,
-            8,
-            8.125,
-            8.1875,
-            8.3125,
-            8.375,
-            8.5,
-            8.625,
-            8.6875,
-            8.8125,
-            8.875,
-            9.0,
-            9.125,
-            9.1875,
-            9.3125,
-            9.375,
-            9.5,
-            9.625,
-            9.6875,
-            9.8125,
-            9.875,
-        ],
-    )
+    assert ar.Read() == _quantize_zarr_expected_values
 
 
 def test_zarr_read_shuffle_quantize_update_not_supported():
@@ -777,9 +695,7 @@ def test_zarr_read_fortran_order(name):
     assert rg
     ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
     assert ar
-    assert ar.Read(
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-    ) == array.array("b", [i for i in range(16)])
+    assert ar.Read(buffer_datatype=_uint8_dt) == bytes(range(16))
 
 
 def test_zarr_read_fortran_order_string():
@@ -818,9 +734,7 @@ def test_zarr_read_fortran_order_3d():
     assert rg
     ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
     assert ar
-    assert ar.Read(
-        buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-    ) == array.array("b", [i for i in range(2 * 3 * 4)])
+    assert ar.Read(buffer_datatype=_uint8_dt) == bytes(range(2 * 3 * 4))
 
 
 def test_zarr_read_compound_well_aligned():
@@ -964,114 +878,104 @@ def test_zarr_read_array_attributes():
     }
 
 
-@pytest.mark.parametrize("crs_member", ["projjson", "wkt", "url"])
-def test_zarr_read_crs(tmp_vsimem, crs_member):
-
-    zarray = {
-        "chunks": [2, 3],
-        "compressor": None,
-        "dtype": "!b1",
-        "fill_value": None,
-        "filters": None,
-        "order": "C",
-        "shape": [5, 4],
-        "zarr_format": 2,
-    }
-
-    zattrs_all = {
-        "_CRS": {
-            "projjson": {
-                "$schema": "https://proj.org/schemas/v0.2/projjson.schema.json",
-                "type": "GeographicCRS",
-                "name": "WGS 84",
-                "datum_ensemble": {
-                    "name": "World Geodetic System 1984 ensemble",
-                    "members": [
-                        {
-                            "name": "World Geodetic System 1984 (Transit)",
-                            "id": {"authority": "EPSG", "code": 1166},
-                        },
-                        {
-                            "name": "World Geodetic System 1984 (G730)",
-                            "id": {"authority": "EPSG", "code": 1152},
-                        },
-                        {
-                            "name": "World Geodetic System 1984 (G873)",
-                            "id": {"authority": "EPSG", "code": 1153},
-                        },
-                        {
-                            "name": "World Geodetic System 1984 (G1150)",
-                            "id": {"authority": "EPSG", "code": 1154},
-                        },
-                        {
-                            "name": "World Geodetic System 1984 (G1674)",
-                            "id": {"authority": "EPSG", "code": 1155},
-                        },
-                        {
-                            "name": "World Geodetic System 1984 (G1762)",
-                            "id": {"authority": "EPSG", "code": 1156},
-                        },
-                    ],
-                    "ellipsoid": {
-                        "name": "WGS 84",
-                        "semi_major_axis": 6378137,
-                        "inverse_flattening": 298.257223563,
-                    },
-                    "accuracy": "2.0",
-                    "id": {"authority": "EPSG", "code": 6326},
+# Encodings of EPSG:4326 accepted in the _CRS attribute
+_ZARR_CRS_4326 = {
+    "projjson": {
+        "$schema": "https://proj.org/schemas/v0.2/projjson.schema.json",
+        "type": "GeographicCRS",
+        "name": "WGS 84",
+        "datum_ensemble": {
+            "name": "World Geodetic System 1984 ensemble",
+            "members": [
+                {
+                    "name": "World Geodetic System 1984 (Transit)",
+                    "id": {"authority": "EPSG", "code": 1166},
                 },
-                "coordinate_system": {
-                    "subtype": "ellipsoidal",
-                    "axis": [
-                        {
-                            "name": "Geodetic latitude",
-                            "abbreviation": "Lat",
-                            "direction": "north",
-                            "unit": "degree",
-                        },
-                        {
-                            "name": "Geodetic longitude",
-                            "abbreviation": "Lon",
-                            "direction": "east",
-                            "unit": "degree",
-                        },
-                    ],
+                {
+                    "name": "World Geodetic System 1984 (G730)",
+                    "id": {"authority": "EPSG", "code": 1152},
+                },
+                {
+                    "name": "World Geodetic System 1984 (G873)",
+                    "id": {"authority": "EPSG", "code": 1153},
+                },
+                {
+                    "name": "World Geodetic System 1984 (G1150)",
+                    "id": {"authority": "EPSG", "code": 1154},
+                },
+                {
+                    "name": "World Geodetic System 1984 (G1674)",
+                    "id": {"authority": "EPSG", "code": 1155},
                 },
-                "scope": "Horizontal component of 3D system.",
-                "area": "World.",
-                "bbox": {
-                    "south_latitude": -90,
-                    "west_longitude": -180,
-                    "north_latitude": 90,
-                    "east_longitude": 180,
+                {
+                    "name": "World Geodetic System 1984 (G1762)",
+                    "id": {"authority": "EPSG", "code": 1156},
                 },
-                "id": {"authority": "EPSG", "code": 4326},
+            ],
+            "ellipsoid": {
+                "name": "WGS 84",
+                "semi_major_axis": 6378137,
+                "inverse_flattening": 298.257223563,
             },
-            "wkt": (
-                'GEOGCRS["WGS 84",ENSEMBLE["World Geodetic System 1984 ensemble",'
-                'MEMBER["World Geodetic System 1984 (Transit)"],'
-                'MEMBER["World Geodetic System 1984 (G730)"],'
-                'MEMBER["World Geodetic System 1984 (G873)"],'
-                'MEMBER["World Geodetic System 1984 (G1150)"],'
-                'MEMBER["World Geodetic System 1984 (G1674)"],'
-                'MEMBER["World Geodetic System 1984 (G1762)"],'
-                'ELLIPSOID["WGS 84",6378137,298.257223563,LENGTHUNIT["metre",1]],'
-                "ENSEMBLEACCURACY[2.0]],"
-                'PRIMEM["Greenwich",0,ANGLEUNIT["degree",0.0174532925199433]],'
-                "CS[ellipsoidal,2],"
-                'AXIS["geodetic latitude (Lat)",north,ORDER[1],ANGLEUNIT["degree",0.0174532925199433]],'
-                'AXIS["geodetic longitude (Lon)",east,ORDER[2],ANGLEUNIT["degree",0.0174532925199433]],'
-                'USAGE[SCOPE["Horizontal component of 3D system."],AREA["World."],BBOX[-90,-180,90,180]],'
-                'ID["EPSG",4326]]'
-            ),
-            "url": "http://www.opengis.net/def/crs/EPSG/0/4326",
-        }
-    }
+            "accuracy": "2.0",
+            "id": {"authority": "EPSG", "code": 6326},
+        },
+        "coordinate_system": {
+            "subtype": "ellipsoidal",
+            "axis": [
+                {
+                    "name": "Geodetic latitude",
+                    "abbreviation": "Lat",
+                    "direction": "north",
+                    "unit": "degree",
+                },
+                {
+                    "name": "Geodetic longitude",
+                    "abbreviation": "Lon",
+                    "direction": "east",
+                    "unit": "degree",
+                },
+            ],
+        },
+        "scope": "Horizontal component of 3D system.",
+        "area": "World.",
+        "bbox": {
+            "south_latitude": -90,
+            "west_longitude": -180,
+            "north_latitude": 90,
+            "east_longitude": 180,
+        },
+        "id": {"authority": "EPSG", "code": 4326},
+    },
+    "wkt": (
+        'GEOGCRS["WGS 84",ENSEMBLE["World Geodetic System 1984 ensemble",'
+        'MEMBER["World Geodetic System 1984 (Transit)"],'
+        'MEMBER["World Geodetic System 1984 (G730)"],'
+        'MEMBER["World Geodetic System 1984 (G873)"],'
+        'MEMBER["World Geodetic System 1984 (G1150)"],'
+        'MEMBER["World Geodetic System 1984 (G1674)"],'
+        'MEMBER["World Geodetic System 1984 (G1762)"],'
+        'ELLIPSOID["WGS 84",6378137,298.257223563,LENGTHUNIT["metre",1]],'
+        "ENSEMBLEACCURACY[2.0]],"
+        'PRIMEM["Greenwich",0,ANGLEUNIT["degree",0.0174532925199433]],'
+        "CS[ellipsoidal,2],"
+        'AXIS["geodetic latitude (Lat)",north,ORDER[1],ANGLEUNIT["degree",0.0174532925199433]],'
+        'AXIS["geodetic longitude (Lon)",east,ORDER[2],ANGLEUNIT["degree",0.0174532925199433]],'
+        'USAGE[SCOPE["Horizontal component of 3D system."],AREA["World."],BBOX[-90,-180,90,180]],'
+        'ID["EPSG",4326]]'
+    ),
+    "url": "http://www.opengis.net/def/crs/EPSG/0/4326",
+}
+
+
+@pytest.mark.parametrize("crs_member", ["projjson", "wkt", "url"])
+def test_zarr_read_crs(tmp_vsimem, crs_member):
 
-    zattrs = {"_CRS": {crs_member: zattrs_all["_CRS"][crs_member]}}
+    zattrs = {"_CRS": {crs_member: _ZARR_CRS_4326[crs_member]}}
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(zarray))
+    gdal.FileFromMemBuffer(
+        tmp_vsimem / "test.zarr/.zarray", json.dumps(_VALID_ZARRAY_V2)
+    )
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zattrs", json.dumps(zattrs))
     ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
     rg = ds.GetRootGroup()
@@ -1094,10 +998,17 @@ def test_zarr_read_crs(tmp_vsimem, crs_member):
     assert srs.GetDataAxisToSRSAxisMapping() == [2, 1]
 
 
-@pytest.mark.parametrize("use_get_names", [True, False])
-def test_zarr_read_group(use_get_names):
+@pytest.mark.parametrize(
+    "filename,use_get_names",
+    [
+        ("data/zarr/group.zarr", True),
+        ("data/zarr/group.zarr", False),
+        ("data/zarr/group_with_zmetadata.zarr", True),
+    ],
+)
+def test_zarr_read_group(filename, use_get_names):
 
-    filename = "data/zarr/group.zarr"
+    with_zmetadata = "zmetadata" in filename
     ds = gdal.Open(filename, gdal.OF_MULTIDIM_RASTER)
     assert ds is not None
     rg = ds.GetRootGroup()
@@ -1122,44 +1033,31 @@ def test_zarr_read_group(use_get_names):
     assert subsubgroup.GetFullName() == "/foo/bar"
     if use_get_names:
         assert subsubgroup.GetMDArrayNames() == ["baz"]
+    if with_zmetadata:
+        assert subsubgroup.GetAttribute("foo") is not None
     ar = subsubgroup.OpenMDArray("baz")
     assert subsubgroup.GetMDArrayNames() == ["baz"]
     assert ar is not None
     assert ar.Read() == array.array("i", [1])
+    if with_zmetadata:
+        assert ar.GetAttribute("bar") is not None
     assert subsubgroup.OpenMDArray("not_existing") is None
 
 
-def test_zarr_read_group_with_zmetadata():
+# Check GetGroupNames() and GetMDArrayNames() on the same group
+def test_zarr_read_group_and_array_names(tmp_vsimem):
 
-    filename = "data/zarr/group_with_zmetadata.zarr"
-    ds = gdal.Open(filename, gdal.OF_MULTIDIM_RASTER)
+    zgroup = json.dumps({"zarr_format": 2})
+    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zgroup", zgroup)
+    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/subgroup/.zgroup", zgroup)
+    zarray = json.dumps(_VALID_ZARRAY_V2)
+    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/ar/.zarray", zarray)
+
+    ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
     assert ds is not None
     rg = ds.GetRootGroup()
-    assert rg.GetName() == "/"
-    assert rg.GetFullName() == "/"
-    assert rg.GetGroupNames() == ["foo"]
-    assert len(rg.GetAttributes()) == 1
-    assert rg.GetAttribute("key") is not None
-    subgroup = rg.OpenGroup("foo")
-    assert subgroup is not None
-    assert rg.OpenGroup("not_existing") is None
-    assert subgroup.GetName() == "foo"
-    assert subgroup.GetFullName() == "/foo"
-    assert len(rg.GetMDArrayNames()) == 0
-    assert subgroup.GetGroupNames() == ["bar"]
-    assert subgroup.GetAttributes() == []
-    subsubgroup = subgroup.OpenGroup("bar")
-    assert subgroup.GetGroupNames() == ["bar"]
-    assert subsubgroup.GetName() == "bar"
-    assert subsubgroup.GetFullName() == "/foo/bar"
-    assert subsubgroup.GetMDArrayNames() == ["baz"]
-    assert subsubgroup.GetAttribute("foo") is not None
-    ar = subsubgroup.OpenMDArray("baz")
-    assert subsubgroup.GetMDArrayNames() == ["baz"]
-    assert ar is not None
-    assert ar.Read() == array.array("i", [1])
-    assert ar.GetAttribute("bar") is not None
-    assert subsubgroup.OpenMDArray("not_existing") is None
+    assert rg.GetGroupNames() == ["subgroup"]
+    assert rg.GetMDArrayNames() == ["ar"]
 
 
 @pytest.mark.parametrize(
@@ -1174,13 +1072,18 @@ def test_zarr_read_group_with_zmetadata():
 )
 def test_zarr_read_ARRAY_DIMENSIONS(use_zmetadata, filename):
 
-    ds = gdal.Open(
-        filename,
-        gdal.OF_MULTIDIM_RASTER,
-        open_options=["USE_ZMETADATA=" + str(use_zmetadata)],
-    )
-    assert ds is not None
-    rg = ds.GetRootGroup()
+    # Each check starts from a freshly opened dataset, as the dimensions that
+    # are discovered depend on which arrays have been opened before
+    def get_root_group():
+        ds = gdal.Open(
+            filename,
+            gdal.OF_MULTIDIM_RASTER,
+            open_options=["USE_ZMETADATA=" + str(use_zmetadata)],
+        )
+        assert ds is not None
+        return ds.GetRootGroup()
+
+    rg = get_root_group()
     if filename != "data/zarr/array_dimensions_upper_level.zarr":
         ar = rg.OpenMDArray("var")
     else:
@@ -1200,13 +1103,7 @@ def test_zarr_read_ARRAY_DIMENSIONS(use_zmetadata, filename):
     assert dims[1].GetDirection() == "EAST"
     assert len(rg.GetDimensions()) == 2
 
-    ds = gdal.Open(
-        filename,
-        gdal.OF_MULTIDIM_RASTER,
-        open_options=["USE_ZMETADATA=" + str(use_zmetadata)],
-    )
-    assert ds is not None
-    rg = ds.GetRootGroup()
+    rg = get_root_group()
     ar = rg.OpenMDArray("lat")
     assert ar
     dims = ar.GetDimensions()
@@ -1217,13 +1114,7 @@ def test_zarr_read_ARRAY_DIMENSIONS(use_zmetadata, filename):
     assert dims[0].GetType() == gdal.DIM_TYPE_HORIZONTAL_Y
     assert len(rg.GetDimensions()) == 2
 
-    ds = gdal.Open(
-        filename,
-        gdal.OF_MULTIDIM_RASTER,
-        open_options=["USE_ZMETADATA=" + str(use_zmetadata)],
-    )
-    assert ds is not None
-    rg = ds.GetRootGroup()
+    rg = get_root_group()
     assert len(rg.GetDimensions()) == 2
 
 
@@ -1252,7 +1143,7 @@ def test_zarr_read_v3(ds_name, use_get_names):
 
     ar = rg.OpenMDArray("ar")
     assert ar
-    assert ar.Read() == array.array("b", [1, 2])
+    assert ar.Read() == bytes([1, 2])
 
     if use_get_names:
         assert subgroup.GetGroupNames() == ["paranoid"]
@@ -1266,7 +1157,7 @@ def test_zarr_read_v3(ds_name, use_get_names):
         assert subgroup.GetMDArrayNames() == ["android"]
     ar = subgroup.OpenMDArray("android")
     assert ar is not None
-    assert ar.Read() == array.array("b", [1] * 4 * 5)
+    assert ar.Read() == b"\x01" * (4 * 5)
     assert subgroup.OpenMDArray("not_existing") is None
 
 
@@ -1332,12 +1223,12 @@ def test_zarr_read_classic():
     ds = gdal.Open("data/zarr/zlib.zarr")
     assert ds
     assert not ds.GetSubDatasets()
-    assert ds.ReadRaster() == array.array("b", [1, 2])
+    assert ds.ReadRaster() == bytes([1, 2])
 
     ds = gdal.Open("ZARR:data/zarr/zlib.zarr")
     assert ds
     assert not ds.GetSubDatasets()
-    assert ds.ReadRaster() == array.array("b", [1, 2])
+    assert ds.ReadRaster() == bytes([1, 2])
 
     with gdal.quiet_errors():
         assert gdal.Open('ZARR:"data/zarr/not_existing.zarr"') is None
@@ -1347,7 +1238,7 @@ def test_zarr_read_classic():
     ds = gdal.Open('ZARR:"data/zarr/zlib.zarr":/zlib')
     assert ds
     assert not ds.GetSubDatasets()
-    assert ds.ReadRaster() == array.array("b", [1, 2])
+    assert ds.ReadRaster() == bytes([1, 2])
 
     ds = gdal.Open("data/zarr/order_f_u1_3d.zarr", open_options=["MULTIBAND=NO"])
     assert ds
@@ -1355,10 +1246,10 @@ def test_zarr_read_classic():
     assert len(subds) == 2
     ds = gdal.Open(subds[0][0])
     assert ds
-    assert ds.ReadRaster() == array.array("b", [i for i in range(12)])
+    assert ds.ReadRaster() == bytes(range(12))
     ds = gdal.Open(subds[1][0])
     assert ds
-    assert ds.ReadRaster() == array.array("b", [12 + i for i in range(12)])
+    assert ds.ReadRaster() == bytes(range(12, 24))
 
     with gdal.quiet_errors():
         assert (
@@ -1374,37 +1265,32 @@ def test_zarr_read_classic():
     ds = gdal.Open("data/zarr/v3/test.zr3", open_options=["LIST_ALL_ARRAYS=YES"])
     assert ds
     subds = ds.GetSubDatasets()
-    assert set(subds) == set(
-        [
-            ('ZARR:"data/zarr/v3/test.zr3":/ar', "[2] /ar (Byte)"),
-            (
-                'ZARR:"data/zarr/v3/test.zr3":/marvin/android',
-                "[5x4] /marvin/android (Byte)",
-            ),
-        ]
-    )
+    assert sorted(subds) == [
+        ('ZARR:"data/zarr/v3/test.zr3":/ar', "[2] /ar (Byte)"),
+        (
+            'ZARR:"data/zarr/v3/test.zr3":/marvin/android',
+            "[5x4] /marvin/android (Byte)",
+        ),
+    ]
     ds = gdal.Open('ZARR:"data/zarr/v3/test.zr3":/ar')
     assert ds
-    assert ds.ReadRaster() == array.array("b", [1, 2])
+    assert ds.ReadRaster() == bytes([1, 2])
 
     ds = gdal.Open("data/zarr/v3/test.zr3")
     assert ds
     subds = ds.GetSubDatasets()
-    assert set(subds) == set(
-        [
-            (
-                'ZARR:"data/zarr/v3/test.zr3":/marvin/android',
-                "[5x4] /marvin/android (Byte)",
-            ),
-        ]
-    )
+    assert sorted(subds) == [
+        (
+            'ZARR:"data/zarr/v3/test.zr3":/marvin/android',
+            "[5x4] /marvin/android (Byte)",
+        ),
+    ]
 
 
-def test_zarr_read_classic_2d(tmp_vsimem):
+def test_zarr_read_classic_2d(tmp_vsimem, zarr_drv, byte_tif_ds):
 
-    src_ds = gdal.Open("data/byte.tif")
-    gdal.GetDriverByName("ZARR").CreateCopy(
-        tmp_vsimem / "test.zarr", src_ds, strict=False, options=["FORMAT=ZARR_V2"]
+    zarr_drv.CreateCopy(
+        tmp_vsimem / "test.zarr", byte_tif_ds, strict=False, options=["FORMAT=ZARR_V2"]
     )
     ds = gdal.Open(tmp_vsimem / "test.zarr")
     assert ds is not None
@@ -1414,9 +1300,9 @@ def test_zarr_read_classic_2d(tmp_vsimem):
     ds = None
 
 
-def test_zarr_read_classic_2d_with_unrelated_auxiliary_1D_arrays(tmp_vsimem):
+def test_zarr_read_classic_2d_with_unrelated_auxiliary_1D_arrays(tmp_vsimem, zarr_drv):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V2"]
         )
         assert ds is not None
@@ -1427,7 +1313,7 @@ def test_zarr_read_classic_2d_with_unrelated_auxiliary_1D_arrays(tmp_vsimem):
         dim0 = rg.CreateDimension("dim0", None, None, 2)
         dim1 = rg.CreateDimension("dim1", None, None, 3)
 
-        dt = gdal.ExtendedDataType.Create(gdal.GDT_Float64)
+        dt = _float64_dt
         rg.CreateMDArray("main_array", [dim0, dim1], dt)
         rg.CreateMDArray("x", [dim0], dt)
         rg.CreateMDArray("y", [dim1], dt)
@@ -1438,22 +1324,20 @@ def test_zarr_read_classic_2d_with_unrelated_auxiliary_1D_arrays(tmp_vsimem):
     assert ds is not None
     assert ds.RasterYSize == 2
     assert ds.RasterXSize == 3
-    assert set(ds.GetSubDatasets()) == set(
-        [(f'ZARR:"{tmp_vsimem}/test.zarr":/main_array', "[2x3] /main_array (Float64)")]
-    )
+    assert sorted(ds.GetSubDatasets()) == [
+        (f'ZARR:"{tmp_vsimem}/test.zarr":/main_array', "[2x3] /main_array (Float64)")
+    ]
     ds = None
 
     ds = gdal.Open(tmp_vsimem / "test.zarr", open_options=["LIST_ALL_ARRAYS=YES"])
-    assert set(ds.GetSubDatasets()) == set(
-        [
-            (
-                f'ZARR:"{tmp_vsimem}/test.zarr":/main_array',
-                "[2x3] /main_array (Float64)",
-            ),
-            (f'ZARR:"{tmp_vsimem}/test.zarr":/x', "[2] /x (Float64)"),
-            (f'ZARR:"{tmp_vsimem}/test.zarr":/y', "[3] /y (Float64)"),
-        ]
-    )
+    assert sorted(ds.GetSubDatasets()) == [
+        (
+            f'ZARR:"{tmp_vsimem}/test.zarr":/main_array',
+            "[2x3] /main_array (Float64)",
+        ),
+        (f'ZARR:"{tmp_vsimem}/test.zarr":/x', "[2] /x (Float64)"),
+        (f'ZARR:"{tmp_vsimem}/test.zarr":/y', "[3] /y (Float64)"),
+    ]
     ds = None
 
 
@@ -1464,40 +1348,24 @@ def test_zarr_read_classic_3d_multiband():
     assert ds.RasterYSize == 3
     assert ds.RasterCount == 2
     assert not ds.GetSubDatasets()
-    assert ds.GetRasterBand(1).ReadRaster() == array.array("b", [i for i in range(12)])
-    assert ds.GetRasterBand(2).ReadRaster() == array.array(
-        "b", [12 + i for i in range(12)]
-    )
-
-    ds = gdal.Open(
-        "data/zarr/order_f_u1_3d.zarr",
-        open_options=["MULTIBAND=YES", "DIM_X=dim1", "DIM_Y=dim2"],
-    )
-    assert ds.RasterXSize == 3
-    assert ds.RasterYSize == 4
-    assert ds.RasterCount == 2
-    assert not ds.GetSubDatasets()
-    assert ds.GetRasterBand(1).ReadRaster() == array.array(
-        "b", [0, 4, 8, 1, 5, 9, 2, 6, 10, 3, 7, 11]
-    )
-    assert ds.GetRasterBand(2).ReadRaster() == array.array(
-        "b", [(x + 12) for x in [0, 4, 8, 1, 5, 9, 2, 6, 10, 3, 7, 11]]
-    )
-
-    ds = gdal.Open(
-        "data/zarr/order_f_u1_3d.zarr",
-        open_options=["MULTIBAND=YES", "DIM_X=1", "DIM_Y=2"],
-    )
-    assert ds.RasterXSize == 3
-    assert ds.RasterYSize == 4
-    assert ds.RasterCount == 2
-    assert not ds.GetSubDatasets()
-    assert ds.GetRasterBand(1).ReadRaster() == array.array(
-        "b", [0, 4, 8, 1, 5, 9, 2, 6, 10, 3, 7, 11]
-    )
-    assert ds.GetRasterBand(2).ReadRaster() == array.array(
-        "b", [(x + 12) for x in [0, 4, 8, 1, 5, 9, 2, 6, 10, 3, 7, 11]]
-    )
+    assert ds.GetRasterBand(1).ReadRaster() == bytes(range(12))
+    assert ds.GetRasterBand(2).ReadRaster() == bytes(range(12, 24))
+
+    # Same bands with X and Y swapped, the dimensions being selected by name
+    # or by index
+    transposed_band_1 = bytes([0, 4, 8, 1, 5, 9, 2, 6, 10, 3, 7, 11])
+    transposed_band_2 = bytes(x + 12 for x in transposed_band_1)
+    for dim_options in (["DIM_X=dim1", "DIM_Y=dim2"], ["DIM_X=1", "DIM_Y=2"]):
+        ds = gdal.Open(
+            "data/zarr/order_f_u1_3d.zarr",
+            open_options=["MULTIBAND=YES"] + dim_options,
+        )
+        assert ds.RasterXSize == 3
+        assert ds.RasterYSize == 4
+        assert ds.RasterCount == 2
+        assert not ds.GetSubDatasets()
+        assert ds.GetRasterBand(1).ReadRaster() == transposed_band_1
+        assert ds.GetRasterBand(2).ReadRaster() == transposed_band_2
 
     gdal.ErrorReset()
     with gdaltest.error_handler():
@@ -1530,21 +1398,39 @@ def test_zarr_read_classic_3d_multiband():
     assert gdal.GetLastErrorMsg() != ""
 
 
-def test_zarr_read_classic_too_many_samples_3d(tmp_vsimem):
+def _create_single_chunk_zarr_v2_array(path, shape):
+    """Create an uncompressed UInt8 Zarr V2 array made of a single (missing) chunk"""
+    j = {**_VALID_ZARRAY_V2, "chunks": shape, "dtype": "!u1", "shape": shape}
+    gdal.FileFromMemBuffer(path / ".zarray", json.dumps(j))
 
-    j = {
-        "chunks": [65537, 2, 1],
-        "compressor": None,
-        "dtype": "!u1",
-        "fill_value": None,
-        "filters": None,
-        "order": "C",
-        "shape": [65537, 2, 1],
-        "zarr_format": 2,
-    }
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
+def _read_json(path):
+    """Parse a JSON metadata file written by the driver"""
+    with gdal.VSIFile(path, "rb") as f:
+        return json.loads(f.read())
+
+
+def _write_json(path, j):
+    """Write a JSON metadata file in compact form for the driver to read"""
+    gdal.FileFromMemBuffer(path, json.dumps(j, separators=(",", ":")))
+
+
+def _create_zarr_root_group(zarr_drv, path, format, dim_sizes=()):
+    """Create a Zarr dataset with dimensions dim0, dim1... in its root group"""
+    ds = zarr_drv.CreateMultiDimensional(path, options=["FORMAT=" + format])
+    assert ds is not None
+    rg = ds.GetRootGroup()
+    assert rg
+    dims = [
+        rg.CreateDimension("dim%d" % i, None, None, size)
+        for i, size in enumerate(dim_sizes)
+    ]
+    return ds, rg, dims
+
+
+def test_zarr_read_classic_too_many_samples_3d(tmp_vsimem):
+
+    _create_single_chunk_zarr_v2_array(tmp_vsimem / "test.zarr", [65537, 2, 1])
     gdal.ErrorReset()
     with gdal.quiet_errors():
         ds = gdal.Open(tmp_vsimem / "test.zarr", open_options=["MULTIBAND=NO"])
@@ -1560,17 +1446,17 @@ def test_zarr_read_classic_too_many_samples_3d(tmp_vsimem):
 
 
 @pytest.mark.parametrize("interleave", ["BAND", "PIXEL"])
-def test_zarr_write_single_array_3d(tmp_vsimem, interleave):
+def test_zarr_write_single_array_3d(tmp_vsimem, interleave, zarr_drv, rgbsmall_ds):
 
-    src_ds = gdal.Open("data/rgbsmall.tif")
-    gdal.GetDriverByName("ZARR").CreateCopy(
+    zarr_drv.CreateCopy(
         tmp_vsimem / "test.zarr",
-        src_ds,
+        rgbsmall_ds,
         options=["INTERLEAVE=" + interleave, "FORMAT=ZARR_V2"],
     )
     ds = gdal.Open(tmp_vsimem / "test.zarr")
     assert [ds.GetRasterBand(i + 1).Checksum() for i in range(ds.RasterCount)] == [
-        src_ds.GetRasterBand(i + 1).Checksum() for i in range(src_ds.RasterCount)
+        rgbsmall_ds.GetRasterBand(i + 1).Checksum()
+        for i in range(rgbsmall_ds.RasterCount)
     ]
     assert [
         ds.GetRasterBand(i + 1).GetColorInterpretation() for i in range(ds.RasterCount)
@@ -1579,41 +1465,17 @@ def test_zarr_write_single_array_3d(tmp_vsimem, interleave):
 
 def test_zarr_read_classic_4d(tmp_vsimem):
 
-    j = {
-        "chunks": [3, 2, 1, 1],
-        "compressor": None,
-        "dtype": "!u1",
-        "fill_value": None,
-        "filters": None,
-        "order": "C",
-        "shape": [3, 2, 1, 1],
-        "zarr_format": 2,
-    }
-
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
+    _create_single_chunk_zarr_v2_array(tmp_vsimem / "test.zarr", [3, 2, 1, 1])
     ds = gdal.Open(tmp_vsimem / "test.zarr", open_options=["MULTIBAND=NO"])
     subds = ds.GetSubDatasets()
     assert len(subds) == 6
-    for i in range(len(subds)):
-        assert gdal.Open(subds[i][0]) is not None
+    for subds_name, _ in subds:
+        assert gdal.Open(subds_name) is not None, subds_name
 
 
 def test_zarr_read_classic_too_many_samples_4d(tmp_vsimem):
 
-    j = {
-        "chunks": [257, 256, 1, 1],
-        "compressor": None,
-        "dtype": "!u1",
-        "fill_value": None,
-        "filters": None,
-        "order": "C",
-        "shape": [257, 256, 1, 1],
-        "zarr_format": 2,
-    }
-
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
+    _create_single_chunk_zarr_v2_array(tmp_vsimem / "test.zarr", [257, 256, 1, 1])
     gdal.ErrorReset()
     with gdal.quiet_errors():
         ds = gdal.Open(tmp_vsimem / "test.zarr", open_options=["MULTIBAND=NO"])
@@ -1629,24 +1491,24 @@ def test_zarr_read_empty_shape():
     assert rg
     ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
     assert ar
-    assert ar.Read() == array.array("b", [120])
+    assert ar.Read() == bytes([120])
 
 
-def test_zarr_read_BLOSC_COMPRESSORS():
+def test_zarr_read_BLOSC_COMPRESSORS(zarr_drv, zarr_compressors):
 
-    if "blosc" not in gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS"):
+    if "blosc" not in zarr_compressors:
         pytest.skip("blosc not available")
-    assert "lz4" in gdal.GetDriverByName("Zarr").GetMetadataItem("BLOSC_COMPRESSORS")
+    assert "lz4" in zarr_drv.GetMetadataItem("BLOSC_COMPRESSORS")
 
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
 @pytest.mark.parametrize("create_consolidated_metadata", ["YES", "NO"])
-def test_zarr_create_group(tmp_path, format, create_consolidated_metadata):
+def test_zarr_create_group(tmp_path, format, create_consolidated_metadata, zarr_drv):
 
     filename = tmp_path / "test.zarr"
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=[
                 "FORMAT=" + format,
@@ -1658,92 +1520,42 @@ def test_zarr_create_group(tmp_path, format, create_consolidated_metadata):
         assert rg
         assert rg.GetName() == "/"
 
-        attr = rg.CreateAttribute("str_attr", [], gdal.ExtendedDataType.CreateString())
+        attr = rg.CreateAttribute("str_attr", [], _string_dt)
         assert attr
         assert attr.GetFullName() == "/_GLOBAL_/str_attr"
         assert attr.Write("my_string") == gdal.CE_None
 
-        attr = rg.CreateAttribute(
-            "json_attr", [], gdal.ExtendedDataType.CreateString(0, gdal.GEDTST_JSON)
-        )
-        assert attr
-        assert attr.Write({"foo": "bar"}) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "str_array_attr", [2], gdal.ExtendedDataType.CreateString()
-        )
-        assert attr
-        assert attr.Write(["first_string", "second_string"]) == gdal.CE_None
-
         with gdal.quiet_errors():
-            attr = rg.CreateAttribute(
-                "dim_2_not_supported", [2, 2], gdal.ExtendedDataType.CreateString()
-            )
+            attr = rg.CreateAttribute("dim_2_not_supported", [2, 2], _string_dt)
             assert attr is None
 
-        attr = rg.CreateAttribute(
-            "int_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_Int32)
-        )
-        assert attr
-        assert attr.Write(12345678) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "uint_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt32)
-        )
-        assert attr
-        assert attr.Write(4000000000) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "int64_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_Int64)
-        )
-        assert attr
-        assert attr.Write(12345678901234) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "uint64_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt64)
-        )
-        assert attr
-        # We cannot write UINT64_MAX
-        # assert attr.Write(18000000000000000000) == gdal.CE_None
-        assert attr.Write(9000000000000000000) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "int_array_attr", [2], gdal.ExtendedDataType.Create(gdal.GDT_Int32)
-        )
-        assert attr
-        assert attr.Write([12345678, -12345678]) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "uint_array_attr", [2], gdal.ExtendedDataType.Create(gdal.GDT_UInt32)
-        )
-        assert attr
-        assert attr.Write([12345678, 4000000000]) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "int64_array_attr", [2], gdal.ExtendedDataType.Create(gdal.GDT_Int64)
-        )
-        assert attr
-        assert attr.Write([12345678091234, -12345678091234]) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "uint64_array_attr", [2], gdal.ExtendedDataType.Create(gdal.GDT_UInt64)
-        )
-        assert attr
-        # We cannot write UINT64_MAX
-        # assert attr.Write([12345678091234, 18000000000000000000]) == gdal.CE_None
-        assert attr.Write([12345678091234, 9000000000000000000]) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "double_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-        )
-        assert attr
-        assert attr.Write(12345678.5) == gdal.CE_None
-
-        attr = rg.CreateAttribute(
-            "double_array_attr", [2], gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-        )
-        assert attr
-        assert attr.Write([12345678.5, -12345678.5]) == gdal.CE_None
+        json_dt = gdal.ExtendedDataType.CreateString(0, gdal.GEDTST_JSON)
+        uint32_dt = gdal.ExtendedDataType.Create(gdal.GDT_UInt32)
+        int64_dt = gdal.ExtendedDataType.Create(gdal.GDT_Int64)
+        uint64_dt = gdal.ExtendedDataType.Create(gdal.GDT_UInt64)
+        for name, dims, dt, value in [
+            ("json_attr", [], json_dt, {"foo": "bar"}),
+            ("str_array_attr", [2], _string_dt, ["first_string", "second_string"]),
+            ("int_attr", [], _int32_dt, 12345678),
+            ("uint_attr", [], uint32_dt, 4000000000),
+            ("int64_attr", [], int64_dt, 12345678901234),
+            # We cannot write UINT64_MAX (18000000000000000000)
+            ("uint64_attr", [], uint64_dt, 9000000000000000000),
+            ("int_array_attr", [2], _int32_dt, [12345678, -12345678]),
+            ("uint_array_attr", [2], uint32_dt, [12345678, 4000000000]),
+            ("int64_array_attr", [2], int64_dt, [12345678091234, -12345678091234]),
+            (
+                "uint64_array_attr",
+                [2],
+                uint64_dt,
+                [12345678091234, 9000000000000000000],
+            ),
+            ("double_attr", [], _float64_dt, 12345678.5),
+            ("double_array_attr", [2], _float64_dt, [12345678.5, -12345678.5]),
+        ]:
+            attr = rg.CreateAttribute(name, dims, dt)
+            assert attr, name
+            assert attr.Write(value) == gdal.CE_None, name
 
         subgroup = rg.CreateGroup("foo")
         assert subgroup
@@ -1756,12 +1568,9 @@ def test_zarr_create_group(tmp_path, format, create_consolidated_metadata):
     create()
 
     if create_consolidated_metadata == "YES":
-        with gdal.VSIFile(
-            filename / ".zmetadata" if format == "ZARR_V2" else filename / "zarr.json",
-            "rb",
-        ) as f:
-            data = f.read()
-        j = json.loads(data)
+        j = _read_json(
+            filename / ".zmetadata" if format == "ZARR_V2" else filename / "zarr.json"
+        )
         if format == "ZARR_V2":
             assert "foo/.zgroup" in j["metadata"]
             assert ".zattrs" in j["metadata"]
@@ -1778,9 +1587,7 @@ def test_zarr_create_group(tmp_path, format, create_consolidated_metadata):
         if format == "ZARR_V2":
             assert gdal.VSIStatL(filename / ".zmetadata") is None
         else:
-            with gdal.VSIFile(filename / "zarr.json", "rb") as f:
-                data = f.read()
-            j = json.loads(data)
+            j = _read_json(filename / "zarr.json")
             assert "consolidated_metadata" not in j
 
     def update():
@@ -1799,7 +1606,7 @@ def test_zarr_create_group(tmp_path, format, create_consolidated_metadata):
         assert subgroup
         subgroup = rg.CreateGroup("bar")
         assert subgroup
-        assert set(rg.GetGroupNames()) == set(["foo", "bar"])
+        assert set(rg.GetGroupNames()) == {"foo", "bar"}
         subgroup = rg.OpenGroup("foo")
         assert subgroup
         subsubgroup = subgroup.CreateGroup("baz")
@@ -1887,14 +1694,14 @@ def test_zarr_create_group(tmp_path, format, create_consolidated_metadata):
         assert attr.GetDataType().GetNumericDataType() == gdal.GDT_Float64
         assert attr.Read() == (12345678.5, -12345678.5)
 
-        assert set(rg.GetGroupNames()) == set(["foo", "bar"])
+        assert set(rg.GetGroupNames()) == {"foo", "bar"}
         with gdal.quiet_errors():
             assert rg.CreateGroup("not_opened_in_update_mode") is None
             assert (
                 rg.CreateAttribute(
                     "not_opened_in_update_mode",
                     [],
-                    gdal.ExtendedDataType.CreateString(),
+                    _string_dt,
                 )
                 is None
             )
@@ -1932,9 +1739,9 @@ def test_zarr_create_group(tmp_path, format, create_consolidated_metadata):
     ],
 )
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create_group_errors(tmp_vsimem, group_name, format):
+def test_zarr_create_group_errors(tmp_vsimem, group_name, format, zarr_drv):
     def at_creation():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=" + format]
         )
         assert ds is not None
@@ -1961,48 +1768,50 @@ def test_zarr_create_group_errors(tmp_vsimem, group_name, format):
 
 
 def getCompoundDT():
-    x = gdal.EDTComponent.Create("x", 0, gdal.ExtendedDataType.Create(gdal.GDT_Int16))
-    y = gdal.EDTComponent.Create("y", 0, gdal.ExtendedDataType.Create(gdal.GDT_Int32))
+    x = gdal.EDTComponent.Create("x", 0, _int16_dt)
+    y = gdal.EDTComponent.Create("y", 0, _int32_dt)
     subcompound = gdal.ExtendedDataType.CreateCompound("", 4, [y])
     subcompound_component = gdal.EDTComponent.Create("y", 4, subcompound)
     return gdal.ExtendedDataType.CreateCompound("", 8, [x, subcompound_component])
 
 
+# Shared by the two compound and fixed size string data type cases of
+# test_zarr_create_array
+_compound_dt = getCompoundDT()
+_string10_dt = gdal.ExtendedDataType.CreateString(10)
+
+
 @pytest.mark.parametrize(
     "datatype,nodata",
     [
-        [gdal.ExtendedDataType.Create(gdal.GDT_UInt8), None],
-        [gdal.ExtendedDataType.Create(gdal.GDT_UInt8), 1],
+        [_uint8_dt, None],
+        [_uint8_dt, 1],
         [gdal.ExtendedDataType.Create(gdal.GDT_UInt16), None],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Int16), None],
+        [_int16_dt, None],
         [gdal.ExtendedDataType.Create(gdal.GDT_UInt32), None],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Int32), None],
+        [_int32_dt, None],
         [gdal.ExtendedDataType.Create(gdal.GDT_Float16), None],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Float32), None],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Float64), None],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Float64), 1.5],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Float64), float("nan")],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Float64), float("infinity")],
-        [gdal.ExtendedDataType.Create(gdal.GDT_Float64), float("-infinity")],
+        [_float32_dt, None],
+        [_float64_dt, None],
+        [_float64_dt, 1.5],
+        [_float64_dt, float("nan")],
+        [_float64_dt, float("infinity")],
+        [_float64_dt, float("-infinity")],
         [gdal.ExtendedDataType.Create(gdal.GDT_CInt16), None],
         [gdal.ExtendedDataType.Create(gdal.GDT_CInt32), None],
         # CFloat16 is not yet supported in Python
         # [gdal.ExtendedDataType.Create(gdal.GDT_CFloat16), None],
         [gdal.ExtendedDataType.Create(gdal.GDT_CFloat32), None],
-        [gdal.ExtendedDataType.Create(gdal.GDT_CFloat64), None],
-        [gdal.ExtendedDataType.CreateString(10), None],
-        [gdal.ExtendedDataType.CreateString(10), "ab"],
-        [getCompoundDT(), None],
-        [
-            getCompoundDT(),
-            bytes(array.array("h", [12]))
-            + bytes(array.array("h", [0]))
-            + bytes(array.array("i", [2345678])),  # padding
-        ],
+        [_cfloat64_dt, None],
+        [_string10_dt, None],
+        [_string10_dt, "ab"],
+        [_compound_dt, None],
+        # x, padding, y.y in native order, as the compound type is laid out
+        [_compound_dt, struct.pack("hhi", 12, 0, 2345678)],
     ],
 )
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create_array(tmp_vsimem, datatype, nodata, format):
+def test_zarr_create_array(tmp_vsimem, datatype, nodata, format, zarr_drv):
 
     error_expected = False
     if datatype.GetNumericDataType() in (gdal.GDT_CInt16, gdal.GDT_CInt32):
@@ -2014,17 +1823,11 @@ def test_zarr_create_array(tmp_vsimem, datatype, nodata, format):
         error_expected = True
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            tmp_vsimem / "test.zarr", options=["FORMAT=" + format]
+        ds, rg, (dim0, dim1) = _create_zarr_root_group(
+            zarr_drv, tmp_vsimem / "test.zarr", format, [2, 3]
         )
-        assert ds is not None
-        rg = ds.GetRootGroup()
-        assert rg
         assert rg.GetName() == "/"
 
-        dim0 = rg.CreateDimension("dim0", None, None, 2)
-        dim1 = rg.CreateDimension("dim1", None, None, 3)
-
         if error_expected:
             with gdal.quiet_errors():
                 ar = rg.CreateMDArray("my_ar", [dim0, dim1], datatype)
@@ -2104,26 +1907,18 @@ def test_zarr_create_array(tmp_vsimem, datatype, nodata, format):
     ],
 )
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create_array_errors(tmp_vsimem, array_name, format):
+def test_zarr_create_array_errors(tmp_vsimem, array_name, format, zarr_drv):
     def at_creation():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=" + format]
         )
         assert ds is not None
         rg = ds.GetRootGroup()
         assert rg
-        assert (
-            rg.CreateMDArray("foo", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
-            is not None
-        )
+        assert rg.CreateMDArray("foo", [], _uint8_dt) is not None
         gdal.Mkdir(tmp_vsimem / "test.zarr/directory_with_that_name", 0)
         with gdal.quiet_errors():
-            assert (
-                rg.CreateMDArray(
-                    array_name, [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-                )
-                is None
-            )
+            assert rg.CreateMDArray(array_name, [], _uint8_dt) is None
 
     at_creation()
 
@@ -2134,47 +1929,57 @@ def test_zarr_create_array_errors(tmp_vsimem, array_name, format):
         rg = ds.GetRootGroup()
         gdal.Mkdir(tmp_vsimem / "test.zarr/directory_with_that_name", 0)
         with gdal.quiet_errors():
-            assert (
-                rg.CreateMDArray(
-                    array_name, [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-                )
-                is None
-            )
+            assert rg.CreateMDArray(array_name, [], _uint8_dt) is None
 
     after_reopen()
 
 
+def _has_zarr_compressor(compressor):
+    drv = gdal.GetDriverByName("ZARR")
+    if drv is None:
+        return False
+    return compressor in drv.GetMetadataItem("COMPRESSORS").split(",")
+
+
+def _compressor_param(compressor, options, expected_json):
+    """Test case skipped at collection time if the compressor is not available"""
+    return pytest.param(
+        compressor,
+        options,
+        expected_json,
+        marks=pytest.mark.skipif(
+            compressor != "NONE" and not _has_zarr_compressor(compressor),
+            reason="compressor %s not available" % compressor,
+        ),
+    )
+
+
 @pytest.mark.parametrize(
     "compressor,options,expected_json",
     [
-        ["NONE", [], None],
-        ["zlib", [], {"id": "zlib", "level": 6}],
-        ["zlib", ["ZLIB_LEVEL=1"], {"id": "zlib", "level": 1}],
-        [
+        _compressor_param("NONE", [], None),
+        _compressor_param("zlib", [], {"id": "zlib", "level": 6}),
+        _compressor_param("zlib", ["ZLIB_LEVEL=1"], {"id": "zlib", "level": 1}),
+        _compressor_param(
             "blosc",
             [],
             {"blocksize": 0, "clevel": 5, "cname": "lz4", "id": "blosc", "shuffle": 1},
-        ],
+        ),
     ],
 )
-def test_zarr_create_array_compressor(tmp_vsimem, compressor, options, expected_json):
-
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if compressor != "NONE" and compressor not in compressors:
-        pytest.skip("compressor %s not available" % compressor)
+def test_zarr_create_array_compressor(
+    tmp_vsimem, compressor, options, expected_json, zarr_drv
+):
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V2"]
+        ds, rg, _ = _create_zarr_root_group(
+            zarr_drv, tmp_vsimem / "test.zarr", "ZARR_V2"
         )
-        assert ds is not None
-        rg = ds.GetRootGroup()
-        assert rg
         assert (
             rg.CreateMDArray(
                 "test",
                 [],
-                gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+                _uint8_dt,
                 ["COMPRESS=" + compressor] + options,
             )
             is not None
@@ -2182,35 +1987,33 @@ def test_zarr_create_array_compressor(tmp_vsimem, compressor, options, expected_
 
     create()
 
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/.zarray", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 1000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr/test/.zarray")
     assert j["compressor"] == expected_json
 
 
 @pytest.mark.parametrize(
     "compressor,options,expected_json",
     [
-        ["NONE", [], [{"name": "bytes", "configuration": {"endian": "little"}}]],
-        [
+        _compressor_param(
+            "NONE", [], [{"name": "bytes", "configuration": {"endian": "little"}}]
+        ),
+        _compressor_param(
             "gzip",
             [],
             [
                 {"name": "bytes", "configuration": {"endian": "little"}},
                 {"name": "gzip", "configuration": {"level": 6}},
             ],
-        ],
-        [
+        ),
+        _compressor_param(
             "gzip",
             ["GZIP_LEVEL=1"],
             [
                 {"name": "bytes", "configuration": {"endian": "little"}},
                 {"name": "gzip", "configuration": {"level": 1}},
             ],
-        ],
-        [
+        ),
+        _compressor_param(
             "blosc",
             [],
             [
@@ -2226,8 +2029,8 @@ def test_zarr_create_array_compressor(tmp_vsimem, compressor, options, expected_
                     },
                 },
             ],
-        ],
-        [
+        ),
+        _compressor_param(
             "blosc",
             [
                 "BLOSC_CNAME=zlib",
@@ -2247,56 +2050,44 @@ def test_zarr_create_array_compressor(tmp_vsimem, compressor, options, expected_
                     },
                 },
             ],
-        ],
-        [
+        ),
+        _compressor_param(
             "zstd",
             ["ZSTD_LEVEL=20"],
             [
                 {"name": "bytes", "configuration": {"endian": "little"}},
                 {"name": "zstd", "configuration": {"level": 20, "checksum": False}},
             ],
-        ],
-        [
+        ),
+        _compressor_param(
             "zstd",
             ["ZSTD_CHECKSUM=YES"],
             [
                 {"name": "bytes", "configuration": {"endian": "little"}},
                 {"name": "zstd", "configuration": {"level": 13, "checksum": True}},
             ],
-        ],
+        ),
     ],
 )
 def test_zarr_create_array_compressor_v3(
-    tmp_vsimem, compressor, options, expected_json
+    tmp_vsimem, compressor, options, expected_json, zarr_drv
 ):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if compressor != "NONE" and compressor not in compressors:
-        pytest.skip("compressor %s not available" % compressor)
-
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V3"]
+        ds, rg, dims = _create_zarr_root_group(
+            zarr_drv, tmp_vsimem / "test.zarr", "ZARR_V3", [2]
         )
-        assert ds is not None
-        rg = ds.GetRootGroup()
-        assert rg
-        dim = rg.CreateDimension("dim0", None, None, 2)
         ar = rg.CreateMDArray(
             "test",
-            [dim],
-            gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+            dims,
+            _uint8_dt,
             ["COMPRESS=" + compressor] + options,
         )
         assert ar.Write(array.array("b", [1, 2])) == gdal.CE_None
 
     create()
 
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/zarr.json", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 1000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr/test/zarr.json")
     if expected_json is None:
         assert "codecs" not in j
     else:
@@ -2306,7 +2097,7 @@ def test_zarr_create_array_compressor_v3(
         ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
         rg = ds.GetRootGroup()
         ar = rg.OpenMDArray("test")
-        assert ar.Read() == array.array("b", [1, 2])
+        assert ar.Read() == bytes([1, 2])
 
     read()
 
@@ -2361,352 +2152,138 @@ def test_zarr_create_array_compressor_v3(
     ],
 )
 def test_zarr_create_array_endian_v3(
-    tmp_vsimem, options, expected_json, gdal_data_type
+    tmp_vsimem, options, expected_json, gdal_data_type, zarr_drv
 ):
 
-    array_type = _gdal_data_type_to_array_type[gdal_data_type]
+    data = array.array(_gdal_data_type_to_array_type[gdal_data_type], [1, 2])
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V3"]
+        ds, rg, dims = _create_zarr_root_group(
+            zarr_drv, tmp_vsimem / "test.zarr", "ZARR_V3", [2, 1]
         )
-        assert ds is not None
-        rg = ds.GetRootGroup()
-        assert rg
-        dim0 = rg.CreateDimension("dim0", None, None, 2)
-        dim1 = rg.CreateDimension("dim1", None, None, 1)
         ar = rg.CreateMDArray(
-            "test", [dim0, dim1], gdal.ExtendedDataType.Create(gdal_data_type), options
+            "test", dims, gdal.ExtendedDataType.Create(gdal_data_type), options
         )
-        assert ar.Write(array.array(array_type, [1, 2])) == gdal.CE_None
+        assert ar.Write(data) == gdal.CE_None
 
     create()
 
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/zarr.json", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 1000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr/test/zarr.json")
     assert j["codecs"] == expected_json
 
     def read():
         ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
         rg = ds.GetRootGroup()
         ar = rg.OpenMDArray("test")
-        assert ar.Read() == array.array(array_type, [1, 2])
+        assert ar.Read() == data
 
     read()
 
 
+# Minimal valid Zarr V3 array zarr.json content, altered by tests
+_VALID_ZARR_JSON_V3 = {
+    "zarr_format": 3,
+    "node_type": "array",
+    "shape": [1],
+    "data_type": "uint8",
+    "chunk_grid": {"name": "regular", "configuration": {"chunk_shape": [1]}},
+    "chunk_key_encoding": {"name": "default"},
+    "fill_value": 0,
+}
+
+# Value of a dict_update entry removing the member from the JSON content
+_MISSING = object()
+
+
 @pytest.mark.parametrize(
-    "j, error_msg",
+    "dict_update, error_msg",
     [
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "MISSING_shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "shape missing or not an array",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": "invalid",
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "shape missing or not an array",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1, 2]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "shape and chunks arrays are of different size",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "MISSING_data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "data_type missing",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8_INVALID",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "Invalid or unsupported format for data_type",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "MISSING_chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "chunk_grid missing or not an object",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {"name": "invalid"},
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "Only chunk_grid.name = regular supported",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {"name": "regular"},
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "chunk_grid.configuration.chunk_shape missing or not an array",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "MISSING_chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-            },
-            "chunk_key_encoding missing or not an object",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "invalid"},
-                "fill_value": 0,
-            },
-            "Unsupported chunk_key_encoding.name",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {
-                    "name": "default",
-                    "configuration": {"separator": "invalid"},
-                },
-                "fill_value": 0,
-            },
-            "Separator can only be '/' or '.'",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
-                "storage_transformers": [{}],
-            },
-            "storage_transformers are not supported",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": "invalid",
-            },
-            "Invalid fill_value",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": "0",
-                "dimension_names": "invalid",
-            },
-            "dimension_names should be an array",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": "0",
-                "dimension_names": [],
-            },
-            "Size of dimension_names[] different from the one of shape",
-        ],
-        [
+        ({"shape": _MISSING}, "shape missing or not an array"),
+        ({"shape": "invalid"}, "shape missing or not an array"),
+        (
             {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
                 "chunk_grid": {
                     "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": "NaN",
+                    "configuration": {"chunk_shape": [1, 2]},
+                }
             },
-            "Invalid fill_value for this data type",
-        ],
-        [
+            "shape and chunks arrays are of different size",
+        ),
+        ({"data_type": _MISSING}, "data_type missing"),
+        ({"data_type": "uint8_INVALID"}, "Invalid or unsupported format for data_type"),
+        ({"chunk_grid": _MISSING}, "chunk_grid missing or not an object"),
+        (
+            {"chunk_grid": {"name": "invalid"}},
+            "Only chunk_grid.name = regular supported",
+        ),
+        (
+            {"chunk_grid": {"name": "regular"}},
+            "chunk_grid.configuration.chunk_shape missing or not an array",
+        ),
+        (
+            {"chunk_key_encoding": _MISSING},
+            "chunk_key_encoding missing or not an object",
+        ),
+        (
+            {"chunk_key_encoding": {"name": "invalid"}},
+            "Unsupported chunk_key_encoding.name",
+        ),
+        (
             {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": "0x00",
+                "chunk_key_encoding": {
+                    "name": "default",
+                    "configuration": {"separator": "invalid"},
+                }
             },
+            "Separator can only be '/' or '.'",
+        ),
+        ({"storage_transformers": [{}]}, "storage_transformers are not supported"),
+        ({"fill_value": "invalid"}, "Invalid fill_value"),
+        (
+            {"fill_value": "0", "dimension_names": "invalid"},
+            "dimension_names should be an array",
+        ),
+        (
+            {"fill_value": "0", "dimension_names": []},
+            "Size of dimension_names[] different from the one of shape",
+        ),
+        ({"fill_value": "NaN"}, "Invalid fill_value for this data type"),
+        (
+            {"fill_value": "0x00"},
             "Hexadecimal representation of fill_value no supported for this data type",
-        ],
-        [
-            {
-                "zarr_format": 3,
-                "node_type": "array",
-                "shape": [1],
-                "data_type": "uint8",
-                "chunk_grid": {
-                    "name": "regular",
-                    "configuration": {"chunk_shape": [1]},
-                },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": "0b00",
-            },
+        ),
+        (
+            {"fill_value": "0b00"},
             "Binary representation of fill_value no supported for this data type",
-        ],
-        [
+        ),
+        (
             {
-                "zarr_format": 3,
-                "node_type": "array",
                 "shape": [1 << 40, 1 << 40],
-                "data_type": "uint8",
                 "chunk_grid": {
                     "name": "regular",
                     "configuration": {"chunk_shape": [1 << 40, 1 << 40]},
                 },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
             },
             "Too large chunks",
-        ],
-        [
+        ),
+        (
             {
-                "zarr_format": 3,
-                "node_type": "array",
                 "shape": [1 << 30, 1 << 30, 1 << 30],
-                "data_type": "uint8",
                 "chunk_grid": {
                     "name": "regular",
                     "configuration": {"chunk_shape": [1, 1, 1]},
                 },
-                "chunk_key_encoding": {"name": "default"},
-                "fill_value": 0,
             },
             "Array test has more than 2^64 blocks. This is not supported.",
-        ],
+        ),
     ],
 )
-def test_zarr_read_invalid_zarr_v3(tmp_vsimem, j, error_msg):
+def test_zarr_read_invalid_zarr_v3(tmp_vsimem, dict_update, error_msg):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/zarr.json", json.dumps(j))
+    j = {**_VALID_ZARR_JSON_V3, **dict_update}
+    j = {k: v for k, v in j.items() if v is not _MISSING}
+
+    _write_json(tmp_vsimem / "test.zarr/zarr.json", j)
     gdal.ErrorReset()
     with gdal.quiet_errors():
         assert gdal.Open(tmp_vsimem / "test.zarr") is None
@@ -2729,8 +2306,7 @@ def test_zarr_read_data_type_fallback_zarr_v3(tmp_vsimem):
         "fill_value": 0,
     }
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/zarr.json", json.dumps(j))
+    _write_json(tmp_vsimem / "test.zarr/zarr.json", j)
     ds = gdal.Open(tmp_vsimem / "test.zarr")
     assert ds.GetRasterBand(1).DataType == gdal.GDT_Int64
 
@@ -2762,12 +2338,10 @@ def test_zarr_read_numpy_datetime64_extension_zarr_v3(tmp_vsimem, extension_name
     }
 
     dirname = tmp_vsimem / "test_np_datetime.zarr"
-    gdal.Mkdir(dirname, 0)
-    gdal.FileFromMemBuffer(dirname / "zarr.json", json.dumps(j))
+    _write_json(dirname / "zarr.json", j)
 
     # Write chunk with known values: two timestamps and NaT
     chunk_data = struct.pack("<qqq", 1000000000, 2000000000, NAT)
-    gdal.Mkdir(dirname / "c", 0)
     gdal.FileFromMemBuffer(dirname / "c/0", chunk_data)
 
     # Check via classic raster API
@@ -2812,8 +2386,7 @@ def test_zarr_read_numpy_datetime64_unsupported_extension_zarr_v3(tmp_vsimem):
     }
 
     dirname = tmp_vsimem / "test_unknown_ext.zarr"
-    gdal.Mkdir(dirname, 0)
-    gdal.FileFromMemBuffer(dirname / "zarr.json", json.dumps(j))
+    _write_json(dirname / "zarr.json", j)
     with pytest.raises(Exception, match="Invalid or unsupported format"):
         gdal.Open(dirname)
 
@@ -2842,8 +2415,7 @@ def test_zarr_read_fill_value_v3(tmp_vsimem, data_type, fill_value, nodata):
         "fill_value": fill_value,
     }
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/zarr.json", json.dumps(j))
+    _write_json(tmp_vsimem / "test.zarr/zarr.json", j)
     ds = gdal.Open(tmp_vsimem / "test.zarr")
     assert ds.GetRasterBand(1).GetNoDataValue() == nodata
 
@@ -2876,26 +2448,24 @@ def test_zarr_read_fill_value_complex_datatype_v3(
     tmp_vsimem, data_type, fill_value, nodata
 ):
 
-    import copy
-
-    fill_value = copy.copy(fill_value)
-    nodata = copy.copy(nodata)
+    # The parametrized lists are shared between data types, so replace rather
+    # than modify them
     if fill_value and isinstance(fill_value, list):
         # float32 precision not sufficient to hold 1234567890123
         if data_type == "complex64" and fill_value[0] == 1234567890123:
-            fill_value[0] = 123456
-            nodata[0] = 123456
+            fill_value = [123456, fill_value[1]]
+            nodata = [123456, nodata[1]]
         # float16 precision not sufficient to hold 1234567890123
         if data_type == "complex32" and fill_value[0] == 1234567890123:
-            fill_value[0] = 1234
-            nodata[0] = 1234
+            fill_value = [1234, fill_value[1]]
+            nodata = [1234, nodata[1]]
 
         # convert float64 nan hexadecimal representation to float32
         if data_type == "complex64" and str(fill_value[0]) == "0x7ff8000000000000":
-            fill_value[0] = "0x7fc00000"
+            fill_value = ["0x7fc00000", fill_value[1]]
         # convert float64 nan hexadecimal representation to float16
         if data_type == "complex32" and str(fill_value[0]) == "0x7ff8000000000000":
-            fill_value[0] = "0x7e00"
+            fill_value = ["0x7e00", fill_value[1]]
 
     j = {
         "zarr_format": 3,
@@ -2907,8 +2477,7 @@ def test_zarr_read_fill_value_complex_datatype_v3(
         "fill_value": fill_value,
     }
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/zarr.json", json.dumps(j))
+    _write_json(tmp_vsimem / "test.zarr/zarr.json", j)
 
     if nodata is None:
         with pytest.raises(Exception):
@@ -2926,29 +2495,25 @@ def test_zarr_read_fill_value_complex_datatype_v3(
                 if ar.GetDataType().GetNumericDataType() == gdal.GDT_CFloat64
                 else "f"
             )
-            assert ar.GetNoDataValueAsRaw() == bytes(
-                array.array(dtype, nodata)
-            ), struct.unpack(dtype * 2, ar.GetNoDataValueAsRaw())
+            assert ar.GetNoDataValueAsRaw() == struct.pack(
+                "2" + dtype, *nodata
+            ), struct.unpack("2" + dtype, ar.GetNoDataValueAsRaw())
 
             # To force a reserialization of the array
-            attr = ar.CreateAttribute("attr", [], gdal.ExtendedDataType.CreateString())
+            attr = ar.CreateAttribute("attr", [], _string_dt)
             attr.Write("foo")
 
         open_and_modify()
 
         if not str(fill_value[0]).startswith("0x"):
-            f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/zarr.json", "rb")
-            assert f
-            data = gdal.VSIFReadL(1, 10000, f)
-            gdal.VSIFCloseL(f)
-            j = json.loads(data)
+            j = _read_json(tmp_vsimem / "test.zarr/zarr.json")
             assert j["fill_value"] == fill_value
 
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create_array_bad_compressor(tmp_vsimem, format):
+def test_zarr_create_array_bad_compressor(tmp_vsimem, format, zarr_drv):
 
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test.zarr", options=["FORMAT=" + format]
     )
     assert ds is not None
@@ -2959,7 +2524,7 @@ def test_zarr_create_array_bad_compressor(tmp_vsimem, format):
             rg.CreateMDArray(
                 "test",
                 [],
-                gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+                _uint8_dt,
                 ["COMPRESS=invalid"],
             )
             is None
@@ -2967,30 +2532,25 @@ def test_zarr_create_array_bad_compressor(tmp_vsimem, format):
 
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create_array_attributes(tmp_vsimem, format):
+def test_zarr_create_array_attributes(tmp_vsimem, format, zarr_drv):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=" + format]
         )
         assert ds is not None
         rg = ds.GetRootGroup()
         assert rg
-        ar = rg.CreateMDArray("test", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
+        ar = rg.CreateMDArray("test", [], _uint8_dt)
         assert ar
         assert ar.GetFullName() == "/test"
 
-        attr = ar.CreateAttribute("str_attr", [], gdal.ExtendedDataType.CreateString())
+        attr = ar.CreateAttribute("str_attr", [], _string_dt)
         assert attr
         assert attr.GetFullName() == "/test/str_attr"
         assert attr.Write("my_string") == gdal.CE_None
 
         with gdal.quiet_errors():
-            assert (
-                ar.CreateAttribute(
-                    "invalid_2d", [2, 3], gdal.ExtendedDataType.CreateString()
-                )
-                is None
-            )
+            assert ar.CreateAttribute("invalid_2d", [2, 3], _string_dt) is None
 
     create()
 
@@ -3025,33 +2585,24 @@ def test_zarr_create_array_attributes(tmp_vsimem, format):
         assert attr.Write("foo") == gdal.CE_Failure
 
     with gdal.quiet_errors():
-        assert (
-            ar.CreateAttribute("another_attr", [], gdal.ExtendedDataType.CreateString())
-            is None
-        )
+        assert ar.CreateAttribute("another_attr", [], _string_dt) is None
 
 
-def test_zarr_create_array_set_crs(tmp_vsimem):
+def test_zarr_create_array_set_crs(tmp_vsimem, zarr_drv, epsg4326_srs):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V2"]
         )
         assert ds is not None
         rg = ds.GetRootGroup()
         assert rg
-        ar = rg.CreateMDArray("test", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
+        ar = rg.CreateMDArray("test", [], _uint8_dt)
         assert ar
-        crs = osr.SpatialReference()
-        crs.ImportFromEPSG(4326)
-        assert ar.SetSpatialRef(crs) == gdal.CE_None
+        assert ar.SetSpatialRef(epsg4326_srs) == gdal.CE_None
 
     create()
 
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/.zattrs", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr/test/.zattrs")
     assert "_CRS" in j
     crs = j["_CRS"]
     assert "wkt" in crs
@@ -3060,9 +2611,9 @@ def test_zarr_create_array_set_crs(tmp_vsimem):
         assert crs["projjson"]["type"] == "GeographicCRS"
 
 
-def test_zarr_create_array_set_dimension_name(tmp_vsimem):
+def test_zarr_create_array_set_dimension_name(tmp_vsimem, zarr_drv):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V2"]
         )
         assert ds is not None
@@ -3070,20 +2621,14 @@ def test_zarr_create_array_set_dimension_name(tmp_vsimem):
         assert rg
 
         dim0 = rg.CreateDimension("dim0", None, None, 2)
-        dim0_ar = rg.CreateMDArray(
-            "dim0", [dim0], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        dim0_ar = rg.CreateMDArray("dim0", [dim0], _uint8_dt)
         dim0.SetIndexingVariable(dim0_ar)
 
-        rg.CreateMDArray("test", [dim0], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
+        rg.CreateMDArray("test", [dim0], _uint8_dt)
 
     create()
 
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/.zattrs", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr/test/.zattrs")
     assert "_ARRAY_DIMENSIONS" in j
     assert j["_ARRAY_DIMENSIONS"] == ["dim0"]
 
@@ -3151,16 +2696,9 @@ def test_zarr_write_array_content(
 
         structtype = _gdal_data_type_to_array_type[gdaltype]
 
-        j = {
-            "chunks": [2, 3],
-            "compressor": None,
-            "dtype": dtype,
-            "fill_value": fill_value,
-            "filters": None,
-            "order": "C",
-            "shape": [5, 4],
-            "zarr_format": 2,
-        }
+        zarray, tile_0_0_data, tile_0_1_data = _zarr_v2_test_array_content(
+            dtype, gdaltype, fill_value
+        )
 
         filename = (
             f"{tmp_vsimem}/test"
@@ -3171,20 +2709,9 @@ def test_zarr_write_array_content(
         gdal.Mkdir(filename, 0o755)
         f = gdal.VSIFOpenL(filename + "/.zarray", "wb")
         assert f
-        data = json.dumps(j)
-        gdal.VSIFWriteL(data, 1, len(data), f)
+        gdal.VSIFWriteL(zarray, 1, len(zarray), f)
         gdal.VSIFCloseL(f)
 
-        if gdaltype not in (gdal.GDT_CFloat16, gdal.GDT_CFloat32, gdal.GDT_CFloat64):
-            tile_0_0_data = struct.pack(dtype[0] + (structtype * 6), 1, 2, 3, 5, 6, 7)
-            tile_0_1_data = struct.pack(dtype[0] + (structtype * 6), 4, 0, 0, 8, 0, 0)
-        else:
-            tile_0_0_data = struct.pack(
-                dtype[0] + (structtype * 12), 1, 11, 2, 0, 3, 0, 5, 0, 6, 0, 7, 0
-            )
-            tile_0_1_data = struct.pack(
-                dtype[0] + (structtype * 12), 4, 0, 0, 0, 0, 0, 8, 0, 0, 0, 0, 0
-            )
         gdal.FileFromMemBuffer(filename + "/0.0", tile_0_0_data)
         gdal.FileFromMemBuffer(filename + "/0.1", tile_0_1_data)
 
@@ -3205,24 +2732,16 @@ def test_zarr_write_array_content(
             else gdal.GDT_Float64
         )
 
+        # Number of float64 values of the whole array in the dt buffer type
+        count = 5 * 4
+        if gdaltype in (gdal.GDT_CFloat16, gdal.GDT_CFloat32, gdal.GDT_CFloat64):
+            count *= 2
+
         # Write all nodataset. That should cause tiles to be removed.
         nv = nodata_value if nodata_value else 0
-        buf_nodata = array.array(
-            "d",
-            [nv]
-            * (
-                5
-                * 4
-                * (
-                    2
-                    if gdaltype
-                    in (gdal.GDT_CFloat16, gdal.GDT_CFloat32, gdal.GDT_CFloat64)
-                    else 1
-                )
-            ),
-        )
+        buf_nodata = array.array("d", [nv]) * count
         assert ar.Write(buf_nodata, buffer_datatype=dt) == gdal.CE_None
-        assert ar.Read(buffer_datatype=dt) == bytearray(buf_nodata)
+        assert ar.Read(buffer_datatype=dt) == buf_nodata
 
         if (
             fill_value is None
@@ -3232,53 +2751,47 @@ def test_zarr_write_array_content(
             assert gdal.VSIStatL(filename + "/0.0") is None
 
         # Write all ones
-        ones = array.array(
-            "d",
-            [0]
-            * (
-                5
-                * 4
-                * (
-                    2
-                    if gdaltype
-                    in (gdal.GDT_CFloat16, gdal.GDT_CFloat32, gdal.GDT_CFloat64)
-                    else 1
-                )
-            ),
-        )
+        ones = array.array("d", [0]) * count
         assert ar.Write(ones, buffer_datatype=dt) == gdal.CE_None
-        assert ar.Read(buffer_datatype=dt) == bytearray(ones)
+        assert ar.Read(buffer_datatype=dt) == ones
 
         # Write with odd array_step
+        odd_step_values = struct.pack("4d", nv, nv, 6, 5)
         assert (
             ar.Write(
-                struct.pack("d" * 4, nv, nv, 6, 5),
+                odd_step_values,
                 array_start_idx=[2, 1],
                 count=[2, 2],
                 array_step=[-1, -1],
-                buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
+                buffer_datatype=_float64_dt,
             )
             == gdal.CE_None
         )
 
         # Check back
-        assert ar.Read(
-            array_start_idx=[2, 1],
-            count=[2, 2],
-            array_step=[-1, -1],
-            buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
-        ) == struct.pack("d" * 4, nv, nv, 6, 5)
+        assert (
+            ar.Read(
+                array_start_idx=[2, 1],
+                count=[2, 2],
+                array_step=[-1, -1],
+                buffer_datatype=_float64_dt,
+            )
+            == odd_step_values
+        )
 
         # Force dirty block eviction
         ar.Read(buffer_datatype=dt)
 
         # Check back again
-        assert ar.Read(
-            array_start_idx=[2, 1],
-            count=[2, 2],
-            array_step=[-1, -1],
-            buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_Float64),
-        ) == struct.pack("d" * 4, nv, nv, 6, 5)
+        assert (
+            ar.Read(
+                array_start_idx=[2, 1],
+                count=[2, 2],
+                array_step=[-1, -1],
+                buffer_datatype=_float64_dt,
+            )
+            == odd_step_values
+        )
 
 
 @pytest.mark.parametrize(
@@ -3291,9 +2804,9 @@ def test_zarr_write_array_content(
         (gdal.GDT_CFloat64, "d"),
     ],
 )
-def test_zarr_write_interleave(tmp_vsimem, dt, array_type):
+def test_zarr_write_interleave(tmp_vsimem, dt, array_type, zarr_drv):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V2"]
         )
         assert ds is not None
@@ -3350,9 +2863,9 @@ def test_zarr_write_interleave(tmp_vsimem, dt, array_type):
         ),
     )
     if dt != gdal.GDT_CFloat64:
-        assert ar.Read(
-            buffer_datatype=gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        ) == array.array("B", [0, 1, 2, 3, 4, 5])
+        assert ar.Read(buffer_datatype=_uint8_dt) == array.array(
+            "B", [0, 1, 2, 3, 4, 5]
+        )
 
 
 @pytest.mark.parametrize(
@@ -3363,9 +2876,11 @@ def test_zarr_write_interleave(tmp_vsimem, dt, array_type):
     ],
     ids=("ASCII", "UNICODE"),
 )
-def test_zarr_create_array_string(tmp_vsimem, string_format, input_str, output_str):
+def test_zarr_create_array_string(
+    tmp_vsimem, string_format, input_str, output_str, zarr_drv
+):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V2"]
         )
         assert ds is not None
@@ -3399,11 +2914,8 @@ def test_zarr_update_array_string(tmp_vsimem, srcfilename):
 
     filename = str(tmp_vsimem / "test.zarr")
 
-    gdal.Mkdir(filename, 0)
-    gdal.FileFromMemBuffer(
-        filename + "/.zarray", open(srcfilename + "/.zarray", "rb").read()
-    )
-    gdal.FileFromMemBuffer(filename + "/0", open(srcfilename + "/0", "rb").read())
+    gdal.CopyFile(srcfilename + "/.zarray", filename + "/.zarray")
+    gdal.CopyFile(srcfilename + "/0", filename + "/0")
 
     eta = "\u03b7"
 
@@ -3445,13 +2957,13 @@ def test_zarr_update_array_string(tmp_vsimem, srcfilename):
     ],
 )
 def test_zarr_create_fortran_order_3d_and_compression_and_dim_separator(
-    tmp_vsimem, format, gdal_data_type
+    tmp_vsimem, format, gdal_data_type, zarr_drv
 ):
 
-    array_type = _gdal_data_type_to_array_type[gdal_data_type]
+    data = array.array(_gdal_data_type_to_array_type[gdal_data_type], range(2 * 3 * 4))
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=" + format]
         )
         assert ds is not None
@@ -3468,21 +2980,14 @@ def test_zarr_create_fortran_order_3d_and_compression_and_dim_separator(
             gdal.ExtendedDataType.Create(gdal_data_type),
             ["CHUNK_MEMORY_LAYOUT=F", "COMPRESS=gzip", "DIM_SEPARATOR=/"],
         )
-        assert (
-            ar.Write(array.array(array_type, [i for i in range(2 * 3 * 4)]))
-            == gdal.CE_None
-        )
+        assert ar.Write(data) == gdal.CE_None
 
     create()
 
     if format == "ZARR_V2":
-        f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/.zarray", "rb")
+        j = _read_json(tmp_vsimem / "test.zarr/test/.zarray")
     else:
-        f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/zarr.json", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+        j = _read_json(tmp_vsimem / "test.zarr/test/zarr.json")
     if format == "ZARR_V2":
         assert "order" in j
         assert j["order"] == "F"
@@ -3499,30 +3004,26 @@ def test_zarr_create_fortran_order_3d_and_compression_and_dim_separator(
     rg = ds.GetRootGroup()
     assert rg
     ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
-    assert ar.Read() == array.array(array_type, [i for i in range(2 * 3 * 4)])
+    assert ar.Read() == data
 
 
-def test_zarr_create_unit_offset_scale(tmp_vsimem):
+def test_zarr_create_unit_offset_scale(tmp_vsimem, zarr_drv):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V2"]
         )
         assert ds is not None
         rg = ds.GetRootGroup()
         assert rg
 
-        ar = rg.CreateMDArray("test", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
+        ar = rg.CreateMDArray("test", [], _uint8_dt)
         assert ar.SetOffset(1.5) == gdal.CE_None
         assert ar.SetScale(2.5) == gdal.CE_None
         assert ar.SetUnit("my unit") == gdal.CE_None
 
     create()
 
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/.zattrs", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr/test/.zattrs")
     assert "add_offset" in j
     assert j["add_offset"] == 1.5
     assert "scale_factor" in j
@@ -3573,9 +3074,9 @@ def test_zarr_create_copy(tmp_vsimem):
 
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create(tmp_vsimem, format):
+def test_zarr_create(tmp_vsimem, format, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
+    ds = zarr_drv.Create(
         tmp_vsimem / "test.zarr",
         1,
         1,
@@ -3603,9 +3104,9 @@ def test_zarr_create(tmp_vsimem, format):
 
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create_append_subdataset(tmp_vsimem, format):
+def test_zarr_create_append_subdataset(tmp_vsimem, format, zarr_drv):
     def create():
-        ds = gdal.GetDriverByName("Zarr").Create(
+        ds = zarr_drv.Create(
             tmp_vsimem / "test.zarr",
             3,
             2,
@@ -3617,7 +3118,7 @@ def test_zarr_create_append_subdataset(tmp_vsimem, format):
         ds = None
 
         # Same dimensions. Will reuse the ones of foo
-        ds = gdal.GetDriverByName("Zarr").Create(
+        ds = zarr_drv.Create(
             tmp_vsimem / "test.zarr",
             3,
             2,
@@ -3629,7 +3130,7 @@ def test_zarr_create_append_subdataset(tmp_vsimem, format):
         ds = None
 
         # Different dimensions.
-        ds = gdal.GetDriverByName("Zarr").Create(
+        ds = zarr_drv.Create(
             tmp_vsimem / "test.zarr",
             30,
             20,
@@ -3666,9 +3167,9 @@ def test_zarr_create_append_subdataset(tmp_vsimem, format):
 
 @pytest.mark.parametrize("blocksize", ["1,2", "4000000000,4000000000,4000000000"])
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_create_array_invalid_blocksize(tmp_vsimem, blocksize, format):
+def test_zarr_create_array_invalid_blocksize(tmp_vsimem, blocksize, format, zarr_drv):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test.zarr",
             options=["FORMAT=" + format],
         )
@@ -3684,7 +3185,7 @@ def test_zarr_create_array_invalid_blocksize(tmp_vsimem, blocksize, format):
             ar = rg.CreateMDArray(
                 "test",
                 [dim0, dim1, dim2],
-                gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+                _uint8_dt,
                 ["BLOCKSIZE=" + blocksize],
             )
             assert ar is None
@@ -3700,20 +3201,17 @@ def test_zarr_read_filters():
     assert rg
     ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
     assert ar
-    assert ar.Read() == array.array("i", [i for i in range(10)])
+    assert ar.Read() == array.array("i", range(10))
 
 
 def test_zarr_update_with_filters(tmp_vsimem):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-    gdal.FileFromMemBuffer(
-        tmp_vsimem / "test.zarr/.zarray",
-        open("data/zarr/delta_filter_i4.zarr/.zarray", "rb").read(),
-    )
-    gdal.FileFromMemBuffer(
-        tmp_vsimem / "test.zarr/0",
-        open("data/zarr/delta_filter_i4.zarr/0", "rb").read(),
+    updated_values = array.array("i", range(10, 0, -1))
+
+    gdal.CopyFile(
+        "data/zarr/delta_filter_i4.zarr/.zarray", tmp_vsimem / "test.zarr/.zarray"
     )
+    gdal.CopyFile("data/zarr/delta_filter_i4.zarr/0", tmp_vsimem / "test.zarr/0")
 
     def update():
         ds = gdal.Open(
@@ -3724,8 +3222,8 @@ def test_zarr_update_with_filters(tmp_vsimem):
         assert rg
         ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
         assert ar
-        assert ar.Read() == array.array("i", [i for i in range(10)])
-        assert ar.Write(array.array("i", [10 - i for i in range(10)])) == gdal.CE_None
+        assert ar.Read() == array.array("i", range(10))
+        assert ar.Write(updated_values) == gdal.CE_None
 
     update()
 
@@ -3735,7 +3233,7 @@ def test_zarr_update_with_filters(tmp_vsimem):
     assert rg
     ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
     assert ar
-    assert ar.Read() == array.array("i", [10 - i for i in range(10)])
+    assert ar.Read() == updated_values
 
 
 @gdaltest.enable_exceptions()
@@ -3766,29 +3264,21 @@ def test_zarr_create_with_filter(tmp_vsimem):
         vsimem=1, new_filename=tmp_vsimem / "test.zarr", delete_output_file=False
     )
 
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr/test/.zarray", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr/test/.zarray")
     assert "filters" in j
     assert j["filters"] == [{"id": "delta", "dtype": "<u2"}]
 
 
-def test_zarr_pam_spatial_ref(tmp_vsimem):
+def test_zarr_pam_spatial_ref(tmp_vsimem, zarr_drv, epsg4326_srs):
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            tmp_vsimem / "test.zarr"
-        )
+        ds = zarr_drv.CreateMultiDimensional(tmp_vsimem / "test.zarr")
         assert ds is not None
         rg = ds.GetRootGroup()
         assert rg
 
         dim0 = rg.CreateDimension("dim0", None, None, 2)
         dim1 = rg.CreateDimension("dim1", None, None, 2)
-        rg.CreateMDArray(
-            "test", [dim0, dim1], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        rg.CreateMDArray("test", [dim0, dim1], _uint8_dt)
 
     create()
 
@@ -3816,8 +3306,7 @@ def test_zarr_pam_spatial_ref(tmp_vsimem):
         assert rg
         ar = rg.OpenMDArray(rg.GetMDArrayNames()[0])
         assert ar
-        crs = osr.SpatialReference()
-        crs.ImportFromEPSG(4326)
+        crs = epsg4326_srs.Clone()
         # lat first
         crs.SetDataAxisToSRSAxisMapping([1, 2])
         crs.SetCoordinateEpoch(2021.2)
@@ -3893,18 +3382,8 @@ def test_zarr_pam_spatial_ref(tmp_vsimem):
 
 def test_zarr_read_too_large_tile_size(tmp_vsimem):
 
-    j = {
-        "chunks": [1000000, 2000],
-        "compressor": None,
-        "dtype": "!b1",
-        "fill_value": None,
-        "filters": None,
-        "order": "C",
-        "shape": [5, 4],
-        "zarr_format": 2,
-    }
+    j = {**_VALID_ZARRAY_V2, "chunks": [1000000, 2000]}
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zarray", json.dumps(j))
     ds = gdal.Open(tmp_vsimem / "test.zarr", gdal.OF_MULTIDIM_RASTER)
     assert ds is not None
@@ -3914,8 +3393,6 @@ def test_zarr_read_too_large_tile_size(tmp_vsimem):
 
 def test_zarr_read_recursive_array_loading(tmp_vsimem):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-
     j = {"zarr_format": 2}
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zgroup", json.dumps(j))
 
@@ -3929,8 +3406,9 @@ def test_zarr_read_recursive_array_loading(tmp_vsimem):
         "shape": [1],
         "zarr_format": 2,
     }
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/a/.zarray", json.dumps(j))
-    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/b/.zarray", json.dumps(j))
+    zarray = json.dumps(j)
+    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/a/.zarray", zarray)
+    gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/b/.zarray", zarray)
 
     j = {"_ARRAY_DIMENSIONS": ["b"]}
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/a/.zattrs", json.dumps(j))
@@ -3951,8 +3429,6 @@ def test_zarr_read_recursive_array_loading(tmp_vsimem):
 
 def test_zarr_read_too_deep_array_loading(tmp_vsimem):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-
     j = {"zarr_format": 2}
     gdal.FileFromMemBuffer(tmp_vsimem / "test.zarr/.zgroup", json.dumps(j))
 
@@ -3968,8 +3444,9 @@ def test_zarr_read_too_deep_array_loading(tmp_vsimem):
     }
 
     N = 33
+    zarray = json.dumps(j)
     for i in range(N):
-        gdal.FileFromMemBuffer(tmp_vsimem / f"test.zarr/{i}/.zarray", json.dumps(j))
+        gdal.FileFromMemBuffer(tmp_vsimem / f"test.zarr/{i}/.zarray", zarray)
 
     for i in range(N - 1):
         j = {"_ARRAY_DIMENSIONS": ["%d" % (i + 1)]}
@@ -4042,16 +3519,14 @@ def test_zarr_read_nczarr_v2(filename, path):
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
 @pytest.mark.require_driver("netCDF")
 @pytest.mark.parametrize("GDAL_NUM_THREADS", ["1", "ALL_CPUS"])
-def test_zarr_cache_tile_presence(tmp_path, format, GDAL_NUM_THREADS):
+def test_zarr_cache_tile_presence(tmp_path, format, GDAL_NUM_THREADS, zarr_drv):
 
     with gdal.config_option("GDAL_NUM_THREADS", GDAL_NUM_THREADS):
         filename = str(tmp_path / "test.zarr")
 
         # Create a Zarr array with sparse tiles
         def create():
-            ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-                filename, options=["FORMAT=" + format]
-            )
+            ds = zarr_drv.CreateMultiDimensional(filename, options=["FORMAT=" + format])
             assert ds is not None
             rg = ds.GetRootGroup()
             assert rg
@@ -4061,18 +3536,16 @@ def test_zarr_cache_tile_presence(tmp_path, format, GDAL_NUM_THREADS):
             ar = rg.CreateMDArray(
                 "test",
                 [dim0, dim1],
-                gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+                _uint8_dt,
                 ["BLOCKSIZE=1,2"],
             )
             assert ar
             assert (
-                ar.Write(struct.pack("B" * 1, 10), array_start_idx=[0, 0], count=[1, 1])
+                ar.Write(struct.pack("B", 10), array_start_idx=[0, 0], count=[1, 1])
                 == gdal.CE_None
             )
             assert (
-                ar.Write(
-                    struct.pack("B" * 1, 100), array_start_idx=[1, 3], count=[1, 1]
-                )
+                ar.Write(struct.pack("B", 100), array_start_idx=[1, 3], count=[1, 1])
                 == gdal.CE_None
             )
 
@@ -4105,7 +3578,7 @@ def test_zarr_cache_tile_presence(tmp_path, format, GDAL_NUM_THREADS):
             rg = ds.GetRootGroup()
             ar = rg.OpenMDArray("test")
             assert ar is not None
-            assert struct.unpack("B" * 2 * 5, ar.Read()) == (
+            assert struct.unpack(f"{2 * 5}B", ar.Read()) == (
                 10,
                 0,
                 0,
@@ -4132,9 +3605,9 @@ def test_zarr_cache_tile_presence(tmp_path, format, GDAL_NUM_THREADS):
             rg = ds.GetRootGroup()
             assert rg.GetMDArrayNames() == ["_test_tile_presence"]
             ar = rg.OpenMDArray("_test_tile_presence")
-            assert struct.unpack("B" * 2 * 3, ar.Read()) == (1, 0, 0, 0, 1, 0)
+            assert struct.unpack(f"{2 * 3}B", ar.Read()) == (1, 0, 0, 0, 1, 0)
             assert (
-                ar.Write(struct.pack("B" * 1, 0), array_start_idx=[1, 1], count=[1, 1])
+                ar.Write(struct.pack("B", 0), array_start_idx=[1, 1], count=[1, 1])
                 == gdal.CE_None
             )
 
@@ -4147,7 +3620,7 @@ def test_zarr_cache_tile_presence(tmp_path, format, GDAL_NUM_THREADS):
             rg = ds.GetRootGroup()
             ar = rg.OpenMDArray("test")
             assert ar is not None
-            assert struct.unpack("B" * 2 * 5, ar.Read()) == (
+            assert struct.unpack(f"{2 * 5}B", ar.Read()) == (
                 10,
                 0,
                 0,
@@ -4165,7 +3638,7 @@ def test_zarr_cache_tile_presence(tmp_path, format, GDAL_NUM_THREADS):
 
 @pytest.mark.parametrize("compression", ["NONE", "GZIP"])
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_advise_read(tmp_path, compression, format):
+def test_zarr_advise_read(tmp_path, compression, format, zarr_drv):
 
     filename = str(tmp_path / "test.zarr")
 
@@ -4185,9 +3658,7 @@ def test_zarr_advise_read(tmp_path, compression, format):
     data = array.array("B", data_ar)
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            filename, options=["FORMAT=" + format]
-        )
+        ds = zarr_drv.CreateMultiDimensional(filename, options=["FORMAT=" + format])
         assert ds is not None
         rg = ds.GetRootGroup()
         assert rg
@@ -4197,7 +3668,7 @@ def test_zarr_advise_read(tmp_path, compression, format):
         ar = rg.CreateMDArray(
             "test",
             [dim0, dim1],
-            gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+            _uint8_dt,
             [
                 "COMPRESS=" + compression,
                 "BLOCKSIZE=%d,%d" % (dim0_blocksize, dim1_blocksize),
@@ -4254,7 +3725,7 @@ def test_zarr_advise_read(tmp_path, compression, format):
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
 @gdaltest.enable_exceptions()
-def test_zarr_iread_auto_parallel(tmp_path, format):
+def test_zarr_iread_auto_parallel(tmp_path, format, zarr_drv):
 
     filename = str(tmp_path / "test.zarr")
     dim0_size = 100
@@ -4263,16 +3734,14 @@ def test_zarr_iread_auto_parallel(tmp_path, format):
     data_ar = [(i % 256) for i in range(dim0_size * dim1_size)]
     data = array.array("B", data_ar)
 
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        filename, options=["FORMAT=" + format]
-    )
+    ds = zarr_drv.CreateMultiDimensional(filename, options=["FORMAT=" + format])
     rg = ds.GetRootGroup()
     dim0 = rg.CreateDimension("dim0", None, None, dim0_size)
     dim1 = rg.CreateDimension("dim1", None, None, dim1_size)
     ar = rg.CreateMDArray(
         "test",
         [dim0, dim1],
-        gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+        _uint8_dt,
         ["BLOCKSIZE=%d,%d" % (blocksize, blocksize)],
     )
     assert ar.Write(data) == gdal.CE_None
@@ -4332,7 +3801,7 @@ def test_zarr_iread_auto_parallel(tmp_path, format):
 
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_multiband_advise_read(tmp_path, format):
+def test_zarr_multiband_advise_read(tmp_path, format, zarr_drv):
     """Classic API ds.ReadRaster() should get parallel prefetch on all bands."""
 
     filename = str(tmp_path / "test.zarr")
@@ -4340,9 +3809,7 @@ def test_zarr_multiband_advise_read(tmp_path, format):
     blocksize = 20
 
     # Create 3-band dataset via multidimensional API (band, y, x)
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        filename, options=["FORMAT=" + format]
-    )
+    ds = zarr_drv.CreateMultiDimensional(filename, options=["FORMAT=" + format])
     rg = ds.GetRootGroup()
     dim_band = rg.CreateDimension("band", None, None, nbands)
     dim_y = rg.CreateDimension("Y", None, None, ny)
@@ -4350,7 +3817,7 @@ def test_zarr_multiband_advise_read(tmp_path, format):
     ar = rg.CreateMDArray(
         "test",
         [dim_band, dim_y, dim_x],
-        gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+        _uint8_dt,
         [
             "BLOCKSIZE=1,%d,%d" % (blocksize, blocksize),
             "MULTIBAND=YES",
@@ -4380,7 +3847,7 @@ def test_zarr_multiband_advise_read(tmp_path, format):
 
 
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_advise_read_cache_preserved(tmp_path, format):
+def test_zarr_advise_read_cache_preserved(tmp_path, format, zarr_drv):
     """Explicit IAdviseRead cache survives auto-IAdviseRead in IRead.
 
     After AdviseRead populates the cache, chunk files are deleted.
@@ -4392,16 +3859,14 @@ def test_zarr_advise_read_cache_preserved(tmp_path, format):
     ny, nx = 60, 80
     blocksize = 20
 
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        filename, options=["FORMAT=" + format]
-    )
+    ds = zarr_drv.CreateMultiDimensional(filename, options=["FORMAT=" + format])
     rg = ds.GetRootGroup()
     dim_y = rg.CreateDimension("Y", None, None, ny)
     dim_x = rg.CreateDimension("X", None, None, nx)
     ar = rg.CreateMDArray(
         "test",
         [dim_y, dim_x],
-        gdal.ExtendedDataType.Create(gdal.GDT_UInt8),
+        _uint8_dt,
         ["BLOCKSIZE=%d,%d" % (blocksize, blocksize)],
     )
     data = array.array("B", [(i % 256) for i in range(ny * nx)])
@@ -4435,8 +3900,6 @@ def test_zarr_advise_read_cache_preserved(tmp_path, format):
 
 def test_zarr_read_invalid_nczarr_dim(tmp_vsimem):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-
     j = {
         "chunks": [1, 1],
         "compressor": None,
@@ -4497,8 +3960,6 @@ def test_zarr_read_invalid_nczarr_dim(tmp_vsimem):
 
 def test_zarr_read_nczar_repeated_array_names(tmp_vsimem):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-
     j = {
         "_NCZARR_GROUP": {
             "dims": {"lon": 1},
@@ -4548,8 +4009,6 @@ def test_zarr_read_nczar_repeated_array_names(tmp_vsimem):
 @pytest.mark.require_64bit()
 def test_zarr_read_test_overflow_in_AllocateWorkingBuffers_due_to_fortran(tmp_vsimem):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-
     j = {
         "chunks": [(1 << 32) - 1, (1 << 32) - 1],
         "compressor": None,
@@ -4576,8 +4035,6 @@ def test_zarr_read_test_overflow_in_AllocateWorkingBuffers_due_to_type_change(
     tmp_vsimem,
 ):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-
     j = {
         "chunks": [(1 << 32) - 1, ((1 << 32) - 1) / 8],
         "compressor": None,
@@ -4601,8 +4058,6 @@ def test_zarr_read_test_overflow_in_AllocateWorkingBuffers_due_to_type_change(
 
 def test_zarr_read_do_not_crash_on_invalid_byteswap_on_ascii_string(tmp_vsimem):
 
-    gdal.Mkdir(tmp_vsimem / "test.zarr", 0)
-
     j = {
         "chunks": [1],
         "compressor": None,
@@ -4626,12 +4081,12 @@ def test_zarr_read_do_not_crash_on_invalid_byteswap_on_ascii_string(tmp_vsimem):
     "format,create_z_metadata",
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
-def test_zarr_resize(tmp_vsimem, format, create_z_metadata):
+def test_zarr_resize(tmp_vsimem, format, create_z_metadata, zarr_drv):
 
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
@@ -4641,10 +4096,8 @@ def test_zarr_resize(tmp_vsimem, format, create_z_metadata):
 
         dim0 = rg.CreateDimension("dim0", None, None, 2)
         dim1 = rg.CreateDimension("dim1", None, None, 2)
-        var = rg.CreateMDArray(
-            "test", [dim0, dim1], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        assert var.Write(struct.pack("B" * (2 * 2), 1, 2, 3, 4)) == gdal.CE_None
+        var = rg.CreateMDArray("test", [dim0, dim1], _uint8_dt)
+        assert var.Write(struct.pack(f"{2 * 2}B", 1, 2, 3, 4)) == gdal.CE_None
 
     create()
 
@@ -4670,7 +4123,7 @@ def test_zarr_resize(tmp_vsimem, format, create_z_metadata):
         assert var.GetDimensions()[1].GetSize() == 2
         assert (
             var.Write(
-                struct.pack("B" * (3 * 2), 5, 6, 7, 8, 9, 10),
+                struct.pack(f"{3 * 2}B", 5, 6, 7, 8, 9, 10),
                 array_start_idx=[2, 0],
                 count=[3, 2],
             )
@@ -4680,11 +4133,7 @@ def test_zarr_resize(tmp_vsimem, format, create_z_metadata):
     resize()
 
     if create_z_metadata == "YES":
-        f = gdal.VSIFOpenL(filename + "/.zmetadata", "rb")
-        assert f
-        data = gdal.VSIFReadL(1, 10000, f)
-        gdal.VSIFCloseL(f)
-        j = json.loads(data)
+        j = _read_json(filename + "/.zmetadata")
         assert j["metadata"]["test/.zarray"]["shape"] == [5, 2]
 
     def check():
@@ -4693,7 +4142,7 @@ def test_zarr_resize(tmp_vsimem, format, create_z_metadata):
         var = rg.OpenMDArray("test")
         assert var.GetDimensions()[0].GetSize() == 5
         assert var.GetDimensions()[1].GetSize() == 2
-        assert struct.unpack("B" * (5 * 2), var.Read()) == (
+        assert struct.unpack(f"{5 * 2}B", var.Read()) == (
             1,
             2,
             3,
@@ -4710,12 +4159,12 @@ def test_zarr_resize(tmp_vsimem, format, create_z_metadata):
 
 
 @pytest.mark.parametrize("create_z_metadata", [True, False])
-def test_zarr_resize_XARRAY(tmp_vsimem, create_z_metadata):
+def test_zarr_resize_XARRAY(tmp_vsimem, create_z_metadata, zarr_drv):
 
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=[
                 "CREATE_ZMETADATA=" + ("YES" if create_z_metadata else "NO"),
@@ -4727,23 +4176,15 @@ def test_zarr_resize_XARRAY(tmp_vsimem, create_z_metadata):
         assert rg
 
         dim0 = rg.CreateDimension("dim0", None, None, 2)
-        dim0_var = rg.CreateMDArray(
-            "dim0", [dim0], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        dim0_var = rg.CreateMDArray("dim0", [dim0], _uint8_dt)
         dim0.SetIndexingVariable(dim0_var)
         dim1 = rg.CreateDimension("dim1", None, None, 2)
-        dim1_var = rg.CreateMDArray(
-            "dim1", [dim1], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        dim1_var = rg.CreateMDArray("dim1", [dim1], _uint8_dt)
         dim1.SetIndexingVariable(dim1_var)
-        var = rg.CreateMDArray(
-            "test", [dim0, dim1], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        assert var.Write(struct.pack("B" * (2 * 2), 1, 2, 3, 4)) == gdal.CE_None
+        var = rg.CreateMDArray("test", [dim0, dim1], _uint8_dt)
+        assert var.Write(struct.pack(f"{2 * 2}B", 1, 2, 3, 4)) == gdal.CE_None
 
-        var2 = rg.CreateMDArray(
-            "test2", [dim0, dim1], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        var2 = rg.CreateMDArray("test2", [dim0, dim1], _uint8_dt)
         assert var2 is not None
 
     create()
@@ -4762,7 +4203,7 @@ def test_zarr_resize_XARRAY(tmp_vsimem, create_z_metadata):
         assert var.GetDimensions()[1].GetSize() == 2
         assert (
             var.Write(
-                struct.pack("B" * (3 * 2), 5, 6, 7, 8, 9, 10),
+                struct.pack(f"{3 * 2}B", 5, 6, 7, 8, 9, 10),
                 array_start_idx=[2, 0],
                 count=[3, 2],
             )
@@ -4774,11 +4215,7 @@ def test_zarr_resize_XARRAY(tmp_vsimem, create_z_metadata):
     resize()
 
     if create_z_metadata:
-        f = gdal.VSIFOpenL(filename + "/.zmetadata", "rb")
-        assert f
-        data = gdal.VSIFReadL(1, 10000, f)
-        gdal.VSIFCloseL(f)
-        j = json.loads(data)
+        j = _read_json(filename + "/.zmetadata")
         assert j["metadata"]["test/.zarray"]["shape"] == [5, 2]
         assert j["metadata"]["dim0/.zarray"]["shape"] == [5]
 
@@ -4788,7 +4225,7 @@ def test_zarr_resize_XARRAY(tmp_vsimem, create_z_metadata):
         var = rg.OpenMDArray("test")
         assert var.GetDimensions()[0].GetSize() == 5
         assert var.GetDimensions()[1].GetSize() == 2
-        assert struct.unpack("B" * (5 * 2), var.Read()) == (
+        assert struct.unpack(f"{5 * 2}B", var.Read()) == (
             1,
             2,
             3,
@@ -4813,28 +4250,22 @@ def test_zarr_resize_XARRAY(tmp_vsimem, create_z_metadata):
 ###############################################################################
 
 
-def test_zarr_resize_dim_referenced_twice(tmp_vsimem):
+def test_zarr_resize_dim_referenced_twice(tmp_vsimem, zarr_drv):
 
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            filename, options=["FORMAT=ZARR_V2"]
-        )
+        ds = zarr_drv.CreateMultiDimensional(filename, options=["FORMAT=ZARR_V2"])
         assert ds is not None
         rg = ds.GetRootGroup()
         assert rg
 
         dim0 = rg.CreateDimension("dim0", None, None, 2)
-        dim0_var = rg.CreateMDArray(
-            "dim0", [dim0], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        dim0_var = rg.CreateMDArray("dim0", [dim0], _uint8_dt)
         dim0.SetIndexingVariable(dim0_var)
 
-        var = rg.CreateMDArray(
-            "test", [dim0, dim0], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        assert var.Write(struct.pack("B" * (2 * 2), 1, 2, 3, 4)) == gdal.CE_None
+        var = rg.CreateMDArray("test", [dim0, dim0], _uint8_dt)
+        assert var.Write(struct.pack(f"{2 * 2}B", 1, 2, 3, 4)) == gdal.CE_None
 
     create()
 
@@ -4853,11 +4284,7 @@ def test_zarr_resize_dim_referenced_twice(tmp_vsimem):
 
     resize()
 
-    f = gdal.VSIFOpenL(filename + "/.zmetadata", "rb")
-    assert f
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(filename + "/.zmetadata")
     assert j["metadata"]["test/.zarray"]["shape"] == [3, 3]
     assert j["metadata"]["dim0/.zarray"]["shape"] == [3]
 
@@ -4879,41 +4306,32 @@ def test_zarr_resize_dim_referenced_twice(tmp_vsimem):
     "format,create_z_metadata",
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
-def test_zarr_multidim_rename_group_at_creation(tmp_vsimem, format, create_z_metadata):
+def test_zarr_multidim_rename_group_at_creation(
+    tmp_vsimem, format, create_z_metadata, zarr_drv
+):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def test():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         group = rg.CreateGroup("group")
-        group_attr = group.CreateAttribute(
-            "group_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        group_attr = group.CreateAttribute("group_attr", [], _uint8_dt)
         rg.CreateGroup("other_group")
         dim = group.CreateDimension(
             "dim0", "unspecified type", "unspecified direction", 2
         )
-        ar = group.CreateMDArray(
-            "ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        attr = ar.CreateAttribute(
-            "attr", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        ar = group.CreateMDArray("ar", [dim], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _uint8_dt)
 
         subgroup = group.CreateGroup("subgroup")
-        subgroup_attr = subgroup.CreateAttribute(
-            "subgroup_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        subgroup_ar = subgroup.CreateMDArray(
-            "subgroup_ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        subgroup_attr = subgroup.CreateAttribute("subgroup_attr", [], _uint8_dt)
+        subgroup_ar = subgroup.CreateMDArray("subgroup_ar", [dim], _uint8_dt)
         subgroup_ar_attr = subgroup_ar.CreateAttribute(
-            "subgroup_ar_attr", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
+            "subgroup_ar_attr", [], _uint8_dt
         )
 
         # Cannot rename root group
@@ -4976,7 +4394,7 @@ def test_zarr_multidim_rename_group_at_creation(tmp_vsimem, format, create_z_met
         assert set(rg.GetGroupNames()) == {"group_renamed", "other_group"}
 
         group = rg.OpenGroup("group_renamed")
-        assert set([attr.GetName() for attr in group.GetAttributes()]) == {"group_attr"}
+        assert {attr.GetName() for attr in group.GetAttributes()} == {"group_attr"}
 
         assert group.GetMDArrayNames() == ["ar"]
 
@@ -4999,33 +4417,28 @@ def test_zarr_multidim_rename_group_at_creation(tmp_vsimem, format, create_z_met
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
 def test_zarr_multidim_rename_group_after_reopening(
-    tmp_vsimem, format, create_z_metadata
+    tmp_vsimem, format, create_z_metadata, zarr_drv
 ):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         group = rg.CreateGroup("group")
-        group_attr = group.CreateAttribute(
-            "group_attr", [], gdal.ExtendedDataType.CreateString()
-        )
+        group_attr = group.CreateAttribute("group_attr", [], _string_dt)
         group_attr.Write("my_string")
         rg.CreateGroup("other_group")
         dim = group.CreateDimension(
             "dim0", "unspecified type", "unspecified direction", 2
         )
-        ar = group.CreateMDArray(
-            "ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        attr = ar.CreateAttribute("attr", [], gdal.ExtendedDataType.CreateString())
+        ar = group.CreateMDArray("ar", [dim], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _string_dt)
         attr.Write("foo")
-        attr2 = ar.CreateAttribute("attr2", [], gdal.ExtendedDataType.CreateString())
+        attr2 = ar.CreateAttribute("attr2", [], _string_dt)
         attr2.Write("foo2")
 
         group.CreateGroup("subgroup")
@@ -5080,7 +4493,7 @@ def test_zarr_multidim_rename_group_after_reopening(
         rg = ds.GetRootGroup()
 
         group = rg.OpenGroup("group_renamed")
-        assert set([attr.GetName() for attr in group.GetAttributes()]) == {"group_attr"}
+        assert {attr.GetName() for attr in group.GetAttributes()} == {"group_attr"}
 
         assert group.GetMDArrayNames() == ["ar"]
 
@@ -5108,13 +4521,14 @@ def test_zarr_multidim_rename_group_after_reopening(
     "format,create_z_metadata",
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
-def test_zarr_multidim_rename_array_at_creation(tmp_path, format, create_z_metadata):
+def test_zarr_multidim_rename_array_at_creation(
+    tmp_path, format, create_z_metadata, zarr_drv
+):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_path / "test.zarr")
 
     def test():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
@@ -5125,15 +4539,9 @@ def test_zarr_multidim_rename_array_at_creation(tmp_path, format, create_z_metad
         dim = group.CreateDimension(
             "dim0", "unspecified type", "unspecified direction", 2
         )
-        ar = group.CreateMDArray(
-            "ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        group.CreateMDArray(
-            "other_ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        attr = ar.CreateAttribute(
-            "attr", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        ar = group.CreateMDArray("ar", [dim], _uint8_dt)
+        group.CreateMDArray("other_ar", [dim], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _uint8_dt)
 
         # Empty name
         with pytest.raises(Exception):
@@ -5177,7 +4585,7 @@ def test_zarr_multidim_rename_array_at_creation(tmp_path, format, create_z_metad
         assert set(group.GetMDArrayNames()) == {"ar_renamed", "other_ar"}
 
         ar_renamed = group.OpenMDArray("ar_renamed")
-        assert set([attr.GetName() for attr in ar_renamed.GetAttributes()]) == {"attr"}
+        assert {attr.GetName() for attr in ar_renamed.GetAttributes()} == {"attr"}
 
         # Read-only
         with pytest.raises(Exception):
@@ -5198,14 +4606,13 @@ def test_zarr_multidim_rename_array_at_creation(tmp_path, format, create_z_metad
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
 def test_zarr_multidim_rename_array_after_reopening(
-    tmp_vsimem, format, create_z_metadata
+    tmp_vsimem, format, create_z_metadata, zarr_drv
 ):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
@@ -5215,13 +4622,9 @@ def test_zarr_multidim_rename_array_after_reopening(
         dim = group.CreateDimension(
             "dim0", "unspecified type", "unspecified direction", 2
         )
-        ar = group.CreateMDArray(
-            "ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        group.CreateMDArray(
-            "other_ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        attr = ar.CreateAttribute("attr", [], gdal.ExtendedDataType.CreateString())
+        ar = group.CreateMDArray("ar", [dim], _uint8_dt)
+        group.CreateMDArray("other_ar", [dim], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _string_dt)
         attr.Write("foo")
 
     def reopen_readonly():
@@ -5299,34 +4702,27 @@ def test_zarr_multidim_rename_array_after_reopening(
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
 def test_zarr_multidim_rename_attr_after_reopening(
-    tmp_vsimem, format, create_z_metadata
+    tmp_vsimem, format, create_z_metadata, zarr_drv
 ):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         group = rg.CreateGroup("group")
-        group_attr = group.CreateAttribute(
-            "group_attr", [], gdal.ExtendedDataType.CreateString()
-        )
+        group_attr = group.CreateAttribute("group_attr", [], _string_dt)
         group_attr.Write("foo")
 
         dim = group.CreateDimension(
             "dim0", "unspecified type", "unspecified direction", 2
         )
-        ar = group.CreateMDArray(
-            "ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        group.CreateMDArray(
-            "other_ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        attr = ar.CreateAttribute("attr", [], gdal.ExtendedDataType.CreateString())
+        ar = group.CreateMDArray("ar", [dim], _uint8_dt)
+        group.CreateMDArray("other_ar", [dim], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _string_dt)
         attr.Write("foo")
 
     def rename():
@@ -5379,22 +4775,21 @@ def test_zarr_multidim_rename_attr_after_reopening(
     "format,create_z_metadata",
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
-def test_zarr_multidim_rename_dim_at_creation(tmp_vsimem, format, create_z_metadata):
+def test_zarr_multidim_rename_dim_at_creation(
+    tmp_vsimem, format, create_z_metadata, zarr_drv
+):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         dim = rg.CreateDimension("dim", None, None, 2)
         other_dim = rg.CreateDimension("other_dim", None, None, 2)
-        var = rg.CreateMDArray(
-            "var", [dim, other_dim], gdal.ExtendedDataType.Create(gdal.GDT_Int16)
-        )
+        var = rg.CreateMDArray("var", [dim, other_dim], _int16_dt)
 
         # Empty name
         with pytest.raises(Exception):
@@ -5451,23 +4846,20 @@ def test_zarr_multidim_rename_dim_at_creation(tmp_vsimem, format, create_z_metad
     [("ZARR_V2", "YES"), ("ZARR_V2", "NO"), ("ZARR_V3", "NO")],
 )
 def test_zarr_multidim_rename_dim_after_reopening(
-    tmp_vsimem, format, create_z_metadata
+    tmp_vsimem, format, create_z_metadata, zarr_drv
 ):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         dim = rg.CreateDimension("dim", None, None, 2)
         other_dim = rg.CreateDimension("other_dim", None, None, 2)
-        rg.CreateMDArray(
-            "var", [dim, other_dim], gdal.ExtendedDataType.Create(gdal.GDT_Int16)
-        )
+        rg.CreateMDArray("var", [dim, other_dim], _int16_dt)
 
     def rename():
         ds = gdal.Open(filename, gdal.OF_MULTIDIM_RASTER | gdal.OF_UPDATE)
@@ -5532,33 +4924,28 @@ def test_zarr_multidim_rename_dim_after_reopening(
 )
 @pytest.mark.parametrize("get_before_delete", [True, False])
 def test_zarr_multidim_delete_group_after_reopening(
-    tmp_vsimem, format, create_z_metadata, get_before_delete
+    tmp_vsimem, format, create_z_metadata, get_before_delete, zarr_drv
 ):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         group = rg.CreateGroup("group")
-        group_attr = group.CreateAttribute(
-            "group_attr", [], gdal.ExtendedDataType.CreateString()
-        )
+        group_attr = group.CreateAttribute("group_attr", [], _string_dt)
         group_attr.Write("my_string")
         rg.CreateGroup("other_group")
         dim = group.CreateDimension(
             "dim0", "unspecified type", "unspecified direction", 2
         )
-        ar = group.CreateMDArray(
-            "ar", [dim], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
-        attr = ar.CreateAttribute("attr", [], gdal.ExtendedDataType.CreateString())
+        ar = group.CreateMDArray("ar", [dim], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _string_dt)
         attr.Write("foo")
-        attr2 = ar.CreateAttribute("attr2", [], gdal.ExtendedDataType.CreateString())
+        attr2 = ar.CreateAttribute("attr2", [], _string_dt)
         attr2.Write("foo")
 
         group.CreateGroup("subgroup")
@@ -5641,28 +5028,25 @@ def test_zarr_multidim_delete_group_after_reopening(
 )
 @pytest.mark.parametrize("get_before_delete", [True, False])
 def test_zarr_multidim_delete_array_after_reopening(
-    tmp_vsimem, format, create_z_metadata, get_before_delete
+    tmp_vsimem, format, create_z_metadata, get_before_delete, zarr_drv
 ):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         group = rg.CreateGroup("group")
-        ar = group.CreateMDArray("ar", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
-        attr = ar.CreateAttribute("attr", [], gdal.ExtendedDataType.CreateString())
+        ar = group.CreateMDArray("ar", [], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _string_dt)
         attr.Write("foo")
-        attr2 = ar.CreateAttribute("attr2", [], gdal.ExtendedDataType.CreateString())
+        attr2 = ar.CreateAttribute("attr2", [], _string_dt)
         attr2.Write("foo")
 
-        group.CreateMDArray(
-            "other_ar", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-        )
+        group.CreateMDArray("other_ar", [], _uint8_dt)
 
     def reopen_readonly():
         ds = gdal.Open(filename, gdal.OF_MULTIDIM_RASTER)
@@ -5734,32 +5118,27 @@ def test_zarr_multidim_delete_array_after_reopening(
 )
 @pytest.mark.parametrize("get_before_delete", [True, False])
 def test_zarr_multidim_delete_attribute_after_reopening(
-    tmp_vsimem, format, create_z_metadata, get_before_delete
+    tmp_vsimem, format, create_z_metadata, get_before_delete, zarr_drv
 ):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = str(tmp_vsimem / "test.zarr")
 
     def create():
-        ds = drv.CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             filename,
             options=["FORMAT=" + format, "CREATE_ZMETADATA=" + create_z_metadata],
         )
         rg = ds.GetRootGroup()
         group = rg.CreateGroup("group")
-        group_attr = group.CreateAttribute(
-            "group_attr", [], gdal.ExtendedDataType.CreateString()
-        )
+        group_attr = group.CreateAttribute("group_attr", [], _string_dt)
         group_attr.Write("foo")
-        group_attr2 = group.CreateAttribute(
-            "group_attr2", [], gdal.ExtendedDataType.CreateString()
-        )
+        group_attr2 = group.CreateAttribute("group_attr2", [], _string_dt)
         group_attr2.Write("foo")
 
-        ar = group.CreateMDArray("ar", [], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
-        attr = ar.CreateAttribute("attr", [], gdal.ExtendedDataType.CreateString())
+        ar = group.CreateMDArray("ar", [], _uint8_dt)
+        attr = ar.CreateAttribute("attr", [], _string_dt)
         attr.Write("foo")
-        attr2 = ar.CreateAttribute("attr2", [], gdal.ExtendedDataType.CreateString())
+        attr2 = ar.CreateAttribute("attr2", [], _string_dt)
         attr2.Write("foo")
 
     def reopen_readonly():
@@ -5843,16 +5222,15 @@ def test_zarr_multidim_delete_attribute_after_reopening(
 
 @gdaltest.enable_exceptions()
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_driver_delete(tmp_vsimem, format):
+def test_zarr_driver_delete(tmp_vsimem, format, zarr_drv):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = tmp_vsimem / "test.zarr"
 
-    drv.Create(filename, 1, 1, options=["FORMAT=" + format])
+    zarr_drv.Create(filename, 1, 1, options=["FORMAT=" + format])
 
     assert gdal.Open(filename)
 
-    assert drv.Delete(filename) == gdal.CE_None
+    assert zarr_drv.Delete(filename) == gdal.CE_None
     assert gdal.VSIStatL(filename) is None
 
     with pytest.raises(Exception):
@@ -5865,19 +5243,18 @@ def test_zarr_driver_delete(tmp_vsimem, format):
 
 @gdaltest.enable_exceptions()
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_driver_rename(tmp_vsimem, format):
+def test_zarr_driver_rename(tmp_vsimem, format, zarr_drv):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = tmp_vsimem / "test.zarr"
     newfilename = tmp_vsimem / "newtest.zarr"
 
-    drv.Create(filename, 1, 1, options=["FORMAT=" + format])
+    zarr_drv.Create(filename, 1, 1, options=["FORMAT=" + format])
 
     with gdal.quiet_warnings():
         # ZARR_V3 gives: "Warning 1: fill_value = null is invalid" on open.
         assert gdal.Open(filename)
 
-    assert drv.Rename(newfilename, filename) == gdal.CE_None
+    assert zarr_drv.Rename(newfilename, filename) == gdal.CE_None
 
     assert gdal.VSIStatL(filename) is None
     with pytest.raises(Exception):
@@ -5895,17 +5272,16 @@ def test_zarr_driver_rename(tmp_vsimem, format):
 
 @gdaltest.enable_exceptions()
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_driver_copy_files(tmp_vsimem, format):
+def test_zarr_driver_copy_files(tmp_vsimem, format, zarr_drv):
 
-    drv = gdal.GetDriverByName("ZARR")
     filename = tmp_vsimem / "test.zarr"
     newfilename = tmp_vsimem / "newtest.zarr"
 
-    drv.Create(filename, 1, 1, options=["FORMAT=" + format])
+    zarr_drv.Create(filename, 1, 1, options=["FORMAT=" + format])
 
     assert gdal.Open(filename)
 
-    assert drv.CopyFiles(newfilename, filename) == gdal.CE_None
+    assert zarr_drv.CopyFiles(newfilename, filename) == gdal.CE_None
 
     with gdal.quiet_warnings():
         # ZARR_V3 gives: "Warning 1: fill_value = null is invalid" on open.
@@ -5920,20 +5296,17 @@ def test_zarr_driver_copy_files(tmp_vsimem, format):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_multidim_compute_statistics_update_metadata(tmp_vsimem):
+def test_zarr_multidim_compute_statistics_update_metadata(tmp_vsimem, zarr_drv):
 
     filename = str(
         tmp_vsimem / "test_netcdf_multidim_compute_statistics_update_metadata.zarr"
     )
 
     def test():
-        drv = gdal.GetDriverByName("ZARR")
-        ds = drv.CreateMultiDimensional(filename)
+        ds = zarr_drv.CreateMultiDimensional(filename)
         rg = ds.GetRootGroup()
         dim0 = rg.CreateDimension("dim0", None, None, 2)
-        ar = rg.CreateMDArray(
-            "ar", [dim0], gdal.ExtendedDataType.Create(gdal.GDT_Float32)
-        )
+        ar = rg.CreateMDArray("ar", [dim0], _float32_dt)
         ar.Write(array.array("f", [1.5, 2.5]))
         stats = ar.ComputeStatistics(options=["UPDATE_METADATA=YES"])
         assert stats.min == 1.5
@@ -5985,12 +5358,10 @@ def test_zarr_read_cf1_zarrv3():
 
 @gdaltest.enable_exceptions()
 @pytest.mark.require_proj(9)
-def test_zarr_write_WGS84_and_EGM96_height(tmp_vsimem):
+def test_zarr_write_WGS84_and_EGM96_height(tmp_vsimem, zarr_drv):
 
     tmp_filename = str(tmp_vsimem / "out.zarr")
-    with gdal.GetDriverByName("Zarr").Create(
-        tmp_filename, 1, 1, options=["FORMAT=ZARR_V2"]
-    ) as ds:
+    with zarr_drv.Create(tmp_filename, 1, 1, options=["FORMAT=ZARR_V2"]) as ds:
         srs = osr.SpatialReference()
         srs.ImportFromEPSG(9707)
         ds.SetSpatialRef(srs)
@@ -6004,12 +5375,10 @@ def test_zarr_write_WGS84_and_EGM96_height(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_write_UTM31N_and_EGM96_height(tmp_vsimem):
+def test_zarr_write_UTM31N_and_EGM96_height(tmp_vsimem, zarr_drv):
 
     tmp_filename = str(tmp_vsimem / "out.zarr")
-    with gdal.GetDriverByName("Zarr").Create(
-        tmp_filename, 1, 1, options=["FORMAT=ZARR_V2"]
-    ) as ds:
+    with zarr_drv.Create(tmp_filename, 1, 1, options=["FORMAT=ZARR_V2"]) as ds:
         srs = osr.SpatialReference()
         srs.SetFromUserInput("EPSG:32631+5773")
         ds.SetSpatialRef(srs)
@@ -6121,17 +5490,13 @@ def test_zarr_read_imagecodecs_tiff_errors(dirname):
 
 @gdaltest.enable_exceptions()
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_write_error_at_close_on_group(tmp_path, format):
+def test_zarr_write_error_at_close_on_group(tmp_path, format, zarr_drv):
     out_filename = tmp_path / "test.zarr"
 
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        out_filename, options=["FORMAT=" + format]
-    )
+    ds = zarr_drv.CreateMultiDimensional(out_filename, options=["FORMAT=" + format])
     rg = ds.GetRootGroup()
     subgroup = rg.CreateGroup("subgroup")
-    attr = subgroup.CreateAttribute(
-        "str_attr", [], gdal.ExtendedDataType.CreateString()
-    )
+    attr = subgroup.CreateAttribute("str_attr", [], _string_dt)
     assert attr.Write("my_string") == gdal.CE_None
     del attr
     del subgroup
@@ -6149,17 +5514,15 @@ def test_zarr_write_error_at_close_on_group(tmp_path, format):
 
 @gdaltest.enable_exceptions()
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_write_error_at_close_on_array(tmp_path, format):
+def test_zarr_write_error_at_close_on_array(tmp_path, format, zarr_drv):
     out_filename = tmp_path / "test.zarr"
 
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        out_filename, options=["FORMAT=" + format]
-    )
+    ds = zarr_drv.CreateMultiDimensional(out_filename, options=["FORMAT=" + format])
     rg = ds.GetRootGroup()
     dim0 = rg.CreateDimension("dim0", None, None, 2)
 
-    ar = rg.CreateMDArray("my_ar", [dim0], gdal.ExtendedDataType.Create(gdal.GDT_UInt8))
-    attr = ar.CreateAttribute("str_attr", [], gdal.ExtendedDataType.CreateString())
+    ar = rg.CreateMDArray("my_ar", [dim0], _uint8_dt)
+    attr = ar.CreateAttribute("str_attr", [], _string_dt)
     assert attr.Write("my_string") == gdal.CE_None
     del attr
     del ar
@@ -6177,12 +5540,10 @@ def test_zarr_write_error_at_close_on_array(tmp_path, format):
 
 @gdaltest.enable_exceptions()
 @pytest.mark.parametrize("format", ["ZARR_V2", "ZARR_V3"])
-def test_zarr_write_vsizip(tmp_vsimem, format):
+def test_zarr_write_vsizip(tmp_vsimem, format, zarr_drv, byte_tif_ds):
     out_filename = "/vsizip/" + str(tmp_vsimem) + "test.zarr.zip/test.zarr"
 
-    gdal.GetDriverByName("Zarr").CreateCopy(
-        out_filename, gdal.Open("data/byte.tif"), options=["FORMAT=" + format]
-    )
+    zarr_drv.CreateCopy(out_filename, byte_tif_ds, options=["FORMAT=" + format])
 
     ds = gdal.Open(out_filename)
     assert ds.GetMetadata() == {"AREA_OR_POINT": "Area"}
@@ -6292,15 +5653,11 @@ def test_zarr_read_zarr_endian_or_transpose_GetRawBlockInfo(filename, expected_i
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_zarr_v2_missing_block_GetRawBlockInfo(tmp_vsimem):
+def test_zarr_read_zarr_v2_missing_block_GetRawBlockInfo(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        tmp_vsimem / "test.zarr", ["FORMAT=ZARR_V2"]
-    )
+    ds = zarr_drv.CreateMultiDimensional(tmp_vsimem / "test.zarr", ["FORMAT=ZARR_V2"])
     dim0 = ds.GetRootGroup().CreateDimension("dim0", None, None, 2)
-    ar = ds.GetRootGroup().CreateMDArray(
-        "test", [dim0], gdal.ExtendedDataType.Create(gdal.GDT_UInt8)
-    )
+    ar = ds.GetRootGroup().CreateMDArray("test", [dim0], _uint8_dt)
     info = ar.GetRawBlockInfo([0])
     assert info.GetOffset() == 0
     assert info.GetSize() == 0
@@ -6381,10 +5738,9 @@ def test_zarr_read_kerchunk_parquet_GetRawBlockInfo():
 
 @pytest.mark.require_driver("netCDF")
 @gdaltest.enable_exceptions()
-def test_zarr_read_simple_sharding(tmp_path):
+def test_zarr_read_simple_sharding(tmp_path, zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     ds = gdal.Open(
@@ -6396,13 +5752,13 @@ def test_zarr_read_simple_sharding(tmp_path):
 
     expected = [i for i in range(24 * 26)]
 
-    assert list(struct.unpack("f" * (24 * 26), ar.Read())) == expected
+    assert list(struct.unpack(f"{24 * 26}f", ar.Read())) == expected
 
-    assert list(struct.unpack("f" * (24 * 26), ar.Read())) == expected
+    assert list(struct.unpack(f"{24 * 26}f", ar.Read())) == expected
 
     assert ar.AdviseRead() == gdal.CE_None
 
-    assert list(struct.unpack("f" * (24 * 26), ar.Read())) == expected
+    assert list(struct.unpack(f"{24 * 26}f", ar.Read())) == expected
 
     info = ar.GetRawBlockInfo([0, 0])
     assert info.GetOffset() == 0
@@ -6449,24 +5805,23 @@ def test_zarr_read_simple_sharding(tmp_path):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_simple_sharding_parallel():
+def test_zarr_read_simple_sharding_parallel(zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     ds = gdal.Open("data/zarr/v3/simple_sharding.zarr", gdal.OF_MULTIDIM_RASTER)
     ar = ds.GetRootGroup().OpenMDArray("simple_sharding")
 
     # Read sequentially first
-    expected = list(struct.unpack("f" * (24 * 26), ar.Read()))
+    expected = list(struct.unpack(f"{24 * 26}f", ar.Read()))
     ds = None
 
     # Read with parallel decode
     with gdal.config_option("GDAL_NUM_THREADS", "ALL_CPUS"):
         ds = gdal.Open("data/zarr/v3/simple_sharding.zarr", gdal.OF_MULTIDIM_RASTER)
         ar = ds.GetRootGroup().OpenMDArray("simple_sharding")
-        result = list(struct.unpack("f" * (24 * 26), ar.Read()))
+        result = list(struct.unpack(f"{24 * 26}f", ar.Read()))
         ds = None
 
     assert result == expected
@@ -6477,10 +5832,9 @@ def test_zarr_read_simple_sharding_parallel():
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_simple_sharding_read_errors(tmp_vsimem):
+def test_zarr_read_simple_sharding_read_errors(tmp_vsimem, zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     gdal.alg.vsi.copy(
@@ -6529,10 +5883,9 @@ def test_zarr_read_simple_sharding_read_errors(tmp_vsimem):
 
 @pytest.mark.require_curl()
 @gdaltest.enable_exceptions()
-def test_zarr_read_simple_sharding_network():
+def test_zarr_read_simple_sharding_network(zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     webserver_process = None
@@ -6643,10 +5996,9 @@ def test_zarr_read_simple_sharding_network():
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_batch_reads_sharding():
+def test_zarr_batch_reads_sharding(zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     ds = gdal.Open(
@@ -6660,11 +6012,11 @@ def test_zarr_batch_reads_sharding():
 
     # Full-extent read triggers PreloadShardedBlocks → BatchDecodePartial.
     # Verify data matches single-block reads.
-    data = list(struct.unpack("f" * (24 * 26), ar.Read()))
+    data = list(struct.unpack(f"{24 * 26}f", ar.Read()))
     assert data == expected
 
     # Partial read spanning multiple inner chunks within a shard
-    partial = list(struct.unpack("f" * (10 * 12), ar.Read([0, 0], [10, 12])))
+    partial = list(struct.unpack(f"{10 * 12}f", ar.Read([0, 0], [10, 12])))
     for row in range(10):
         for col in range(12):
             assert partial[row * 12 + col] == expected[row * 26 + col]
@@ -6677,10 +6029,9 @@ def test_zarr_batch_reads_sharding():
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_sharding_unaligned_rasterio():
+def test_zarr_read_sharding_unaligned_rasterio(zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     # simple_sharding: shape [24,26] float32, inner chunks [5,6], shard [10,12]
@@ -6730,10 +6081,9 @@ def test_zarr_read_sharding_unaligned_rasterio():
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_sharding_index_cache(tmp_path):
+def test_zarr_read_sharding_index_cache(tmp_path, zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     shutil.copytree(
@@ -6747,7 +6097,7 @@ def test_zarr_read_sharding_index_cache(tmp_path):
     # 1. Read full shard 0 (2x2 inner chunks) -> populates g_oShardIndexCache.
     ds = gdal.Open(zarr_path, gdal.OF_MULTIDIM_RASTER)
     ar = ds.GetRootGroup().OpenMDArray("simple_sharding")
-    got = list(struct.unpack("f" * (10 * 12), ar.Read([0, 0], [10, 12])))
+    got = list(struct.unpack(f"{10 * 12}f", ar.Read([0, 0], [10, 12])))
     assert got == exp
     ds = None
 
@@ -6766,7 +6116,7 @@ def test_zarr_read_sharding_index_cache(tmp_path):
     #    from intact portion of file -> success.  Proves the cache IS used.
     ds = gdal.Open(zarr_path, gdal.OF_MULTIDIM_RASTER)
     ar = ds.GetRootGroup().OpenMDArray("simple_sharding")
-    got = list(struct.unpack("f" * (10 * 12), ar.Read([0, 0], [10, 12])))
+    got = list(struct.unpack(f"{10 * 12}f", ar.Read([0, 0], [10, 12])))
     assert got == exp
     ds = None
 
@@ -6776,7 +6126,7 @@ def test_zarr_read_sharding_index_cache(tmp_path):
     gdal.ClearMemoryCaches()
     ds = gdal.Open(zarr_path, gdal.OF_MULTIDIM_RASTER)
     ar = ds.GetRootGroup().OpenMDArray("simple_sharding")
-    got = list(struct.unpack("f" * (10 * 12), ar.Read([0, 0], [10, 12])))
+    got = list(struct.unpack(f"{10 * 12}f", ar.Read([0, 0], [10, 12])))
     assert got != exp, "expected fill values after cache clear + file deletion"
     ds = None
 
@@ -6785,9 +6135,9 @@ def test_zarr_read_sharding_index_cache(tmp_path):
     gdal.ClearMemoryCaches()
     ds = gdal.Open(zarr_path, gdal.OF_MULTIDIM_RASTER)
     ar = ds.GetRootGroup().OpenMDArray("simple_sharding")
-    got = list(struct.unpack("f" * (10 * 12), ar.Read([0, 0], [10, 12])))
+    got = list(struct.unpack(f"{10 * 12}f", ar.Read([0, 0], [10, 12])))
     assert got == exp
-    full = list(struct.unpack("f" * (24 * 26), ar.Read()))
+    full = list(struct.unpack(f"{24 * 26}f", ar.Read()))
     assert full == list(range(24 * 26))
 
 
@@ -6799,10 +6149,9 @@ def test_zarr_read_sharding_index_cache(tmp_path):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_sharded_3d():
+def test_zarr_read_sharded_3d(zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     # Fixture: 3D float32 (3,12,14), shard (3,6,8), inner chunk (1,6,4)
@@ -6840,10 +6189,9 @@ def test_zarr_read_sharded_3d():
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_transposed_sharding():
+def test_zarr_read_transposed_sharding(zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     # At time of writing, zarr-python does not support yet this:
@@ -6855,7 +6203,7 @@ def test_zarr_read_transposed_sharding():
     ar = ds.GetRootGroup().OpenMDArray("transposed_sharding")
     assert ar.GetBlockSize() == [5, 6]
 
-    assert list(struct.unpack("f" * (24 * 26), ar.Read()))[0:14] == [
+    assert list(struct.unpack(f"{24 * 26}f", ar.Read()))[0:14] == [
         0,
         24,
         48,
@@ -6879,10 +6227,9 @@ def test_zarr_read_transposed_sharding():
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_read_sharding_fill_value():
+def test_zarr_read_sharding_fill_value(zarr_compressors):
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     ds = gdal.Open(
@@ -6893,7 +6240,7 @@ def test_zarr_read_sharding_fill_value():
 
     assert ar.GetBlockSize() == [1, 2]
 
-    assert list(struct.unpack("h" * 3 * 3, ar.Read())) == [1] * (3 * 3)
+    assert list(struct.unpack(f"{3 * 3}h", ar.Read())) == [1] * (3 * 3)
 
 
 ###############################################################################
@@ -6918,7 +6265,7 @@ def test_zarr_read_sharding_big_endian():
 
     assert ar.GetBlockSize() == [1, 2]
 
-    assert list(struct.unpack("Q" * 4, ar.Read())) == [1, 2, 3, 4]
+    assert list(struct.unpack("4Q", ar.Read())) == [1, 2, 3, 4]
 
 
 ###############################################################################
@@ -6951,7 +6298,7 @@ def test_zarr_read_sharding_little_endian_then_byte_byte_codec():
     # Not the inner shard shape
     assert ar.GetBlockSize() == [2, 4]
 
-    assert list(struct.unpack("Q" * 4, ar.Read())) == [1, 2, 3, 4]
+    assert list(struct.unpack("4Q", ar.Read())) == [1, 2, 3, 4]
 
 
 ###############################################################################
@@ -6981,7 +6328,7 @@ def test_zarr_read_sharding_big_endian_then_byte_byte_codec():
     # Not the inner shard shape
     assert ar.GetBlockSize() == [2, 4]
 
-    assert list(struct.unpack("Q" * 4, ar.Read())) == [1, 2, 3, 4]
+    assert list(struct.unpack("4Q", ar.Read())) == [1, 2, 3, 4]
 
 
 ###############################################################################
@@ -7327,7 +6674,7 @@ def test_zarr_read_nested_sharding():
     ar = ds.GetRootGroup().OpenMDArray("nested_sharding")
     assert ar.GetBlockSize() == [2, 4]
 
-    assert list(struct.unpack("H" * (5 * 10), ar.Read())) == [i for i in range(50)]
+    assert list(struct.unpack(f"{5 * 10}H", ar.Read())) == [i for i in range(50)]
 
 
 ###############################################################################
@@ -7718,12 +7065,11 @@ def test_zarr_read_spatial_geotransform():
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_write_spatial_geotransform(tmp_vsimem):
+def test_zarr_write_spatial_geotransform(tmp_vsimem, zarr_drv, byte_tif_ds):
 
-    src_ds = gdal.Open("data/byte.tif")
-    gdal.GetDriverByName("Zarr").CreateCopy(
+    zarr_drv.CreateCopy(
         tmp_vsimem / "out.zarr",
-        src_ds,
+        byte_tif_ds,
         options={"FORMAT": "ZARR_V3", "GEOREFERENCING_CONVENTION": "SPATIAL_PROJ"},
     )
 
@@ -7844,9 +7190,9 @@ def test_zarr_write_spatial_geotransform(tmp_vsimem):
     gdal.RmdirRecursive(tmp_vsimem / "out.zarr" / "Y")
 
     ds = gdal.Open(tmp_vsimem / "out.zarr")
-    assert ds.GetSpatialRef().IsSame(src_ds.GetSpatialRef())
-    assert ds.GetGeoTransform() == src_ds.GetGeoTransform()
-    assert ds.GetRasterBand(1).Checksum() == src_ds.GetRasterBand(1).Checksum()
+    assert ds.GetSpatialRef().IsSame(byte_tif_ds.GetSpatialRef())
+    assert ds.GetGeoTransform() == byte_tif_ds.GetGeoTransform()
+    assert ds.GetRasterBand(1).Checksum() == byte_tif_ds.GetRasterBand(1).Checksum()
 
 
 ###############################################################################
@@ -7856,6 +7202,7 @@ def test_zarr_write_spatial_geotransform(tmp_vsimem):
 @gdaltest.enable_exceptions()
 def test_zarr_write_spatial_geotransform_no_epsg_code_rotated_gt_and_pixel_center(
     tmp_vsimem,
+    zarr_drv,
 ):
 
     src_ds = gdal.GetDriverByName("MEM").Create("", 2, 3)
@@ -7865,7 +7212,7 @@ def test_zarr_write_spatial_geotransform_no_epsg_code_rotated_gt_and_pixel_cente
     )
     src_ds.SetMetadataItem("AREA_OR_POINT", "Point")
 
-    gdal.GetDriverByName("Zarr").CreateCopy(
+    zarr_drv.CreateCopy(
         tmp_vsimem / "out.zarr",
         src_ds,
         options={"FORMAT": "ZARR_V3", "GEOREFERENCING_CONVENTION": "SPATIAL_PROJ"},
@@ -8222,10 +7569,9 @@ def _create_sharded_array(path, dims, shard, inner, dtype=gdal.GDT_Float32, opts
 
 
 @pytest.mark.parametrize("compress", ["NONE", "ZSTD"])
-def test_zarr_write_sharded(tmp_path, compress):
+def test_zarr_write_sharded(tmp_path, compress, zarr_compressors):
     """Write a sharded Zarr v3 array and verify round-trip."""
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if compress == "ZSTD" and "zstd" not in compressors:
+    if compress == "ZSTD" and "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     nrows, ncols = 24, 26
@@ -8276,10 +7622,9 @@ def test_zarr_write_sharded_nodata(tmp_path):
     assert all(math.isnan(v) for v in unwritten)
 
 
-def test_zarr_write_sharded_roundtrip(tmp_path):
+def test_zarr_write_sharded_roundtrip(tmp_path, zarr_compressors):
     """Read existing sharded test data, write to new, verify match."""
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     src_ds = gdal.Open("data/zarr/v3/simple_sharding.zarr", gdal.OF_MULTIDIM_RASTER)
@@ -8401,9 +7746,9 @@ def test_zarr_write_sharded_3d(tmp_path):
     ],
     ids=["indivisible", "wrong_dim_count"],
 )
-def test_zarr_write_sharded_invalid(tmp_path, opts):
+def test_zarr_write_sharded_invalid(tmp_path, opts, zarr_drv):
     """Invalid sharding creation options should fail."""
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+    ds = zarr_drv.CreateMultiDimensional(
         str(tmp_path / "out.zarr"), options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
@@ -8412,9 +7757,7 @@ def test_zarr_write_sharded_invalid(tmp_path, opts):
         rg.CreateDimension("x", None, None, 10),
     ]
     with gdal.quiet_errors():
-        ar = rg.CreateMDArray(
-            "data", dims, gdal.ExtendedDataType.Create(gdal.GDT_Float32), opts
-        )
+        ar = rg.CreateMDArray("data", dims, _float32_dt, opts)
     assert ar is None
 
 
@@ -8455,7 +7798,7 @@ def test_zarr_write_sharded_uint8_nodata255(tmp_path):
         )
     ) == list(range(inner_y * inner_x))
     unwritten = struct.unpack(
-        "B" * (5 * 6), ar.Read(array_start_idx=[inner_y, inner_x], count=[5, 6])
+        f"{5 * 6}B", ar.Read(array_start_idx=[inner_y, inner_x], count=[5, 6])
     )
     assert all(v == 255 for v in unwritten)
 
@@ -8491,12 +7834,12 @@ def test_zarr_write_sharded_interop_zarr_python(tmp_path):
 # round-trip, and multiscales metadata in one comprehensive test.
 
 
-def test_zarr_build_overviews(tmp_vsimem):
+def test_zarr_build_overviews(tmp_vsimem, zarr_drv):
 
     ny, nx = 200, 100
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+        ds = zarr_drv.CreateMultiDimensional(
             tmp_vsimem / "test_ovr.zarr", options=["FORMAT=ZARR_V3"]
         )
         rg = ds.GetRootGroup()
@@ -8505,7 +7848,7 @@ def test_zarr_build_overviews(tmp_vsimem):
         ar = rg.CreateMDArray(
             "data",
             [dim_y, dim_x],
-            gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+            _float32_dt,
             ["COMPRESS=GZIP"],
         )
         ar.SetNoDataValueDouble(-9999.0)
@@ -8538,7 +7881,7 @@ def test_zarr_build_overviews(tmp_vsimem):
     # Pixel values: AVERAGE of 2x2 blocks of sequential data.
     # ovr2[0,0] = avg(0, 1, 100, 101) = 50.5
     raw0 = ovr0.Read()
-    vals0 = struct.unpack("f" * 100 * 50, raw0)
+    vals0 = struct.unpack(f"{100 * 50}f", raw0)
     assert abs(vals0[0] - 50.5) < 0.01
     # ovr2[1,0] = avg(200, 201, 300, 301) = 250.5
     assert abs(vals0[50] - 250.5) < 0.01
@@ -8593,9 +7936,7 @@ def test_zarr_build_overviews(tmp_vsimem):
 
     # -- Chain resampling: 3x built from 2x, not from base (NEAREST) --
     chain_path = tmp_vsimem / "test_ovr_chain.zarr"
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        chain_path, options=["FORMAT=ZARR_V3"]
-    )
+    ds = zarr_drv.CreateMultiDimensional(chain_path, options=["FORMAT=ZARR_V3"])
     rg = ds.GetRootGroup()
     ar = rg.CreateMDArray(
         "data",
@@ -8603,11 +7944,11 @@ def test_zarr_build_overviews(tmp_vsimem):
             rg.CreateDimension("Y", None, None, 60),
             rg.CreateDimension("X", None, None, 90),
         ],
-        gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+        _float32_dt,
     )
     ar.Write(
         struct.pack(
-            "f" * 60 * 90,
+            f"{60 * 90}f",
             *[float(r * 90 + c) for r in range(60) for c in range(90)],
         )
     )
@@ -8618,7 +7959,7 @@ def test_zarr_build_overviews(tmp_vsimem):
     ovr3 = ar.GetOverview(1)
     assert ovr3.GetDimensions()[0].GetSize() == 20  # ceil(60/3)
     assert ovr3.GetDimensions()[1].GetSize() == 30  # ceil(90/3)
-    vals3 = struct.unpack("f" * 20 * 30, ovr3.Read())
+    vals3 = struct.unpack(f"{20 * 30}f", ovr3.Read())
     # [1,0] = 360 (chained from 2x) vs 270 (direct from base) proves chaining.
     assert vals3[30] == 360.0
 
@@ -8628,24 +7969,24 @@ def test_zarr_build_overviews(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_build_overviews_errors(tmp_vsimem):
+def test_zarr_build_overviews_errors(tmp_vsimem, zarr_drv):
 
     # 1D array (< 2 dimensions)
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test_ovr_1d.zarr", options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
     ar = rg.CreateMDArray(
         "data",
         [rg.CreateDimension("X", None, None, 64)],
-        gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+        _float32_dt,
     )
     with pytest.raises(Exception, match="requires at least 2 dimensions"):
         ar.BuildOverviews("NEAREST", [2])
     ds = None
 
     # Read-only dataset
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test_ovr_ro.zarr", options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
@@ -8655,7 +7996,7 @@ def test_zarr_build_overviews_errors(tmp_vsimem):
             rg.CreateDimension("Y", None, None, 64),
             rg.CreateDimension("X", None, None, 64),
         ],
-        gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+        _float32_dt,
     )
     ds = None
     ds = gdal.Open(tmp_vsimem / "test_ovr_ro.zarr", gdal.OF_MULTIDIM_RASTER)
@@ -8665,7 +8006,7 @@ def test_zarr_build_overviews_errors(tmp_vsimem):
     ds = None
 
     # Invalid factors (< 2)
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test_ovr_badfac.zarr", options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
@@ -8675,7 +8016,7 @@ def test_zarr_build_overviews_errors(tmp_vsimem):
             rg.CreateDimension("Y", None, None, 64),
             rg.CreateDimension("X", None, None, 64),
         ],
-        gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+        _float32_dt,
     )
     with pytest.raises(Exception, match="is invalid"):
         ar.BuildOverviews("NEAREST", [1])
@@ -8687,23 +8028,21 @@ def test_zarr_build_overviews_errors(tmp_vsimem):
 # Test BuildOverviews rebuild (idempotent) and clear (nOverviews=0)
 
 
-def test_zarr_build_overviews_rebuild_and_clear(tmp_vsimem):
+def test_zarr_build_overviews_rebuild_and_clear(tmp_vsimem, zarr_drv):
 
     path = tmp_vsimem / "test_ovr_rebuild.zarr"
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            path, options=["FORMAT=ZARR_V3"]
-        )
+        ds = zarr_drv.CreateMultiDimensional(path, options=["FORMAT=ZARR_V3"])
         rg = ds.GetRootGroup()
         dim_y = rg.CreateDimension("Y", None, None, 90)
         dim_x = rg.CreateDimension("X", None, None, 60)
         ar = rg.CreateMDArray(
             "data",
             [dim_y, dim_x],
-            gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+            _float32_dt,
         )
-        ar.Write(struct.pack("f" * 90 * 60, *[50.0] * (90 * 60)))
+        ar.Write(struct.pack(f"{90 * 60}f", *[50.0] * (90 * 60)))
         # Build with [2], then rebuild with [3] (non-pow2).
         assert ar.BuildOverviews("NEAREST", [2]) == gdal.CE_None
         assert ar.BuildOverviews("NEAREST", [3]) == gdal.CE_None
@@ -8741,14 +8080,12 @@ def test_zarr_build_overviews_rebuild_and_clear(tmp_vsimem):
 # non-spatial dim preserved.
 
 
-def test_zarr_build_overviews_3d(tmp_vsimem):
+def test_zarr_build_overviews_3d(tmp_vsimem, zarr_drv):
 
     path = tmp_vsimem / "test_ovr_3d.zarr"
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            path, options=["FORMAT=ZARR_V3"]
-        )
+        ds = zarr_drv.CreateMultiDimensional(path, options=["FORMAT=ZARR_V3"])
         rg = ds.GetRootGroup()
         dim_t = rg.CreateDimension("time", None, None, 3)
         dim_y = rg.CreateDimension("Y", None, None, 64)
@@ -8756,7 +8093,7 @@ def test_zarr_build_overviews_3d(tmp_vsimem):
         ar = rg.CreateMDArray(
             "data",
             [dim_t, dim_y, dim_x],
-            gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+            _float32_dt,
         )
         # Each time step: t0=10, t1=20, t2=30
         vals = []
@@ -8800,23 +8137,21 @@ def test_zarr_build_overviews_3d(tmp_vsimem):
 # Test BuildOverviews via AsClassicDataset bridge
 
 
-def test_zarr_build_overviews_classic_bridge(tmp_vsimem):
+def test_zarr_build_overviews_classic_bridge(tmp_vsimem, zarr_drv):
 
     path = tmp_vsimem / "test_ovr_bridge.zarr"
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            path, options=["FORMAT=ZARR_V3"]
-        )
+        ds = zarr_drv.CreateMultiDimensional(path, options=["FORMAT=ZARR_V3"])
         rg = ds.GetRootGroup()
         dim_y = rg.CreateDimension("Y", None, None, 64)
         dim_x = rg.CreateDimension("X", None, None, 64)
         ar = rg.CreateMDArray(
             "data",
             [dim_y, dim_x],
-            gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+            _float32_dt,
         )
-        ar.Write(struct.pack("f" * 64 * 64, *[7.0] * (64 * 64)))
+        ar.Write(struct.pack(f"{64 * 64}f", *[7.0] * (64 * 64)))
         classic_ds = ar.AsClassicDataset(1, 0)
         assert classic_ds.BuildOverviews("NEAREST", [2]) == gdal.CE_None
 
@@ -8828,7 +8163,7 @@ def test_zarr_build_overviews_classic_bridge(tmp_vsimem):
     assert ar.GetOverviewCount() == 1
     ovr = ar.GetOverview(0)
     assert ovr.GetDimensions()[0].GetSize() == 32
-    vals = struct.unpack("f" * 32 * 32, ovr.Read())
+    vals = struct.unpack(f"{32 * 32}f", ovr.Read())
     assert vals[0] == 7.0
     ds.Close()
 
@@ -8848,36 +8183,34 @@ def test_zarr_build_overviews_classic_bridge(tmp_vsimem):
 # irregular (subsampled) spacing in one test.
 
 
-def test_zarr_build_overviews_coord_arrays(tmp_vsimem):
+def test_zarr_build_overviews_coord_arrays(tmp_vsimem, zarr_drv):
 
     path = tmp_vsimem / "test_ovr_coords.zarr"
-    f64 = gdal.ExtendedDataType.Create(gdal.GDT_Float64)
+    f64 = _float64_dt
 
     # Irregular spacing for Y (quadratic), regular for X.
     src_y = [i**1.5 for i in range(64)]
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            path, options=["FORMAT=ZARR_V3"]
-        )
+        ds = zarr_drv.CreateMultiDimensional(path, options=["FORMAT=ZARR_V3"])
         rg = ds.GetRootGroup()
         dim_y = rg.CreateDimension("Y", "HORIZONTAL_Y", "NORTH", 64)
         dim_x = rg.CreateDimension("X", "HORIZONTAL_X", "EAST", 128)
 
         coord_y = rg.CreateMDArray("Y", [dim_y], f64)
-        coord_y.Write(struct.pack("d" * 64, *src_y))
+        coord_y.Write(struct.pack("64d", *src_y))
         dim_y.SetIndexingVariable(coord_y)
 
         coord_x = rg.CreateMDArray("X", [dim_x], f64)
-        coord_x.Write(struct.pack("d" * 128, *[-120.0 + i * 0.05 for i in range(128)]))
+        coord_x.Write(struct.pack("128d", *[-120.0 + i * 0.05 for i in range(128)]))
         dim_x.SetIndexingVariable(coord_x)
 
         ar = rg.CreateMDArray(
             "data",
             [dim_y, dim_x],
-            gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+            _float32_dt,
         )
-        ar.Write(struct.pack("f" * 64 * 128, *[1.0] * (64 * 128)))
+        ar.Write(struct.pack(f"{64 * 128}f", *[1.0] * (64 * 128)))
         assert ar.BuildOverviews("NEAREST", [2]) == gdal.CE_None
 
     create()
@@ -8890,14 +8223,14 @@ def test_zarr_build_overviews_coord_arrays(tmp_vsimem):
     # Y: irregular -> subsampled: overview[j] = src[j*2 + 1]
     coord_y = ovr_group.OpenMDArray("Y")
     assert coord_y.GetDimensions()[0].GetSize() == 32
-    y_vals = struct.unpack("d" * 32, coord_y.Read())
+    y_vals = struct.unpack("32d", coord_y.Read())
     for j in range(32):
         assert abs(y_vals[j] - src_y[j * 2 + 1]) < 1e-10
 
     # X: regular -> recalculated: start + (j*2 + 0.5) * increment
     coord_x = ovr_group.OpenMDArray("X")
     assert coord_x.GetDimensions()[0].GetSize() == 64
-    x_vals = struct.unpack("d" * 64, coord_x.Read())
+    x_vals = struct.unpack("64d", coord_x.Read())
     assert abs(x_vals[0] - (-120.0 + 0.5 * 0.05)) < 1e-10
     assert abs(x_vals[1] - (-120.0 + 2.5 * 0.05)) < 1e-10
 
@@ -8906,27 +8239,26 @@ def test_zarr_build_overviews_coord_arrays(tmp_vsimem):
 # Test BuildOverviews inherits codec from reopened (not freshly created) array
 
 
-def test_zarr_build_overviews_codec_inheritance_reopen(tmp_vsimem):
+def test_zarr_build_overviews_codec_inheritance_reopen(
+    tmp_vsimem, zarr_drv, zarr_compressors
+):
     """Reopened array: ReconstructCreationOptionsFromCodecs populates
     creation options from the codec chain so overviews inherit compression."""
 
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
 
     path = tmp_vsimem / "test_ovr_codec_reopen.zarr"
 
     # Create compressed + sharded array, then close.
-    ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-        path, options=["FORMAT=ZARR_V3"]
-    )
+    ds = zarr_drv.CreateMultiDimensional(path, options=["FORMAT=ZARR_V3"])
     rg = ds.GetRootGroup()
     dim_y = rg.CreateDimension("Y", None, None, 128)
     dim_x = rg.CreateDimension("X", None, None, 128)
     rg.CreateMDArray(
         "data",
         [dim_y, dim_x],
-        gdal.ExtendedDataType.Create(gdal.GDT_Float32),
+        _float32_dt,
         [
             "COMPRESS=ZSTD",
             "ZSTD_LEVEL=3",
@@ -8943,10 +8275,7 @@ def test_zarr_build_overviews_codec_inheritance_reopen(tmp_vsimem):
     ds = None
 
     # Verify overview has zstd codec.
-    f = gdal.VSIFOpenL(str(path / "ovr_2x" / "data" / "zarr.json"), "rb")
-    assert f is not None
-    meta = json.loads(gdal.VSIFReadL(1, 100000, f))
-    gdal.VSIFCloseL(f)
+    meta = _read_json(path / "ovr_2x" / "data" / "zarr.json")
     codecs = meta.get("codecs", [])
     codec_names = [c.get("name", "") for c in codecs]
 
@@ -8970,32 +8299,30 @@ def test_zarr_build_overviews_codec_inheritance_reopen(tmp_vsimem):
 # emitted for unrelated arrays (reproduces scenario from #13980 review).
 
 
-def test_zarr_build_overviews_mixed_arrays(tmp_vsimem):
+def test_zarr_build_overviews_mixed_arrays(tmp_vsimem, zarr_drv):
 
     path = tmp_vsimem / "test_ovr_mixed.zarr"
-    f64 = gdal.ExtendedDataType.Create(gdal.GDT_Float64)
-    f32 = gdal.ExtendedDataType.Create(gdal.GDT_Float32)
+    f64 = _float64_dt
+    f32 = _float32_dt
 
     def create():
-        ds = gdal.GetDriverByName("ZARR").CreateMultiDimensional(
-            path, options=["FORMAT=ZARR_V3"]
-        )
+        ds = zarr_drv.CreateMultiDimensional(path, options=["FORMAT=ZARR_V3"])
         rg = ds.GetRootGroup()
         dim_y = rg.CreateDimension("Y", "HORIZONTAL_Y", "NORTH", 20)
         dim_x = rg.CreateDimension("X", "HORIZONTAL_X", "EAST", 20)
 
         coord_y = rg.CreateMDArray("Y", [dim_y], f64)
-        coord_y.Write(struct.pack("d" * 20, *range(20)))
+        coord_y.Write(struct.pack("20d", *range(20)))
         dim_y.SetIndexingVariable(coord_y)
 
         coord_x = rg.CreateMDArray("X", [dim_x], f64)
-        coord_x.Write(struct.pack("d" * 20, *range(20)))
+        coord_x.Write(struct.pack("20d", *range(20)))
         dim_x.SetIndexingVariable(coord_x)
 
         # Two 2D data arrays, only build overviews on one.
         for name in ["q", "z"]:
             ar = rg.CreateMDArray(name, [dim_y, dim_x], f32)
-            ar.Write(struct.pack("f" * 400, *[1.0] * 400))
+            ar.Write(struct.pack("400f", *[1.0] * 400))
 
         ar_q = rg.OpenMDArray("q")
         assert ar_q.BuildOverviews("NEAREST", [2]) == gdal.CE_None
@@ -9034,7 +8361,7 @@ def test_zarr_build_overviews_mixed_arrays(tmp_vsimem):
     ],
 )
 def test_zarr_driver_create_copy_v3_multithreaded(
-    tmp_vsimem, src_interleave, blocksize
+    tmp_vsimem, src_interleave, blocksize, zarr_drv
 ):
 
     out_dirname = tmp_vsimem / "test.zarr"
@@ -9045,7 +8372,7 @@ def test_zarr_driver_create_copy_v3_multithreaded(
         creationOptions=[src_interleave],
     )
     with gdal.config_option("GDAL_NUM_THREADS", "ALL_CPUS"):
-        out_ds = gdal.GetDriverByName("Zarr").CreateCopy(
+        out_ds = zarr_drv.CreateCopy(
             out_dirname, src_ds, options=[blocksize, "COMPRESS=GZIP", "FORMAT=ZARR_V3"]
         )
         assert gdal.VSIStatL(out_dirname / "test/c/0/0/0") is not None
@@ -9057,7 +8384,7 @@ def test_zarr_driver_create_copy_v3_multithreaded(
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_driver_create_copy_v3_multithreaded_error(tmp_vsimem):
+def test_zarr_driver_create_copy_v3_multithreaded_error(tmp_vsimem, zarr_drv):
     src_ds = gdal.Open("data/small_world.tif")
     gdal.Mkdir(tmp_vsimem / "test.zarr/test/c/0/0/0", 0o755)
     with gdal.config_option("GDAL_NUM_THREADS", "ALL_CPUS"):
@@ -9065,7 +8392,7 @@ def test_zarr_driver_create_copy_v3_multithreaded_error(tmp_vsimem):
             Exception,
             match=r"ZarrV3Array::IWrite\(\): Cannot create file /vsimem/test_zarr_driver_create_copy_v3_multithreaded_error/test.zarr/test/c/0/0/0",
         ):
-            gdal.GetDriverByName("Zarr").CreateCopy(
+            zarr_drv.CreateCopy(
                 tmp_vsimem / "test.zarr",
                 src_ds,
                 options=["BLOCKSIZE=3,31,33", "COMPRESS=GZIP", "FORMAT=ZARR_V3"],
@@ -9083,10 +8410,9 @@ def test_zarr_driver_create_copy_v3_multithreaded_error(tmp_vsimem):
         ("vlen_utf8_zstd.zarr", ["hello", "world", "!"]),
     ],
 )
-def test_zarr_v3_read_vlen_utf8(dirname, expected_values):
+def test_zarr_v3_read_vlen_utf8(dirname, expected_values, zarr_compressors):
     if "zstd" in dirname:
-        compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-        if "zstd" not in compressors:
+        if "zstd" not in zarr_compressors:
             pytest.skip("compressor zstd not available")
     ds = gdal.Open(
         "data/zarr/v3/" + dirname,
@@ -9106,8 +8432,8 @@ def test_zarr_v3_read_vlen_utf8(dirname, expected_values):
 # Test Zarr v3 vlen-utf8 write + round-trip
 
 
-def test_zarr_v3_write_vlen_utf8(tmp_vsimem):
-    ds = gdal.GetDriverByName("Zarr").CreateMultiDimensional(
+def test_zarr_v3_write_vlen_utf8(tmp_vsimem, zarr_drv):
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
@@ -9127,10 +8453,7 @@ def test_zarr_v3_write_vlen_utf8(tmp_vsimem):
     assert ar.Read() == values
 
     # Verify zarr.json codec chain
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr" / "ar" / "zarr.json", "rb")
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr" / "ar" / "zarr.json")
     assert j["data_type"] == "string"
     assert j["codecs"][0]["name"] == "vlen-utf8"
 
@@ -9139,11 +8462,12 @@ def test_zarr_v3_write_vlen_utf8(tmp_vsimem):
 # Test Zarr v3 vlen-utf8 write with zstd compression
 
 
-def test_zarr_v3_write_vlen_utf8_with_compression(tmp_vsimem):
-    compressors = gdal.GetDriverByName("Zarr").GetMetadataItem("COMPRESSORS")
-    if "zstd" not in compressors:
+def test_zarr_v3_write_vlen_utf8_with_compression(
+    tmp_vsimem, zarr_drv, zarr_compressors
+):
+    if "zstd" not in zarr_compressors:
         pytest.skip("compressor zstd not available")
-    ds = gdal.GetDriverByName("Zarr").CreateMultiDimensional(
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
@@ -9162,10 +8486,7 @@ def test_zarr_v3_write_vlen_utf8_with_compression(tmp_vsimem):
     assert ar.Read() == values
 
     # Verify codec chain: [vlen-utf8, zstd]
-    f = gdal.VSIFOpenL(tmp_vsimem / "test.zarr" / "ar" / "zarr.json", "rb")
-    data = gdal.VSIFReadL(1, 10000, f)
-    gdal.VSIFCloseL(f)
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "test.zarr" / "ar" / "zarr.json")
     assert j["codecs"][0]["name"] == "vlen-utf8"
     assert j["codecs"][1]["name"] == "zstd"
 
@@ -9174,8 +8495,8 @@ def test_zarr_v3_write_vlen_utf8_with_compression(tmp_vsimem):
 # Test Zarr v3 vlen-utf8 round-trip with non-ASCII / Unicode strings
 
 
-def test_zarr_v3_write_vlen_utf8_unicode(tmp_vsimem):
-    ds = gdal.GetDriverByName("Zarr").CreateMultiDimensional(
+def test_zarr_v3_write_vlen_utf8_unicode(tmp_vsimem, zarr_drv):
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
@@ -9198,8 +8519,8 @@ def test_zarr_v3_write_vlen_utf8_unicode(tmp_vsimem):
 # Test Zarr v3 vlen-utf8 truncation warning for long strings
 
 
-def test_zarr_v3_read_vlen_utf8_truncation(tmp_vsimem):
-    ds = gdal.GetDriverByName("Zarr").CreateMultiDimensional(
+def test_zarr_v3_read_vlen_utf8_truncation(tmp_vsimem, zarr_drv):
+    ds = zarr_drv.CreateMultiDimensional(
         tmp_vsimem / "test.zarr", options=["FORMAT=ZARR_V3"]
     )
     rg = ds.GetRootGroup()
@@ -9258,9 +8579,7 @@ def test_zarr_add_georeferencing_convention_spatial_proj(tmp_vsimem):
         creation_option={"FORMAT": "ZARR_V3", "GEOREFERENCING_CONVENTION": "GDAL"},
     )
 
-    with gdal.VSIFile(tmp_vsimem / "out.zarr" / "out" / "zarr.json", "rb") as f:
-        data = f.read()
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "out.zarr" / "out" / "zarr.json")
     assert "_CRS" in j["attributes"]
     assert "zarr_conventions" not in j["attributes"]
 
@@ -9268,9 +8587,7 @@ def test_zarr_add_georeferencing_convention_spatial_proj(tmp_vsimem):
         input=tmp_vsimem / "out.zarr", convention="spatial_proj"
     )
 
-    with gdal.VSIFile(tmp_vsimem / "out.zarr" / "out" / "zarr.json", "rb") as f:
-        data = f.read()
-    j = json.loads(data)
+    j = _read_json(tmp_vsimem / "out.zarr" / "out" / "zarr.json")
     assert "_CRS" in j["attributes"]
     assert "zarr_conventions" in j["attributes"]
     assert j["attributes"]["proj:code"] == "EPSG:26711"
@@ -9301,9 +8618,9 @@ def test_zarr_add_georeferencing_convention_spatial_proj(tmp_vsimem):
     ],
 )
 @gdaltest.enable_exceptions()
-def test_zarr_driver_v3_decode_pcodec(dtype):
+def test_zarr_driver_v3_decode_pcodec(dtype, zarr_drv):
 
-    if gdal.GetDriverByName("Zarr").GetMetadataItem("HAVE_PCODEC") is None:
+    if zarr_drv.GetMetadataItem("HAVE_PCODEC") is None:
         pytest.skip("pcodec support not available")
 
     np = pytest.importorskip("numpy")
@@ -9330,11 +8647,11 @@ def test_zarr_driver_v3_decode_pcodec(dtype):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_default_format_is_zarr_v3(tmp_vsimem):
+def test_zarr_default_format_is_zarr_v3(tmp_vsimem, zarr_drv):
 
     filename = str(tmp_vsimem / "test.zarr")
 
-    with gdal.GetDriverByName("ZARR").CreateMultiDimensional(filename) as _:
+    with zarr_drv.CreateMultiDimensional(filename) as _:
         pass
 
     with gdal.VSIFile(tmp_vsimem / "test.zarr" / "zarr.json", "rb") as f:
@@ -9345,11 +8662,9 @@ def test_zarr_default_format_is_zarr_v3(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_multiband_ok(tmp_vsimem):
+def test_zarr_setnodatavalue_multiband_ok(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     assert ds.GetRasterBand(1).GetNoDataValue() is None
     ds.GetRasterBand(1).SetNoDataValue(255)
     assert ds.GetRasterBand(1).GetNoDataValue() == 255
@@ -9365,11 +8680,9 @@ def test_zarr_setnodatavalue_multiband_ok(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_multiband_ok_nan(tmp_vsimem):
+def test_zarr_setnodatavalue_multiband_ok_nan(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Float32
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Float32)
     ds.GetRasterBand(1).SetNoDataValue(float("nan"))
     ds.GetRasterBand(2).SetNoDataValue(float("nan"))
     ds.Close()
@@ -9383,11 +8696,9 @@ def test_zarr_setnodatavalue_multiband_ok_nan(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_multiband_only_one_set(tmp_vsimem):
+def test_zarr_setnodatavalue_multiband_only_one_set(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetNoDataValue(255)
     with pytest.raises(Exception, match="Not all bands have the same nodata value"):
         ds.Close()
@@ -9397,11 +8708,9 @@ def test_zarr_setnodatavalue_multiband_only_one_set(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_multiband_different_non_nan(tmp_vsimem):
+def test_zarr_setnodatavalue_multiband_different_non_nan(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetNoDataValue(255)
     ds.GetRasterBand(2).SetNoDataValue(0)
     with pytest.raises(Exception, match="Not all bands have the same nodata value"):
@@ -9412,11 +8721,9 @@ def test_zarr_setnodatavalue_multiband_different_non_nan(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_multiband_different_nan(tmp_vsimem):
+def test_zarr_setnodatavalue_multiband_different_nan(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Float32
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Float32)
     ds.GetRasterBand(1).SetNoDataValue(float("nan"))
     ds.GetRasterBand(2).SetNoDataValue(255)
     with pytest.raises(Exception, match="Not all bands have the same nodata value"):
@@ -9427,11 +8734,9 @@ def test_zarr_setnodatavalue_multiband_different_nan(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_int64_multiband_ok(tmp_vsimem):
+def test_zarr_setnodatavalue_int64_multiband_ok(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Int64
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Int64)
     ds.GetRasterBand(1).SetNoDataValueAsInt64((1 << 63) - 1)
     assert ds.GetRasterBand(1).GetNoDataValueAsInt64() == (1 << 63) - 1
     ds.GetRasterBand(2).SetNoDataValueAsInt64((1 << 63) - 1)
@@ -9446,11 +8751,9 @@ def test_zarr_setnodatavalue_int64_multiband_ok(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_int64_multiband_only_one_set(tmp_vsimem):
+def test_zarr_setnodatavalue_int64_multiband_only_one_set(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Int64
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Int64)
     ds.GetRasterBand(1).SetNoDataValueAsInt64(255)
     with pytest.raises(Exception, match="Not all bands have the same nodata value"):
         ds.Close()
@@ -9460,11 +8763,9 @@ def test_zarr_setnodatavalue_int64_multiband_only_one_set(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_int64_multiband_different(tmp_vsimem):
+def test_zarr_setnodatavalue_int64_multiband_different(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Int64
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Int64)
     ds.GetRasterBand(1).SetNoDataValueAsInt64(255)
     ds.GetRasterBand(1).SetNoDataValueAsInt64(0)
     with pytest.raises(Exception, match="Not all bands have the same nodata value"):
@@ -9475,11 +8776,9 @@ def test_zarr_setnodatavalue_int64_multiband_different(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_uint64_multiband_ok(tmp_path):
+def test_zarr_setnodatavalue_uint64_multiband_ok(tmp_path, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_path / "test.zarr", 1, 1, 2, gdal.GDT_UInt64
-    )
+    ds = zarr_drv.Create(tmp_path / "test.zarr", 1, 1, 2, gdal.GDT_UInt64)
     nv = (1 << 63) - 1
     ds.GetRasterBand(1).SetNoDataValueAsUInt64(nv)
     assert ds.GetRasterBand(1).GetNoDataValueAsUInt64() == nv
@@ -9495,11 +8794,9 @@ def test_zarr_setnodatavalue_uint64_multiband_ok(tmp_path):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_uint64_multiband_only_one_set(tmp_vsimem):
+def test_zarr_setnodatavalue_uint64_multiband_only_one_set(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_UInt64
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_UInt64)
     ds.GetRasterBand(1).SetNoDataValueAsUInt64(255)
     with pytest.raises(Exception, match="Not all bands have the same nodata value"):
         ds.Close()
@@ -9509,11 +8806,9 @@ def test_zarr_setnodatavalue_uint64_multiband_only_one_set(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setnodatavalue_uint64_multiband_different(tmp_vsimem):
+def test_zarr_setnodatavalue_uint64_multiband_different(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_UInt64
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_UInt64)
     ds.GetRasterBand(1).SetNoDataValueAsUInt64(255)
     ds.GetRasterBand(1).SetNoDataValueAsUInt64(0)
     with pytest.raises(Exception, match="Not all bands have the same nodata value"):
@@ -9524,11 +8819,9 @@ def test_zarr_setnodatavalue_uint64_multiband_different(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setscale_multiband_ok(tmp_path):
+def test_zarr_setscale_multiband_ok(tmp_path, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_path / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_path / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetScale(0.5)
     assert ds.GetRasterBand(1).GetScale() == 0.5
     ds.GetRasterBand(2).SetScale(0.5)
@@ -9543,11 +8836,9 @@ def test_zarr_setscale_multiband_ok(tmp_path):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setscale_multiband_only_one_set(tmp_vsimem):
+def test_zarr_setscale_multiband_only_one_set(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetScale(0.5)
     with pytest.raises(Exception, match="Not all bands have the same scale value"):
         ds.Close()
@@ -9557,11 +8848,9 @@ def test_zarr_setscale_multiband_only_one_set(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setscale_multiband_different(tmp_vsimem):
+def test_zarr_setscale_multiband_different(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetScale(0.5)
     ds.GetRasterBand(1).SetScale(1)
     with pytest.raises(Exception, match="Not all bands have the same scale value"):
@@ -9572,11 +8861,9 @@ def test_zarr_setscale_multiband_different(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setoffset_multiband_ok(tmp_path):
+def test_zarr_setoffset_multiband_ok(tmp_path, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_path / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_path / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetOffset(0.5)
     assert ds.GetRasterBand(1).GetOffset() == 0.5
     ds.GetRasterBand(2).SetOffset(0.5)
@@ -9591,11 +8878,9 @@ def test_zarr_setoffset_multiband_ok(tmp_path):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setoffset_multiband_only_one_set(tmp_vsimem):
+def test_zarr_setoffset_multiband_only_one_set(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetOffset(0.5)
     with pytest.raises(Exception, match="Not all bands have the same offset value"):
         ds.Close()
@@ -9605,11 +8890,9 @@ def test_zarr_setoffset_multiband_only_one_set(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setoffset_multiband_different(tmp_vsimem):
+def test_zarr_setoffset_multiband_different(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.GetRasterBand(1).SetOffset(0.5)
     ds.GetRasterBand(1).SetOffset(1)
     with pytest.raises(Exception, match="Not all bands have the same offset value"):
@@ -9620,23 +8903,19 @@ def test_zarr_setoffset_multiband_different(tmp_vsimem):
 
 
 @gdaltest.enable_exceptions()
-def test_zarr_setspatialref_multiband(tmp_vsimem):
+def test_zarr_setspatialref_multiband(tmp_vsimem, zarr_drv):
 
-    ds = gdal.GetDriverByName("Zarr").Create(
-        tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte
-    )
+    ds = zarr_drv.Create(tmp_vsimem / "test.zarr", 1, 1, 2, gdal.GDT_Byte)
     ds.SetSpatialRef(osr.SpatialReference(epsg=4326))
     assert ds.GetSpatialRef().GetAuthorityCode() == "4326"
     ds.Close()
 
-    assert set(gdal.ReadDirRecursive(tmp_vsimem)) == set(
-        [
-            "test.zarr/",
-            "test.zarr/test/",
-            "test.zarr/test/zarr.json",
-            "test.zarr/zarr.json",
-        ]
-    )
+    assert set(gdal.ReadDirRecursive(tmp_vsimem)) == {
+        "test.zarr/",
+        "test.zarr/test/",
+        "test.zarr/test/zarr.json",
+        "test.zarr/zarr.json",
+    }
 
     ds = gdal.Open(tmp_vsimem / "test.zarr")
     assert ds.GetSpatialRef().GetAuthorityCode() == "4326"